@@ -0,0 +1,18 @@
+"""
+Module: benchmarks_module
+
+This package holds the benchmark suite of the RacingGame application. Importing
+it makes the game's modules importable and selects SDL's dummy drivers, so that
+every benchmark runs offscreen and without audio.
+
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
@@ -0,0 +1,119 @@
+"""
+Module: benchmark_runner_module
+
+This module runs the benchmark suite, reports the throughput and latency of
+every case and compares them with the stored baseline. It exits with status 1
+when a case is slower than its baseline by more than the threshold.
+
+Usage: python -m benchmarks [--update] [--threshold 0.25] [--only CASE ...]
+
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+
+from benchmarks import ROOT
+from benchmarks.cases import CASES
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+ROUNDS = 7
+
+
+def measure(setup, number: int, rounds=ROUNDS) -> float:
+    """
+    Returns the time of one call of a case, in seconds. The case is warmed up
+    with one round, then timed over several rounds with the garbage collector
+    paused and the fastest round is kept, which is the least disturbed by the
+    rest of the system.
+
+    Args:
+        setup: The setup function of the case.
+        number (int): The number of calls per round.
+        rounds (int): The number of timed rounds.
+
+    Returns:
+        float: The time of one call in seconds.
+    """
+    case = setup()
+    for _ in range(number):
+        case()
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                case()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(timings) / number
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Returns the cases slower than their baseline by more than the threshold.
+
+    Args:
+        results (dict): The time of one call of every case, in seconds.
+        baseline (dict): The stored time of one call of every case, in seconds.
+        threshold (float): The tolerated slowdown, 0.25 for 25%.
+
+    Returns:
+        list: The names of the regressed cases.
+    """
+    return [
+        name
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + threshold)
+    ]
+
+
+def main() -> int:
+    """
+    Runs the benchmarks selected on the command line.
+
+    Returns:
+        int: The exit status, 1 if a case regressed.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--update", action="store_true", help="store a new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES))
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+
+    results = {}
+    for name in args.only or CASES:
+        setup, number = CASES[name]
+        results[name] = measure(setup, number)
+        change = ""
+        if name in baseline:
+            change = f"{(results[name] / baseline[name] - 1) * 100:+7.1f}%"
+        print(
+            f"{name:<20} {1 / results[name]:>12.1f} ops/s "
+            f"{results[name] * 1e6:>12.2f} us/call {change}"
+        )
+
+    if args.update:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as baseline_file:
+            json.dump({**baseline, **results}, baseline_file, indent=2)
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name in regressions:
+        print(f"Regression: {name} is more than {args.threshold:.0%} slower")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
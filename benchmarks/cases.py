@@ -0,0 +1,158 @@
+"""
+Module: benchmark_cases_module
+
+This module defines the benchmarked hot paths of the RacingGame application.
+Each case is a setup function returning the callable timed by the runner.
+
+"""
+
+import functools
+import itertools
+
+from base.world import CarWorld
+from components.animations import Animation
+from components.car import CarCollider, ComputerCar, PlayerCar
+from components.game import RacingGame
+from constants.game import COMPUTER_PATH
+from constants.images import ImageEnum, ImageFactory
+from utils.helper import blit_rotate_center
+
+
+@functools.lru_cache(maxsize=None)
+def get_game() -> RacingGame:
+    """
+    Returns the headless game shared by the cases, creating it on first use.
+    Creating it opens the dummy display the images are converted for.
+
+    Returns:
+        RacingGame: The shared game.
+    """
+    return RacingGame(headless=True)
+
+
+def car_move():
+    """
+    Times AbstractCar.move for a player car at full speed.
+    """
+    get_game()
+    car = PlayerCar(4, 4)
+    car.vel = car.max_vel
+    return car.move
+
+
+def computer_move_path():
+    """
+    Times ComputerCar.move through the whole of COMPUTER_PATH, one lap per call.
+    """
+    get_game()
+    car = ComputerCar(2, 4, COMPUTER_PATH)
+
+    def lap():
+        car.reset()
+        car.vel = car.max_vel
+        while car.current_point < len(COMPUTER_PATH):
+            car.move()
+
+    return lap
+
+
+def collide_border():
+    """
+    Times AbstractCar.collide against the track border mask.
+    """
+    game = get_game()
+    car = PlayerCar(4, 4)
+    return lambda: car.collide(game.border_mask)
+
+
+def border_contact():
+    """
+    Times DistanceField.contact of the car outline against the track border.
+    """
+    game = get_game()
+    car = PlayerCar(4, 4)
+    return lambda: game.border_field.contact(car.outline())
+
+
+def car_collisions():
+    """
+    Times CarCollider.resolve for a pack of 24 cars, restored before each call
+    so that neighbours keep touching.
+    """
+    get_game()
+    world = CarWorld()
+    cars = [ComputerCar(2, 4, COMPUTER_PATH, world) for _ in range(24)]
+    for number, car in enumerate(cars):
+        car.x, car.y, car.angle = 100 + (number % 4) * 20, 100 + (number // 4) * 40, 5
+    collider = CarCollider(cars)
+    previous, state = world.poses(), world.state()
+
+    def resolve():
+        world.restore(state)
+        collider.resolve(previous)
+
+    return resolve
+
+
+def race_update():
+    """
+    Times RaceTracker.update for the cars of the game, as done every tick.
+    """
+    game = get_game()
+    previous = game.world.poses()
+    return lambda: game.race.update(previous, game.ticks)
+
+
+def rotate_blit():
+    """
+    Times blit_rotate_center, turning the car by one degree per call.
+    """
+    game = get_game()
+    image = ImageFactory.get_image(ImageEnum.RED_CAR_IMAGE)
+    angles = itertools.cycle(range(360))
+    return lambda: blit_rotate_center(game.window, image, (300, 300), next(angles))
+
+
+def game_draw():
+    """
+    Times RacingGame.draw offscreen, as in the game loop.
+    """
+    game = get_game()
+    game.game_info.start_level()
+    return game.draw
+
+
+def game_draw_full():
+    """
+    Times RacingGame.draw offscreen when the whole window has to be redrawn.
+    """
+    game = get_game()
+
+    def draw():
+        game.renderer.invalidate()
+        game.draw()
+
+    return draw
+
+
+def animation_load():
+    """
+    Times loading the losing animation from its frame files.
+    """
+    get_game()
+    return lambda: Animation("src/assets/images/losing-frames")
+
+
+# Maps each case to its setup function and the number of calls per round
+CASES = {
+    "car_move": (car_move, 20000),
+    "computer_move_path": (computer_move_path, 5),
+    "collide_border": (collide_border, 20000),
+    "border_contact": (border_contact, 20000),
+    "car_collisions": (car_collisions, 2000),
+    "race_update": (race_update, 20000),
+    "blit_rotate_center": (rotate_blit, 5000),
+    "game_draw": (game_draw, 500),
+    "game_draw_full": (game_draw_full, 100),
+    "animation_load": (animation_load, 1),
+}
@@ -6,15 +6,39 @@ This module defines the AbstractCar class, which serves
 as a base class for representing an abstract car in a 2D game
 environment. The AbstractCar class provides methods for
 rotation, movement, drawing, collision detection, and
-resetting the car's position.
+resetting the car's position. Its state lives in a row of a CarWorld,
+so that many cars can also be stepped at once.
 
 """
 
 import math
 
-import pygame
+import numpy as np
 
+from base.world import CarWorld
+from constants.images import ImageFactory
 from utils.helper import blit_rotate_center
+from utils.rotation import ROTATION_CACHES, RotatedSprite
+
+
+def world_field(name: str) -> property:
+    """
+    Creates a property reading and writing a car's row of a CarWorld array.
+
+    Args:
+        name (str): The name of the CarWorld array.
+
+    Returns:
+        property: The property.
+    """
+
+    def fget(car):
+        return car.columns[name].item(car.index)
+
+    def fset(car, value):
+        car.columns[name][car.index] = value
+
+    return property(fget, fset, doc=f"The car's {name}, stored in its CarWorld.")
 
 
 class AbstractCar:
@@ -23,6 +47,8 @@ class AbstractCar:
 
     Attributes:
         IMG: A class variable representing the image of the car.
+        IMAGE_TYPE: A class variable representing the ImageEnum loaded as the image
+        of the car when the car is created, if set instead of IMG.
         START_POS: A class variable representing the starting position of the car.
         img: An instance variable representing the current image of the car.
         max_vel: An instance variable representing the maximum velocity of the car.
@@ -32,19 +58,62 @@ class AbstractCar:
         x: An instance variable representing the x-coordinate of the car.
         y: An instance variable representing the y-coordinate of the car.
         acceleration: An instance variable representing the acceleration of the car.
+        world: An instance variable representing the CarWorld holding the car's state.
+        index: An instance variable representing the car's row in the world.
+        columns: An instance variable mapping the names of the world's arrays to
+        the arrays, rebound whenever the world reallocates them.
+        progress: An instance variable representing the number of checkpoint gates
+        the car crossed forward minus those crossed backward.
+        wrong_way: An instance variable representing whether the car heads against
+        the direction of the track, as of the last race update.
+        OUTLINE: A class variable representing the corners and side midpoints of
+        the car, in half widths and half heights from its center.
     """
 
     IMG = None
+    IMAGE_TYPE = None
     START_POS = None
+    OUTLINE = np.array(
+        [(-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0)],
+        dtype=float,
+    )
 
-    def __init__(self, max_vel, rotation_vel) -> None:
-        self.img = self.IMG
-        self.max_vel = max_vel
-        self.vel = 0
-        self.rotation_vel = rotation_vel
-        self.angle = 0
-        self.x, self.y = self.START_POS
-        self.acceleration = 0.1
+    x = world_field("x")
+    y = world_field("y")
+    angle = world_field("angle")
+    vel = world_field("vel")
+    max_vel = world_field("max_vel")
+    acceleration = world_field("acceleration")
+    rotation_vel = world_field("rotation_vel")
+    progress = world_field("progress")
+    wrong_way = world_field("wrong_way")
+
+    def __init__(self, max_vel, rotation_vel, world=None) -> None:
+        self.img = self.load_image()
+        self.world = world if world is not None else CarWorld(1)
+        self.index = self.world.add(self.START_POS, max_vel, rotation_vel)
+        self.bind_columns()
+        self.world.on_grow.append(self.bind_columns)
+
+    def bind_columns(self):
+        """
+        Binds the world's arrays to the car, so that its attributes are read and
+        written without looking the arrays up on the world each time.
+        """
+        self.columns = {name: getattr(self.world, name) for name in CarWorld.FIELDS}
+
+    @classmethod
+    def load_image(cls):
+        """
+        Returns the image of the car, loading IMAGE_TYPE through the ImageFactory
+        so that it is converted to the display format once a display exists.
+
+        Returns:
+            pygame.Surface: The image of the car.
+        """
+        if cls.IMAGE_TYPE is None:
+            return cls.IMG
+        return ImageFactory.get_image(cls.IMAGE_TYPE)
 
     def rotate(self, left=False, right=False) -> None:
         """
@@ -58,21 +127,24 @@ class AbstractCar:
             None
         """
         if left:
-            self.angle += self.rotation_vel
+            self.angle += self.rotation_vel * self.world.time_scale
         elif right:
-            self.angle -= self.rotation_vel
+            self.angle -= self.rotation_vel * self.world.time_scale
 
-    def draw(self, win) -> None:
+    def draw(self, win, pose=None):
         """
         Draws the car on the given window with the current image and rotation angle.
 
         Args:
             win: The window on which the car should be drawn.
+            pose: The (x, y, angle) to draw the car at instead of its current state,
+            e.g. when interpolating between simulation ticks.
 
         Returns:
-            None
+            pygame.Rect: The area of the window covered by the car.
         """
-        blit_rotate_center(win, self.img, (self.x, self.y), self.angle)
+        x, y, angle = (self.x, self.y, self.angle) if pose is None else pose
+        return blit_rotate_center(win, self.img, (x, y), angle)
 
     def move_forward(self) -> None:
         """
@@ -81,7 +153,8 @@ class AbstractCar:
         Returns:
             None
         """
-        self.vel = min(self.vel + self.acceleration, self.max_vel)
+        acceleration = self.acceleration * self.world.time_scale
+        self.vel = min(self.vel + acceleration, self.max_vel)
         self.move()
 
     def move_backward(self) -> None:
@@ -91,7 +164,8 @@ class AbstractCar:
         Returns:
             None
         """
-        self.vel = max(self.vel - self.acceleration, -self.max_vel / 2)
+        acceleration = self.acceleration * self.world.time_scale
+        self.vel = max(self.vel - acceleration, -self.max_vel / 2)
         self.move()
 
     def move(self) -> None:
@@ -102,31 +176,97 @@ class AbstractCar:
             None
         """
         radians = math.radians(self.angle)
-        vertical = math.cos(radians) * self.vel
-        horizontal = math.sin(radians) * self.vel
+        distance = self.vel * self.world.time_scale
+        vertical = math.cos(radians) * distance
+        horizontal = math.sin(radians) * distance
 
         self.y -= vertical
         self.x -= horizontal
 
-    def collide(self, mask, x=0, y=0):
+    def sprite(self, angle=None) -> RotatedSprite:
+        """
+        Returns the car's image rotated to its current angle.
+
+        Args:
+            angle (float): The angle to rotate the image to instead, in degrees.
+
+        Returns:
+            RotatedSprite: The rotated image, its top-left offset and its mask.
+        """
+        if angle is None:
+            angle = self.angle
+        return ROTATION_CACHES.get(self.img).get(angle)
+
+    def center(self, pose=None) -> tuple:
+        """
+        Returns the center of the car, around which it rotates.
+
+        Args:
+            pose: The (x, y, angle) to place the car at instead of its current state.
+
+        Returns:
+            tuple: The (x, y) of the center in window coordinates.
+        """
+        x, y = (self.x, self.y) if pose is None else pose[:2]
+        width, height = self.img.get_size()
+        return x + width / 2, y + height / 2
+
+    def outline(self, pose=None) -> np.ndarray:
+        """
+        Returns the corners and side midpoints of the car at its current position
+        and rotation, in window coordinates.
+
+        Args:
+            pose: The (x, y, angle) to place the car at instead of its current state.
+
+        Returns:
+            np.ndarray: An (8, 2) array of (x, y) points.
+        """
+        angle = self.angle if pose is None else pose[2]
+        width, height = self.img.get_size()
+        radians = math.radians(angle)
+        cos, sin = math.cos(radians), math.sin(radians)
+        rotation = np.array(((cos, -sin), (sin, cos)))
+        return self.OUTLINE * (width / 2, height / 2) @ rotation + self.center(pose)
+
+    def collide(self, mask, x=0, y=0, pose=None):
         """
         Checks for collision between the car and a mask at the specified offset.
+        The car's mask follows its current rotation.
 
         Args:
             mask: The mask representing the object with which collision is checked.
             x (int): The x-coordinate offset for the collision check.
             y (int): The y-coordinate offset for the collision check.
+            pose: The (x, y, angle) to place the car at instead of its current state.
 
         Returns:
             A mask representing the overlapping region if a collision occurs, otherwise None.
         """
-        car_mask = pygame.mask.from_surface(self.img)
-        offset = (int(self.x - x), int(self.y - y))
-        return mask.overlap(car_mask, offset)
+        car_x, car_y, angle = (self.x, self.y, self.angle) if pose is None else pose
+        sprite = self.sprite(angle)
+        offset = (
+            int(car_x - x) + sprite.offset[0],
+            int(car_y - y) + sprite.offset[1],
+        )
+        return mask.overlap(sprite.mask, offset)
+
+    def hit(self, normal) -> None:  # pylint: disable=unused-argument
+        """
+        Reacts to a collision with another car, once it has been pushed back.
+        Does nothing by default, the car keeps its speed.
+
+        Args:
+            normal: The (x, y) unit vector pointing away from the other car.
+
+        Returns:
+            None
+        """
 
     def reset(self) -> None:
         """
-        Resets the car's position and angle to the starting position.
+        Resets the car's position and angle to the starting position, and its
+        progress through the checkpoint gates.
 
         Returns:
             None
@@ -134,3 +274,5 @@ class AbstractCar:
         self.x, self.y = self.START_POS
         self.vel = 0
         self.angle = 0
+        self.progress = 0
+        self.wrong_way = 0
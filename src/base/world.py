@@ -0,0 +1,271 @@
+"""
+This module defines the CarWorld class, a struct-of-arrays store of car state.
+Every car is a row of NumPy arrays, so the physics of all cars can be stepped
+with one call per operation instead of one Python call per car. The batched
+methods follow the semantics of the scalar methods of AbstractCar and PlayerCar.
+
+Car velocities, accelerations and rotation velocities are expressed per tick at
+GAME_FPS. The world's time_scale adapts them when the simulation runs at another
+tick rate, so cars cover the same distance per second at any rate.
+
+"""
+
+import numpy as np
+
+
+class CarWorld:
+    """
+    Stores the state of many cars in NumPy arrays, one row per car.
+
+    Attributes:
+        FIELDS: A class variable mapping the per-car arrays to their dtypes.
+        size: An instance variable representing the number of cars in the world.
+        time_scale: An instance variable representing the length of a tick relative
+        to a tick at GAME_FPS.
+        x, y, angle, vel, max_vel, acceleration, rotation_vel, current_point,
+        progress, wrong_way: Instance variables holding the arrays of the
+        corresponding car attributes.
+        on_grow: An instance variable holding the callbacks called after the arrays
+        are reallocated to make room for more cars.
+
+    Methods:
+        add(self, position, max_vel, rotation_vel, acceleration=0.1) -> int:
+            Adds a car to the world and returns its row.
+
+        rotate(self, left=None, right=None, cars=None) -> None:
+            Rotates the selected cars left or right.
+
+        move(self, cars=None) -> None:
+            Updates the positions of the selected cars from their velocity and angle.
+
+        move_forward(self, cars=None) -> None:
+            Accelerates the selected cars forward and moves them.
+
+        move_backward(self, cars=None) -> None:
+            Accelerates the selected cars backward and moves them.
+
+        reduce_speed(self, cars=None) -> None:
+            Slows the selected cars down and moves them.
+
+        apply_controls(self, forward, backward, left, right) -> None:
+            Steps every car as PlayerCar does for the given controls.
+
+        poses(self) -> np.ndarray:
+            Returns a copy of the x, y and angle of every car.
+
+        state(self, out=None) -> np.ndarray:
+            Returns every field of every car, one row per field.
+
+        restore(self, state: np.ndarray) -> None:
+            Sets every field of every car from a state returned by state.
+
+    """
+
+    FIELDS = {
+        "x": float,
+        "y": float,
+        "angle": float,
+        "vel": float,
+        "max_vel": float,
+        "acceleration": float,
+        "rotation_vel": float,
+        "current_point": int,
+        "progress": int,
+        "wrong_way": int,
+    }
+
+    def __init__(self, capacity=8, time_scale=1.0) -> None:
+        self.size = 0
+        self.time_scale = time_scale
+        self.on_grow = []
+        for field, dtype in self.FIELDS.items():
+            setattr(self, field, np.zeros(capacity, dtype))
+
+    def add(self, position, max_vel, rotation_vel, acceleration=0.1) -> int:
+        """
+        Adds a car to the world and returns its row. When the arrays are full they
+        are reallocated with twice the capacity and every on_grow callback is called.
+
+        Args:
+            position (tuple): The (x, y) position of the car.
+            max_vel (float): The maximum velocity of the car.
+            rotation_vel (float): The rotation velocity of the car.
+            acceleration (float): The acceleration of the car.
+
+        Returns:
+            int: The row of the car in the world's arrays.
+        """
+        if self.size == len(self.x):
+            for field in self.FIELDS:
+                array = getattr(self, field)
+                setattr(self, field, np.concatenate([array, np.zeros_like(array)]))
+            for callback in self.on_grow:
+                callback()
+        index = self.size
+        self.size += 1
+        self.x[index], self.y[index] = position
+        self.max_vel[index] = max_vel
+        self.rotation_vel[index] = rotation_vel
+        self.acceleration[index] = acceleration
+        return index
+
+    def select(self, cars=None):
+        """
+        Returns an index selecting the given cars, or every car if cars is None.
+
+        Args:
+            cars: A boolean mask, an array of rows or None.
+
+        Returns:
+            An index usable on the world's arrays.
+        """
+        if cars is None:
+            return np.arange(self.size)
+        return np.flatnonzero(cars) if np.asarray(cars).dtype == bool else cars
+
+    def rotate(self, left=None, right=None, cars=None) -> None:
+        """
+        Rotates the selected cars left or right. As in AbstractCar.rotate, a car
+        turning both ways only turns left.
+
+        Args:
+            left: A boolean mask of the cars turning left.
+            right: A boolean mask of the cars turning right.
+            cars: The cars to consider, every car if None.
+
+        Returns:
+            None
+        """
+        index = self.select(cars)
+        turn = np.zeros(len(index))
+        if right is not None:
+            turn = np.where(np.asarray(right)[index], -1.0, turn)
+        if left is not None:
+            turn = np.where(np.asarray(left)[index], 1.0, turn)
+        turning = index[turn != 0]
+        rotation_vel = self.rotation_vel[turning] * self.time_scale
+        self.angle[turning] += turn[turn != 0] * rotation_vel
+
+    def move(self, cars=None) -> None:
+        """
+        Updates the positions of the selected cars from their velocity and angle.
+
+        Args:
+            cars: The cars to move, every car if None.
+
+        Returns:
+            None
+        """
+        index = self.select(cars)
+        radians = np.radians(self.angle[index])
+        distance = self.vel[index] * self.time_scale
+        self.y[index] -= np.cos(radians) * distance
+        self.x[index] -= np.sin(radians) * distance
+
+    def move_forward(self, cars=None) -> None:
+        """
+        Accelerates the selected cars forward and moves them.
+
+        Args:
+            cars: The cars to move, every car if None.
+
+        Returns:
+            None
+        """
+        index = self.select(cars)
+        vel = self.vel[index] + self.acceleration[index] * self.time_scale
+        self.vel[index] = np.minimum(vel, self.max_vel[index])
+        self.move(index)
+
+    def move_backward(self, cars=None) -> None:
+        """
+        Accelerates the selected cars backward and moves them.
+
+        Args:
+            cars: The cars to move, every car if None.
+
+        Returns:
+            None
+        """
+        index = self.select(cars)
+        vel = self.vel[index] - self.acceleration[index] * self.time_scale
+        self.vel[index] = np.maximum(vel, -self.max_vel[index] / 2)
+        self.move(index)
+
+    def reduce_speed(self, cars=None) -> None:
+        """
+        Slows the selected cars down and moves them.
+
+        Args:
+            cars: The cars to slow down, every car if None.
+
+        Returns:
+            None
+        """
+        index = self.select(cars)
+        vel = self.vel[index] - self.acceleration[index] * self.time_scale / 2
+        self.vel[index] = np.maximum(vel, 0)
+        self.move(index)
+
+    def apply_controls(self, forward, backward, left, right) -> None:
+        """
+        Steps every car as PlayerCar does for the given controls: turn, then move
+        forward and/or backward, or slow down if neither is held.
+
+        Args:
+            forward: A boolean mask of the cars accelerating.
+            backward: A boolean mask of the cars braking or reversing.
+            left: A boolean mask of the cars turning left.
+            right: A boolean mask of the cars turning right.
+
+        Returns:
+            None
+        """
+        forward, backward = np.asarray(forward), np.asarray(backward)
+        self.rotate(left=left)
+        self.rotate(right=right)
+        self.move_forward(forward)
+        self.move_backward(backward)
+        self.reduce_speed(~(forward | backward))
+
+    def poses(self) -> np.ndarray:
+        """
+        Returns a copy of the x, y and angle of every car, one column per car.
+
+        Returns:
+            np.ndarray: A (3, size) array of positions and angles.
+        """
+        return np.stack(
+            [self.x[: self.size], self.y[: self.size], self.angle[: self.size]]
+        )
+
+    def state(self, out=None) -> np.ndarray:
+        """
+        Returns every field of every car as floats, one row per field in the
+        order of FIELDS and one column per car.
+
+        Args:
+            out (np.ndarray): A (len(FIELDS), size) array to fill instead of
+            allocating a new one.
+
+        Returns:
+            np.ndarray: The state of the world.
+        """
+        if out is None:
+            out = np.empty((len(self.FIELDS), self.size))
+        for row, field in enumerate(self.FIELDS):
+            out[row] = getattr(self, field)[: self.size]
+        return out
+
+    def restore(self, state: np.ndarray) -> None:
+        """
+        Sets every field of every car from a state returned by state.
+
+        Args:
+            state (np.ndarray): The state of the world.
+
+        Returns:
+            None
+        """
+        for row, field in enumerate(self.FIELDS):
+            getattr(self, field)[: self.size] = state[row]
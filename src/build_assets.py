@@ -0,0 +1,23 @@
+"""
+Module: build_assets_module
+
+This module fills the on-disk asset cache with the preprocessed version of every
+image and the distance field of the track border, so that the game starts
+without decoding, scaling or computing any of them.
+
+"""
+
+from os import environ
+
+from constants.game import ASSET_CACHE_DIR
+from constants.images import ImageEnum, ImageFactory
+
+# Hide Pygame support prompt
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+if __name__ == "__main__":
+    for image_type in ImageEnum:
+        ImageFactory.get_image(image_type)
+        print(f"Cached {image_type.name} in {ASSET_CACHE_DIR}")
+    ImageFactory.get_distance_field(ImageEnum.TRACK_BORDER_IMAGE)
+    print(f"Cached the distance field of TRACK_BORDER_IMAGE in {ASSET_CACHE_DIR}")
@@ -0,0 +1,87 @@
+"""
+Module: frame_atlas_module
+
+This module defines the FrameAtlas class, which packs the frames of an
+animation, cropped to their non-transparent bounds, into a few large sheets.
+
+"""
+
+from typing import List
+
+import pygame
+
+
+class FrameAtlas:  # pylint: disable=too-few-public-methods
+    """
+    Packs frames into sheets with a shelf packer and blits them back by index.
+
+    Attributes:
+        SHEET_SIZE: A class variable representing the maximum width and height of
+        a sheet.
+        sheets: An instance variable representing the packed sheets.
+        table: An instance variable holding, per frame, the (sheet index, area in
+        the sheet, offset of the area in the original frame).
+
+    Methods:
+        blit(self, win: pygame.Surface, index: int, position) -> pygame.Rect:
+            Draws a frame as if the original full-size frame was blitted at position.
+
+    """
+
+    SHEET_SIZE = 2048
+
+    def __init__(self, frames: List[pygame.Surface], sheet_size=SHEET_SIZE) -> None:
+        self.sheet_size = sheet_size
+        crops = [frame.get_bounding_rect() for frame in frames]
+        placements = self._pack([crop.size for crop in crops])
+        self.sheets = self._create_sheets(placements)
+        self.table = []
+        for frame, crop, (sheet, area) in zip(frames, crops, placements):
+            self.sheets[sheet].blit(frame, area, crop)
+            self.table.append((sheet, area, crop.topleft))
+
+    def _pack(self, sizes):
+        order = sorted(range(len(sizes)), key=lambda index: -sizes[index][1])
+        placements = [None] * len(sizes)
+        sheet = x = y = shelf_height = 0
+        for index in order:
+            width, height = sizes[index]
+            if width > self.sheet_size or height > self.sheet_size:
+                raise ValueError("Frame larger than an atlas sheet")
+            if x + width > self.sheet_size:
+                x, y, shelf_height = 0, y + shelf_height, 0
+            if y + height > self.sheet_size:
+                sheet, x, y, shelf_height = sheet + 1, 0, 0, 0
+            placements[index] = (sheet, pygame.Rect(x, y, width, height))
+            x += width
+            shelf_height = max(shelf_height, height)
+        return placements
+
+    def _create_sheets(self, placements):
+        sizes = {}
+        for sheet, area in placements:
+            width, height = sizes.get(sheet, (1, 1))
+            sizes[sheet] = (max(width, area.right), max(height, area.bottom))
+        sheets = []
+        for _, size in sorted(sizes.items()):
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            sheets.append(surface)
+        return sheets
+
+    def blit(self, win: pygame.Surface, index: int, position) -> pygame.Rect:
+        """
+        Draws a frame as if the original full-size frame was blitted at position.
+
+        Args:
+            win (pygame.Surface): The surface to draw on.
+            index (int): The index of the frame.
+            position: The top-left position of the original frame.
+
+        Returns:
+            pygame.Rect: The area covered by the cropped frame.
+        """
+        sheet, area, (offset_x, offset_y) = self.table[index]
+        destination = (position[0] + offset_x, position[1] + offset_y)
+        return win.blit(self.sheets[sheet], destination, area)
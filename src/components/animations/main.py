@@ -2,42 +2,80 @@
 Module: animation_module
 
 This module defines classes related to handling animations in a game,
-including the Animation class, AnimationType
+including the Animation class, the AnimationPlayer class, AnimationType
 enumeration, and AnimationFactory class.
 
 """
 
 import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from typing import List
 
 import pygame
 
+from components.animations.atlas import FrameAtlas
+from components.animations.stream import CompressedFrames
+from constants.game import ANIMATION_MEMORY_BUDGET, ANIMATION_STORAGE
+
+FRAME_DELAY_PATTERN = re.compile(r"delay-(\d+(?:\.\d+)?)s")
+
 
 class Animation:
     """
     Represents an animation with a collection of frames loaded from a specified directory.
 
     Attributes:
-        FRAME_RATE: A class variable representing the frame rate of the animation.
-        frames: An instance variable representing the collection of frames.
+        FRAME_RATE: A class variable representing the frame rate of the frames
+        without a delay in their name.
+        SURFACES: A storage mode keeping every frame as its own surface.
+        ATLAS: A storage mode packing the cropped frames into a FrameAtlas.
+        COMPRESSED: A storage mode keeping the encoded frames in CompressedFrames.
+        frames: An instance variable representing the collection of frames, None
+        unless the frames are stored as separate surfaces.
+        atlas: An instance variable representing the FrameAtlas of the frames, None
+        unless the frames are stored in an atlas.
+        compressed: An instance variable representing the CompressedFrames of the
+        animation, None unless the frames are stored compressed.
+        delays: An instance variable representing how long each frame is shown, in
+        seconds, as encoded in the frame filenames ("frame_00_delay-0.04s.gif").
 
     Methods:
-        __init__(self, src: str):
+        __init__(self, src: str, storage: str = SURFACES):
             Initializes an Animation object with frames loaded from the specified directory.
 
         load_images(self, src: str) -> List[str]:
             Loads images from the specified directory and returns a list of image filenames.
 
-        draw(self, win: pygame.Surface, clock: pygame.time.Clock) -> None:
-            Draws the animation frames on the given window with the specified frame rate.
+        load_delays(self, src: str) -> List[float]:
+            Returns the delay of each frame, parsed from the frame filenames.
+
+        frame_count(self) -> int:
+            Returns the number of frames.
+
+        blit_frame(self, win: pygame.Surface, index: int, position) -> pygame.Rect:
+            Draws a frame at the given position, whatever the storage mode.
 
     """
 
     FRAME_RATE = 25
-
-    def __init__(self, src: str) -> None:
-        self.frames = self.load_images(src)
+    SURFACES = "surfaces"
+    ATLAS = "atlas"
+    COMPRESSED = "compressed"
+
+    def __init__(self, src: str, storage: str = SURFACES) -> None:
+        if storage not in (self.SURFACES, self.ATLAS, self.COMPRESSED):
+            raise ValueError("Unknown animation storage")
+        self.frames = self.atlas = self.compressed = None
+        if storage == self.COMPRESSED:
+            paths = [os.path.join(src, name) for name in sorted(os.listdir(src))]
+            self.compressed = CompressedFrames(paths, ANIMATION_MEMORY_BUDGET)
+        elif storage == self.ATLAS:
+            self.atlas = FrameAtlas(self.load_images(src))
+        else:
+            self.frames = self.load_images(src)
+        self.delays = self.load_delays(src)
 
     def load_images(self, src: str) -> List[str]:
         """
@@ -57,29 +95,114 @@ class Animation:
             gif_frames.append(lose_frame)
         return gif_frames
 
-    def draw(self, win: pygame.Surface, clock: pygame.time.Clock) -> None:
+    def load_delays(self, src: str) -> List[float]:
+        """
+        Returns the delay of each frame, parsed from the frame filenames. Frames
+        without a delay in their name last one frame at FRAME_RATE.
+
+        Args:
+            src (str): The directory containing the animation frames.
+
+        Returns:
+            List[float]: The delay of each frame in seconds.
+        """
+        delays = []
+        for filename in sorted(os.listdir(src)):
+            match = FRAME_DELAY_PATTERN.search(filename)
+            delays.append(float(match.group(1)) if match else 1 / self.FRAME_RATE)
+        return delays
+
+    def frame_count(self) -> int:
+        """
+        Returns the number of frames.
+
+        Returns:
+            int: The number of frames.
+        """
+        return len(self.delays)
+
+    def blit_frame(self, win: pygame.Surface, index: int, position) -> pygame.Rect:
+        """
+        Draws a frame at the given position, whatever the storage mode.
+
+        Args:
+            win (pygame.Surface): The surface to draw on.
+            index (int): The index of the frame.
+            position: The top-left position of the frame.
+
+        Returns:
+            pygame.Rect: The area covered by the frame.
+        """
+        if self.atlas is not None:
+            return self.atlas.blit(win, index, position)
+        if self.compressed is not None:
+            return self.compressed.blit(win, index, position)
+        return win.blit(self.frames[index], position)
+
+
+class AnimationPlayer:
+    """
+    Plays an animation once, one frame at a time, from inside the game loop.
+
+    Attributes:
+        POSITION: A class variable representing where the frames are drawn.
+
+    Methods:
+        update(self, dt: float) -> None:
+            Advances the animation by dt seconds.
+
+        finished(self) -> bool:
+            Returns whether every frame has been shown for its full delay.
+
+        draw(self, win: pygame.Surface) -> pygame.Rect:
+            Draws the current frame.
+
+    """
+
+    POSITION = (30, 225)
+
+    def __init__(self, animation: Animation) -> None:
+        self.animation = animation
+        self.frame_index = 0
+        self.elapsed = 0.0
+
+    def update(self, dt: float) -> None:
         """
-        Draws the animation frames on the given window with the specified frame rate.
+        Advances the animation by dt seconds, following the delay of each frame.
 
         Args:
-            win (pygame.Surface): The window surface on which the animation should be drawn.
-            clock (pygame.time.Clock): The pygame Clock object to control the frame rate.
+            dt (float): The time elapsed since the previous update, in seconds.
 
         Returns:
             None
         """
-        frame_index = 0
-        counter = 0
-        while frame_index <= len(self.frames) and counter == 0:
-            if frame_index == len(self.frames) - 1:
-                counter += 1
-            # Blit the current frame onto the screen
-            win.blit(self.frames[frame_index], (30, 225))
+        self.elapsed += dt
+        delays = self.animation.delays
+        while not self.finished() and self.elapsed >= delays[self.frame_index]:
+            self.elapsed -= delays[self.frame_index]
+            self.frame_index += 1
+
+    def finished(self) -> bool:
+        """
+        Returns whether every frame has been shown for its full delay.
+
+        Returns:
+            bool: True once the animation has played through.
+        """
+        return self.frame_index >= self.animation.frame_count()
+
+    def draw(self, win: pygame.Surface) -> pygame.Rect:
+        """
+        Draws the current frame, or the last one once the animation has finished.
 
-            # Update the frame index for the next frame
-            frame_index = (frame_index + 1) % len(self.frames)
-            pygame.display.flip()
-            clock.tick(self.FRAME_RATE)
+        Args:
+            win (pygame.Surface): The window surface on which the frame is drawn.
+
+        Returns:
+            pygame.Rect: The area covered by the frame.
+        """
+        index = min(self.frame_index, self.animation.frame_count() - 1)
+        return self.animation.blit_frame(win, index, self.POSITION)
 
 
 class AnimationType(Enum):
@@ -95,22 +218,63 @@ class AnimationType(Enum):
     LOSE = 2
 
 
-# pylint: disable=too-few-public-methods
 class AnimationFactory:
     """
     Factory class for creating instances of the Animation class
-    based on the specified AnimationType.
+    based on the specified AnimationType. Animations are loaded once and cached,
+    either on first use or in the background after preload is called.
+
+    Attributes:
+        SOURCES: A class variable mapping each AnimationType to its frame directory.
+        STORAGE: A class variable representing how the frames of the animations
+        are stored in memory.
 
     Methods:
+        preload(animation_types=tuple(AnimationType), executor=None) -> None:
+        Starts loading the given animations on a background thread.
+
         get_animation(type: AnimationType) -> Animation:
         Returns an instance of the Animation class based on the specified AnimationType.
 
     """
 
-    @staticmethod
-    def get_animation(animation_type: AnimationType) -> Animation:
+    SOURCES = {
+        AnimationType.WINNING: "src/assets/images/winning-frames",
+        AnimationType.LOSE: "src/assets/images/losing-frames",
+    }
+    STORAGE = ANIMATION_STORAGE
+    _animations = {}
+    _executor = None
+
+    @classmethod
+    def preload(cls, animation_types=tuple(AnimationType), executor=None) -> None:
+        """
+        Starts loading the given animations on a background thread. The display
+        must exist, since frames are converted to its pixel format.
+
+        Args:
+            animation_types: The types of animation to load.
+            executor: The executor to load them on, a private single thread if None.
+
+        Returns:
+            None
+        """
+        if executor is None:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1)
+            executor = cls._executor
+        for animation_type in animation_types:
+            if animation_type not in cls._animations:
+                source = cls.SOURCES[animation_type]
+                cls._animations[animation_type] = executor.submit(
+                    Animation, source, cls.STORAGE
+                )
+
+    @classmethod
+    def get_animation(cls, animation_type: AnimationType) -> Animation:
         """
         Returns an instance of the Animation class based on the specified AnimationType.
+        If the animation is being preloaded, waits for it to finish loading.
 
         Args:
             animation_type (AnimationType): The type of animation to create.
@@ -121,8 +285,12 @@ class AnimationFactory:
         Raises:
             Exception: If the specified AnimationType is unknown.
         """
-        if animation_type == AnimationType.WINNING:
-            return Animation("src/assets/images/winning-frames")
-        if animation_type == AnimationType.LOSE:
-            return Animation("src/assets/images/losing-frames")
-        raise ValueError("Unknown Animation Type")
+        if animation_type not in cls.SOURCES:
+            raise ValueError("Unknown Animation Type")
+        animation = cls._animations.get(animation_type)
+        if animation is None:
+            animation = Animation(cls.SOURCES[animation_type], cls.STORAGE)
+        elif isinstance(animation, Future):
+            animation = animation.result()
+        cls._animations[animation_type] = animation
+        return animation
@@ -0,0 +1,120 @@
+"""
+Module: compressed_frames_module
+
+This module defines the CompressedFrames class, which keeps the frames of an
+animation as their encoded file bytes and decodes only a small window of frames
+ahead of playback, on a background thread, within a memory budget.
+
+"""
+
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pygame
+
+
+class CompressedFrames:
+    """
+    Stores encoded frames and decodes a sliding window of them ahead of playback.
+
+    Attributes:
+        WINDOW: A class variable representing the maximum number of decoded frames.
+        encoded: An instance variable holding the encoded bytes of each frame.
+        window: An instance variable representing how many frames are kept decoded,
+        limited by the memory budget.
+
+    Methods:
+        decoded_count(self) -> int:
+            Returns the number of frames currently decoded.
+
+        blit(self, win: pygame.Surface, index: int, position) -> pygame.Rect:
+            Draws a frame and starts decoding the frames that follow it.
+
+    """
+
+    WINDOW = 16
+    _executor = None
+
+    def __init__(self, paths: List[str], memory_budget: int) -> None:
+        self.names = [os.path.basename(path) for path in paths]
+        self.encoded = []
+        for path in paths:
+            with open(path, "rb") as frame:
+                self.encoded.append(frame.read())
+        self._decoded = {0: self._decode(0)}
+        self._lock = threading.Lock()
+        self._pending = None
+        self._playhead = 0
+        first = self._decoded[0]
+        frame_bytes = first.get_width() * first.get_height() * first.get_bytesize()
+        self.window = max(1, min(self.WINDOW, memory_budget // frame_bytes))
+
+    def __len__(self) -> int:
+        return len(self.encoded)
+
+    def _decode(self, index: int) -> pygame.Surface:
+        data = io.BytesIO(self.encoded[index])
+        frame = pygame.image.load(data, self.names[index])
+        if pygame.display.get_surface() is not None:
+            frame = frame.convert_alpha()
+        return frame
+
+    def _in_window(self, index: int) -> bool:
+        return self._playhead <= index < self._playhead + self.window
+
+    def _prefetch(self, indices) -> None:
+        for index in indices:
+            with self._lock:
+                if index in self._decoded or not self._in_window(index):
+                    continue
+            frame = self._decode(index)
+            with self._lock:
+                if self._in_window(index):
+                    self._decoded[index] = frame
+
+    def decoded_count(self) -> int:
+        """
+        Returns the number of frames currently decoded.
+
+        Returns:
+            int: The number of decoded frames.
+        """
+        with self._lock:
+            return len(self._decoded)
+
+    def blit(self, win: pygame.Surface, index: int, position) -> pygame.Rect:
+        """
+        Draws a frame and starts decoding the frames that follow it. Frames
+        outside the window starting at index are dropped. A frame that is not
+        decoded yet is decoded on the spot.
+
+        Args:
+            win (pygame.Surface): The surface to draw on.
+            index (int): The index of the frame.
+            position: The top-left position of the frame.
+
+        Returns:
+            pygame.Rect: The area covered by the frame.
+        """
+        window = range(index, min(index + self.window, len(self)))
+        with self._lock:
+            self._playhead = index
+            for stale in [key for key in self._decoded if key not in window]:
+                del self._decoded[stale]
+            frame = self._decoded.get(index)
+        if frame is None:
+            frame = self._decode(index)
+            with self._lock:
+                self._decoded[index] = frame
+        if self._pending is None or self._pending.done():
+            self._pending = self._get_executor().submit(self._prefetch, window)
+        return win.blit(frame, position)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1)
+        return cls._executor
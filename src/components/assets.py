@@ -0,0 +1,173 @@
+"""
+Module: asset_manager_module
+
+This module defines the AssetManager class, which loads images, sounds and
+animations on a pool of worker threads, tracks which of them the game needs
+before it can start and records how long each asset took to load.
+
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable
+
+from components.animations import AnimationFactory, AnimationType
+from constants.images import ImageEnum, ImageFactory
+from constants.sounds import SoundEnum, SoundFactory
+
+
+class AssetManager:
+    """
+    Loads assets on a pool of worker threads.
+
+    Attributes:
+        timings: An instance variable mapping each loaded asset to its load time
+        in seconds.
+
+    Methods:
+        submit(self, fn, *args, key=None, required=False) -> Future:
+            Runs fn(*args) on a worker thread and records its load time.
+
+        load_images(self, image_types, required=True) -> None:
+            Loads and converts the given images through the ImageFactory.
+
+        load_sounds(self, sound_types, required=True) -> None:
+            Loads the given sounds through the SoundFactory.
+
+        load_animations(self, animation_types) -> None:
+            Preloads the given animations through the AnimationFactory.
+
+        progress(self) -> float:
+            Returns the fraction of the required assets that are loaded.
+
+        ready(self) -> bool:
+            Returns whether every required asset is loaded.
+
+        get(self, key):
+            Returns a loaded asset, waiting for it if needed.
+
+        report(self) -> str:
+            Returns the load time of every asset, slowest first.
+
+    """
+
+    def __init__(self, max_workers=4) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.futures: Dict[object, Future] = {}
+        self.required = []
+        self.timings = {}
+
+    def submit(self, fn, *args, key=None, required=False) -> Future:
+        """
+        Runs fn(*args) on a worker thread and records its load time. The object is
+        also usable as the executor of AnimationFactory.preload.
+
+        Args:
+            fn: The loading function.
+            *args: The arguments of the loading function.
+            key: The key of the asset, the first argument if None.
+            required (bool): Whether the game needs the asset to start.
+
+        Returns:
+            Future: The future of the loaded asset.
+        """
+        key = args[0] if key is None else key
+        future = self.executor.submit(self._timed, key, fn, *args)
+        self.futures[key] = future
+        if required:
+            self.required.append(future)
+        return future
+
+    def _timed(self, key, fn, *args):
+        start = time.perf_counter()
+        asset = fn(*args)
+        self.timings[key] = time.perf_counter() - start
+        return asset
+
+    def load_images(self, image_types: Iterable[ImageEnum], required=True) -> None:
+        """
+        Loads and converts the given images through the ImageFactory.
+
+        Args:
+            image_types: The images to load.
+            required (bool): Whether the game needs them to start.
+
+        Returns:
+            None
+        """
+        for image_type in image_types:
+            self.submit(ImageFactory.get_image, image_type, required=required)
+
+    def load_sounds(self, sound_types: Iterable[SoundEnum], required=True) -> None:
+        """
+        Loads the given sounds through the SoundFactory.
+
+        Args:
+            sound_types: The sounds to load.
+            required (bool): Whether the game needs them to start.
+
+        Returns:
+            None
+        """
+        for sound_type in sound_types:
+            self.submit(SoundFactory.get_sound, sound_type, required=required)
+
+    def load_animations(self, animation_types: Iterable[AnimationType]) -> None:
+        """
+        Preloads the given animations through the AnimationFactory. Animations are
+        only needed once a race ends, so they are never required.
+
+        Args:
+            animation_types: The animations to load.
+
+        Returns:
+            None
+        """
+        AnimationFactory.preload(animation_types, executor=self)
+
+    def progress(self) -> float:
+        """
+        Returns the fraction of the required assets that are loaded.
+
+        Returns:
+            float: A value from 0 to 1.
+        """
+        if not self.required:
+            return 1.0
+        return sum(future.done() for future in self.required) / len(self.required)
+
+    def ready(self) -> bool:
+        """
+        Returns whether every required asset is loaded. Raises the error of a
+        required asset that failed to load.
+
+        Returns:
+            bool: True once the game can start.
+        """
+        done = all(future.done() for future in self.required)
+        if done:
+            for future in self.required:
+                future.result()
+        return done
+
+    def get(self, key):
+        """
+        Returns a loaded asset, waiting for it if needed.
+
+        Args:
+            key: The key the asset was submitted with.
+
+        Returns:
+            The loaded asset.
+        """
+        return self.futures[key].result()
+
+    def report(self) -> str:
+        """
+        Returns the load time of every asset, slowest first.
+
+        Returns:
+            str: One "<asset>: <milliseconds> ms" line per asset.
+        """
+        timings = sorted(self.timings.items(), key=lambda item: -item[1])
+        return "\n".join(f"{key}: {seconds * 1000:.1f} ms" for key, seconds in timings)
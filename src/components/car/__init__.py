@@ -2,9 +2,13 @@
 Module: car_module
 
 This module is a collection of car classes, including ComputerCar and PlayerCar,
-representing computer-controlled and player-controlled cars, respectively.
+representing computer-controlled and player-controlled cars, respectively,
+the WaypointController moving many computer cars at once and the CarCollider
+handling collisions between cars.
 
 """
 
+from .collision import CarCollider
 from .computer import ComputerCar
+from .controller import WaypointController
 from .player import PlayerCar
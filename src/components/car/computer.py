@@ -11,8 +11,8 @@ import math
 
 import pygame
 
-from base.car import AbstractCar
-from constants.images import ImageEnum, ImageFactory
+from base.car import AbstractCar, world_field
+from constants.images import ImageEnum
 
 
 class ComputerCar(AbstractCar):
@@ -20,14 +20,16 @@ class ComputerCar(AbstractCar):
     Represents a computer-controlled car with the ability to follow a predefined path.
 
     Attributes:
-        IMG: A class variable representing the image of the computer-controlled car.
+        IMAGE_TYPE: A class variable representing the image type of the computer-controlled car.
         START_POS: A class variable representing the starting position of the
         computer-controlled car.
+        base_vel: An instance variable representing the maximum velocity of the car
+        at the first level.
 
     Methods:
-        __init__(self, max_vel, rotation_vel, path=[]):
+        __init__(self, max_vel, rotation_vel, path=[], world=None):
             Initializes a ComputerCar object with the specified maximum velocity,
-            rotation velocity, and path.
+            rotation velocity, path and CarWorld.
 
         draw_points(self, win: pygame.Surface) -> None:
             Draws points on the given window representing the path.
@@ -42,6 +44,9 @@ class ComputerCar(AbstractCar):
         move(self) -> None:
             Updates the car's position by following the predefined path.
 
+        hit(self, normal) -> None:
+            Slows the car down and pushes it off another car.
+
         next_level(self, level: int) -> None:
             Resets the car's position and updates its velocity for the next level.
 
@@ -50,25 +55,29 @@ class ComputerCar(AbstractCar):
 
     """
 
-    IMG = ImageFactory.get_image(ImageEnum.GREEN_CAR_IMAGE)
+    IMAGE_TYPE = ImageEnum.GREEN_CAR_IMAGE
     START_POS = (660, 300)
 
-    def __init__(self, max_vel, rotation_vel, path=[]):
+    current_point = world_field("current_point")
+
+    def __init__(self, max_vel, rotation_vel, path=[], world=None):
         """
         Initializes a ComputerCar object with the specified maximum velocity,
-        rotation velocity, and path.
+        rotation velocity, path and CarWorld.
 
         Args:
             max_vel: The maximum velocity of the computer-controlled car.
             rotation_vel: The rotation velocity of the computer-controlled car.
             path (list): A list of tuples representing the path points for the
             computer-controlled car to follow.
+            world (CarWorld): The world storing the car's state, a private one if None.
 
         Returns:
             None
         """
-        super().__init__(max_vel, rotation_vel)
+        super().__init__(max_vel, rotation_vel, world)
         self.path = path
+        self.base_vel = max_vel
         self.current_point = 0
         self.vel = max_vel
 
@@ -109,10 +118,11 @@ class ComputerCar(AbstractCar):
         if difference_in_angle >= 180:
             difference_in_angle -= 360
 
+        rotation_vel = self.rotation_vel * self.world.time_scale
         if difference_in_angle > 0:
-            self.angle -= min(self.rotation_vel, abs(difference_in_angle))
+            self.angle -= min(rotation_vel, abs(difference_in_angle))
         else:
-            self.angle += min(self.rotation_vel, abs(difference_in_angle))
+            self.angle += min(rotation_vel, abs(difference_in_angle))
 
     def update_path_point(self) -> None:
         """
@@ -128,7 +138,8 @@ class ComputerCar(AbstractCar):
 
     def move(self) -> None:
         """
-        Updates the car's position by following the predefined path.
+        Updates the car's position by following the predefined path, speeding
+        back up to its maximum velocity after a hit.
 
         Returns:
             None
@@ -137,11 +148,39 @@ class ComputerCar(AbstractCar):
             return
         self.calculate_angle()
         self.update_path_point()
+        acceleration = self.acceleration * self.world.time_scale
+        self.vel = min(self.vel + acceleration, self.max_vel)
         super().move()
 
+    def hit(self, normal) -> None:
+        """
+        Slows the computer-controlled car down and pushes it off another car by
+        the distance it would have driven, so that a car blocking its path makes
+        it slide around instead of holding it in place. A car hit within two car
+        lengths of its current path point gives the point up for the next one,
+        since the other car may stand on it.
+
+        Args:
+            normal: The (x, y) unit vector pointing away from the other car.
+
+        Returns:
+            None
+        """
+        vel, point = self.vel, self.current_point
+        self.x += normal[0] * vel
+        self.y += normal[1] * vel
+        self.vel = vel / 2
+        if point < len(self.path):
+            target_x, target_y = self.path[point]
+            center_x, center_y = self.center()
+            reach = 2 * math.hypot(*self.img.get_size())
+            if math.hypot(target_x - center_x, target_y - center_y) < reach:
+                self.current_point = point + 1
+
     def next_level(self, level: int) -> None:
         """
-        Resets the car's position and updates its velocity for the next level.
+        Resets the car's position and raises its maximum velocity for the next
+        level, starting it at that velocity.
 
         Args:
             level: The current level of the game.
@@ -150,15 +189,18 @@ class ComputerCar(AbstractCar):
             None
         """
         self.reset()
-        self.vel = self.max_vel + (level - 1) * 0.2
+        self.max_vel = self.base_vel + (level - 1) * 0.2
+        self.vel = self.max_vel
         self.current_point = 0
 
     def reset(self) -> None:
         """
-        Resets the car's position and path to the starting configuration.
+        Resets the car's position, path and maximum velocity to the starting
+        configuration.
 
         Returns:
             None
         """
         self.current_point = 0
+        self.max_vel = self.base_vel
         super().reset()
@@ -0,0 +1,106 @@
+"""
+Module: waypoint_controller_module
+
+This module defines the WaypointController class, which steps many
+ComputerCar instances along their shared path at once, computing headings and
+waypoint advancement with NumPy over the rows of their CarWorld.
+
+"""
+
+import math
+from typing import List
+
+import numpy as np
+
+from .computer import ComputerCar
+
+
+class WaypointController:
+    """
+    Moves a group of computer cars sharing a CarWorld and a path, producing the
+    same trajectories as calling ComputerCar.move on each car.
+
+    Methods:
+        __init__(self, cars: List[ComputerCar]):
+            Initializes a WaypointController for the given cars.
+
+        calculate_angles(self, index: np.ndarray) -> None:
+            Turns the given cars towards their current path point.
+
+        update_path_points(self, index: np.ndarray, sizes: np.ndarray) -> None:
+            Advances the cars that have reached their current path point.
+
+        move(self) -> None:
+            Steps every car that has not finished the path.
+
+    """
+
+    def __init__(self, cars: List[ComputerCar]) -> None:
+        self.world = cars[0].world
+        if any(car.world is not self.world for car in cars):
+            raise ValueError("Cars must share a CarWorld")
+        self.index = np.array([car.index for car in cars], dtype=int)
+        self.path = np.array(cars[0].path, dtype=float).reshape(-1, 2)
+        self.sizes = np.array([car.img.get_size() for car in cars], dtype=int)
+
+    def calculate_angles(self, index: np.ndarray) -> None:
+        """
+        Turns the given cars towards their current path point, by at most their
+        rotation velocity, as ComputerCar.calculate_angle does.
+
+        Args:
+            index (np.ndarray): The world rows of the cars to turn.
+
+        Returns:
+            None
+        """
+        world = self.world
+        target = self.path[world.current_point[index]]
+        x_diff = target[:, 0] - world.x[index]
+        y_diff = target[:, 1] - world.y[index]
+        ratio = np.divide(x_diff, y_diff, out=np.zeros_like(x_diff), where=y_diff != 0)
+        desired = np.where(y_diff == 0, math.pi / 2, np.arctan(ratio))
+        desired = np.where(target[:, 1] > world.y[index], desired + math.pi, desired)
+
+        difference = world.angle[index] - np.degrees(desired)
+        difference = np.where(difference >= 180, difference - 360, difference)
+        rotation_vel = world.rotation_vel[index] * world.time_scale
+        step = np.minimum(rotation_vel, np.abs(difference))
+        world.angle[index] += np.where(difference > 0, -step, step)
+
+    def update_path_points(self, index: np.ndarray, sizes: np.ndarray) -> None:
+        """
+        Advances the cars whose rectangle contains their current path point, using
+        the same integer rectangle as ComputerCar.update_path_point.
+
+        Args:
+            index (np.ndarray): The world rows of the cars to update.
+            sizes (np.ndarray): The (width, height) of the image of each car.
+
+        Returns:
+            None
+        """
+        world = self.world
+        target = self.path[world.current_point[index]]
+        left, top = np.trunc(world.x[index]), np.trunc(world.y[index])
+        inside = (
+            (left <= target[:, 0])
+            & (target[:, 0] < left + sizes[:, 0])
+            & (top <= target[:, 1])
+            & (target[:, 1] < top + sizes[:, 1])
+        )
+        world.current_point[index[inside]] += 1
+
+    def move(self) -> None:
+        """
+        Steps every car that has not finished the path: turn, advance the path
+        point, then speed back up to the maximum velocity and move.
+
+        Returns:
+            None
+        """
+        active = self.world.current_point[self.index] < len(self.path)
+        index = self.index[active]
+        self.calculate_angles(index)
+        self.update_path_points(index, self.sizes[active])
+        self.world.move_forward(index)
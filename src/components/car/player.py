@@ -6,8 +6,10 @@ representing a player-controlled car
 with additional functionality for reducing speed and bouncing.
 """
 
+import math
+
 from base.car import AbstractCar
-from constants.images import ImageEnum, ImageFactory
+from constants.images import ImageEnum
 
 
 class PlayerCar(AbstractCar):
@@ -15,23 +17,26 @@ class PlayerCar(AbstractCar):
     Represents a player-controlled car with the ability to reduce speed and bounce.
 
     Attributes:
-        IMG: A class variable representing the image of the player-controlled car.
+        IMAGE_TYPE: A class variable representing the image type of the player-controlled car.
         START_POS: A class variable representing the starting position of the player-controlled car.
 
     Methods:
         reduce_speed(self) -> None:
             Reduces the speed of the player-controlled car and updates its position.
 
-        bounce(self) -> None:
-            Causes the player-controlled car to bounce by reversing its velocity.
+        bounce(self, normal=None, depth=0.0) -> None:
+            Causes the player-controlled car to bounce off a wall.
+
+        hit(self, normal) -> None:
+            Bounces the player-controlled car off another car.
 
     """
 
-    IMG = ImageFactory.get_image(ImageEnum.RED_CAR_IMAGE)
+    IMAGE_TYPE = ImageEnum.RED_CAR_IMAGE
     START_POS = (630, 300)
 
-    def __init__(self, vel, position):
-        super().__init__(vel, position)
+    def __init__(self, vel, position, world=None):
+        super().__init__(vel, position, world)
         self.vel = 0
 
     def reduce_speed(self) -> None:
@@ -41,15 +46,44 @@ class PlayerCar(AbstractCar):
         Returns:
             None
         """
-        self.vel = max(self.vel - self.acceleration / 2, 0)
+        acceleration = self.acceleration * self.world.time_scale
+        self.vel = max(self.vel - acceleration / 2, 0)
         self.move()
 
-    def bounce(self) -> None:
+    def bounce(self, normal=None, depth=0.0) -> None:
         """
-        Causes the player-controlled car to bounce by reversing its velocity.
+        Causes the player-controlled car to bounce off a wall. Without a normal,
+        the velocity is reversed. With the normal of the wall, the velocity is
+        reflected off it and projected back onto the heading of the car, so that
+        a head-on hit reverses the car and a glancing one keeps it going forward,
+        and the car is first pushed out of the wall by depth. Either way the
+        resulting velocity is halved.
+
+        Args:
+            normal: The (x, y) unit vector pointing away from the wall, or None.
+            depth (float): How far the car is inside the wall, in pixels.
 
         Returns:
             None
         """
-        self.vel = -(self.vel / 2)
+        if normal is None:
+            self.vel = -(self.vel / 2)
+        else:
+            radians = math.radians(self.angle)
+            along = -math.sin(radians) * normal[0] - math.cos(radians) * normal[1]
+            self.vel = self.vel * (1 - 2 * along**2) / 2
+            self.x += normal[0] * depth
+            self.y += normal[1] * depth
         self.move()
+
+    def hit(self, normal) -> None:
+        """
+        Bounces the player-controlled car off another car.
+
+        Args:
+            normal: The (x, y) unit vector pointing away from the other car.
+
+        Returns:
+            None
+        """
+        self.bounce(normal)
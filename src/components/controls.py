@@ -0,0 +1,117 @@
+"""
+Module: controls_module
+
+This module defines the Controls flags describing the inputs of a car for one
+simulation tick, and the controllers producing them: from the keyboard or from
+a scripted or programmatic sequence.
+
+"""
+
+from enum import IntFlag
+from typing import Iterable
+
+import pygame
+
+
+class Controls(IntFlag):
+    """
+    Flags representing the inputs held during one simulation tick.
+
+    Values:
+        NONE: No input.
+        FORWARD: Accelerate (W).
+        LEFT: Turn left (A).
+        BACKWARD: Brake or move backward (S).
+        RIGHT: Turn right (D).
+    """
+
+    NONE = 0
+    FORWARD = 1
+    LEFT = 2
+    BACKWARD = 4
+    RIGHT = 8
+
+
+class KeyboardController:
+    """
+    Reads the controls from the keyboard.
+
+    Attributes:
+        KEYS: A class variable mapping keys to the controls they trigger.
+        REWIND_KEY: A class variable representing the key held to rewind the race.
+
+    Methods:
+        poll(self) -> Controls:
+            Returns the controls currently held on the keyboard.
+
+        rewinding(self) -> bool:
+            Returns whether the rewind key is held.
+
+    """
+
+    KEYS = (
+        (pygame.K_w, Controls.FORWARD),
+        (pygame.K_a, Controls.LEFT),
+        (pygame.K_s, Controls.BACKWARD),
+        (pygame.K_d, Controls.RIGHT),
+    )
+    REWIND_KEY = pygame.K_r
+
+    def poll(self) -> Controls:
+        """
+        Returns the controls currently held on the keyboard.
+
+        Returns:
+            Controls: The held controls.
+        """
+        keys = pygame.key.get_pressed()
+        controls = Controls.NONE
+        for key, control in self.KEYS:
+            if keys[key]:
+                controls |= control
+        return controls
+
+    def rewinding(self) -> bool:
+        """
+        Returns whether the rewind key is held.
+
+        Returns:
+            bool: True while the player rewinds the race.
+        """
+        return bool(pygame.key.get_pressed()[self.REWIND_KEY])
+
+
+class ScriptedController:
+    """
+    Feeds controls from a sequence, one entry per simulation tick. The sequence
+    may be a list or any iterable such as a generator driven by an AI.
+
+    Methods:
+        poll(self) -> Controls:
+            Returns the controls of the next tick, or NONE once the script has ended.
+
+        rewinding(self) -> bool:
+            Returns False, scripts never rewind.
+
+    """
+
+    def __init__(self, inputs: Iterable[Controls]) -> None:
+        self.inputs = iter(inputs)
+
+    def poll(self) -> Controls:
+        """
+        Returns the controls of the next tick, or NONE once the script has ended.
+
+        Returns:
+            Controls: The controls of the next tick.
+        """
+        return Controls(next(self.inputs, Controls.NONE))
+
+    def rewinding(self) -> bool:
+        """
+        Returns False, scripts never rewind.
+
+        Returns:
+            bool: False.
+        """
+        return False
@@ -1,3 +1,6 @@
+# pylint: disable=too-many-public-methods
+
+
 """
 Module: racing_game_module
 
@@ -6,15 +9,52 @@ representing the main game logic for the Racing Game application.
 
 """
 
+import os
+
+import numpy as np
 import pygame
 
+from base.world import CarWorld
 from components.animations import AnimationFactory, AnimationType
-from components.car import ComputerCar, PlayerCar
-from components.game_info import GameInfo
-from constants.game import COMPUTER_PATH, FINISH_POSITION, GAME_FPS
+from components.assets import AssetManager
+from components.car import CarCollider, ComputerCar, PlayerCar, WaypointController
+from components.controls import Controls, KeyboardController
+from components.game_info import GameInfo, RaceResult
+from components.hud import Hud
+from components.loop import FixedTimestep
+from components.profiler import NullProfiler, Phase, Profiler, ProfilerOverlay
+from components.race import RaceTracker
+from components.renderer import RendererFactory, RendererType
+from components.replay import ReplayRecorder, pack_header
+from components.result import ResultScreen
+from components.rewind import RewindBuffer
+from components.sound import SoundCategory, SoundManager
+from constants.game import (
+    ASSET_TIMING_REPORT,
+    CHECKPOINT_GATES,
+    COLLISION_STEP,
+    COMPUTER_PATH,
+    FINISH_POSITION,
+    GAME_FPS,
+    HUD_GLYPH_ATLAS,
+    PROFILER_DUMP_PATH,
+    PROFILER_ENABLED,
+    RACE_LAPS,
+    RENDER_FPS,
+    RENDERER_MODE,
+    REPLAY_KEYFRAME_INTERVAL,
+    REPLAY_RECORD_PATH,
+    REWIND_SECONDS,
+    ROTATION_CACHE_MODE,
+    ROTATION_CACHE_SIZE,
+    SIMULATION_RATE,
+    START_PROMPT_BLINK_MS,
+)
 from constants.images import ImageEnum, ImageFactory
-from constants.sounds import SoundEnum, SoundFactory
+from constants.sounds import SoundEnum
 from utils.helper import blit_text_center
+from utils.masks import MASK_REGISTRY
+from utils.rotation import ROTATION_CACHES
 
 
 class RacingGame:
@@ -22,19 +62,31 @@ class RacingGame:
     Represents the main game class responsible for managing the game state and logic.
 
     Methods:
-        __init__(self):
+        __init__(self, headless=False, controller=None):
             Initializes a RacingGame object.
 
-        draw(self):
+        load_assets(self):
+            Loads the images and sounds on worker threads behind a loading screen.
+
+        draw(self, alpha=1.0, message=None):
             Draws the game elements on the window.
 
-        move_player(self):
-            Handles player input and moves the player car accordingly.
+        draw_hud(self):
+            Draws the level, time, velocity and race position texts.
+
+        move_player(self, controls):
+            Moves the player car according to the controls.
+
+        step(self):
+            Advances the simulation by one tick.
 
         handle_result(self, sound, animation_type, message):
             Handles the result of the game, playing sounds,
             displaying animations, and showing a message.
 
+        update_result_screen(self, dt):
+            Advances and draws the result screen.
+
         lose(self):
             Handles the player losing the game.
 
@@ -42,219 +94,554 @@ class RacingGame:
             Handles the player winning the game.
 
         handle_collision(self):
-            Handles collisions between cars and game elements.
+            Handles collisions between cars and game elements, then race progress.
+
+        collide_border(self, car):
+            Bounces a car off the track border if it hit it during the tick.
 
         run_game(self):
             Runs the main game loop.
 
+        wait_for_start(self):
+            Shows the start prompt until a key is pressed.
+
+        draw_start_screen(self, prompt_visible):
+            Draws the game with the start prompt over it.
+
+        simulate(self, ticks):
+            Runs up to the given number of ticks, stopping early when the level ends.
+
+        rewind_step(self):
+            Steps the simulation one tick backwards.
+
+        run_headless(self, max_ticks=None):
+            Runs the simulation without drawing, as fast as possible.
+
+        save_state(self):
+            Returns the state of the simulation.
+
+        load_state(self, state):
+            Restores the simulation to a state returned by save_state.
+
+        seek(self, tick):
+            Jumps a replayed race to the given tick.
+
     """
 
-    def __init__(self):
+    def __init__(self, headless=False, controller=None):
         """
         Initializes a RacingGame object.
+
+        Args:
+            headless (bool): If True, the game runs on SDL's dummy video and audio
+            drivers, plays no sound and is meant to be driven by run_headless.
+            In both modes, level times are measured in simulation time.
+            controller: The source of the player's controls, the keyboard by default.
         """
+        self.headless = headless
         self.init_pygame()
 
         pygame.display.set_caption("Racing Game!")
+        ROTATION_CACHES.configure(ROTATION_CACHE_MODE, ROTATION_CACHE_SIZE)
 
         self.main_font = pygame.font.SysFont("comicsans", 44)
 
         self.run = True
         self.clock = pygame.time.Clock()
 
-        self.player_car = PlayerCar(4, 4)
-        self.computer_car = ComputerCar(2, 4, COMPUTER_PATH)
-        self.game_info = GameInfo()
+        self.init_window()
+        self.load_assets()
         self.init_images()
+        self.world = CarWorld(time_scale=GAME_FPS / SIMULATION_RATE)
+        self.player_car = PlayerCar(4, 4, self.world)
+        self.computer_car = ComputerCar(2, 4, COMPUTER_PATH, self.world)
+        self.computer_controller = WaypointController([self.computer_car])
+        self.car_collider = CarCollider([self.player_car, self.computer_car])
+        self.race = RaceTracker(
+            [self.player_car, self.computer_car], CHECKPOINT_GATES, COMPUTER_PATH
+        )
+        self.controller = controller or KeyboardController()
+        self.ticks = 0
+        self.result = None
+        self.game_info = GameInfo(clock=self.get_simulation_time)
+        self.init_recorder()
+        self.timestep = FixedTimestep(SIMULATION_RATE)
+        self.result_screen = None
+        self.previous_poses = self.world.poses()
+        self.rewind = RewindBuffer(
+            REWIND_SECONDS * SIMULATION_RATE, len(CarWorld.FIELDS), self.world.size
+        )
         self.init_sounds()
+        self.init_profiler()
 
     def init_pygame(self):
         """
         Initializes the pygame.
         """
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.font.init()
         pygame.init()
-        pygame.mixer.init()
+        if not self.headless:
+            pygame.mixer.init()
 
-    def init_images(self):
+    def init_window(self):
         """
-        Initializes the images objects.
+        Opens the window, sized after the track image.
         """
         track_image = ImageFactory.get_image(ImageEnum.TRACK_IMAGE)
         self.width = track_image.get_width()
         self.height = track_image.get_height()
 
-        self.window = pygame.display.set_mode(
-            (track_image.get_width(), track_image.get_height())
-        )
+        self.window = pygame.display.set_mode((self.width, self.height))
+
+    def load_assets(self):
+        """
+        Loads the images and sounds on worker threads, showing a loading screen
+        until they are ready. The animations keep loading in the background.
+        """
+        self.assets = AssetManager()
+        self.assets.load_images(ImageEnum)
+        if not self.headless:
+            self.assets.load_sounds(SoundEnum)
+            self.assets.load_animations(AnimationType)
+        while not self.assets.ready():
+            if not self.headless:
+                self.draw_loading_screen(self.assets.progress())
+            pygame.event.pump()
+            self.clock.tick(30)
+        if ASSET_TIMING_REPORT:
+            print(self.assets.report())
+
+    def draw_loading_screen(self, progress):
+        """
+        Draws the loading screen with a progress bar.
+
+        Args:
+            progress (float): The fraction of the assets loaded, from 0 to 1.
+        """
+        self.window.fill((0, 0, 0))
+        outline = pygame.Rect(0, 0, self.width * 0.6, 20)
+        outline.center = (self.width / 2, self.height / 2 + 60)
+        pygame.draw.rect(self.window, (200, 200, 200), outline, 2)
+        filled = outline.inflate(-8, -8)
+        filled.width = round(filled.width * progress)
+        pygame.draw.rect(self.window, (200, 200, 200), filled)
+        blit_text_center(self.window, self.main_font, "Loading...")
+        pygame.display.update()
+
+    def init_images(self):
+        """
+        Initializes the images objects.
+        """
         self.images = [
             (ImageFactory.get_image(ImageEnum.GRASS_IMAGE), (0, 0)),
-            (track_image, (0, 0)),
+            (ImageFactory.get_image(ImageEnum.TRACK_IMAGE), (0, 0)),
             (ImageFactory.get_image(ImageEnum.FINISH_IMAGE), FINISH_POSITION),
             (ImageFactory.get_image(ImageEnum.TRACK_BORDER_IMAGE), (0, 0)),
         ]
+        self.border_mask = MASK_REGISTRY.get(self.images[3][0])
+        self.border_field = ImageFactory.get_distance_field(
+            ImageEnum.TRACK_BORDER_IMAGE
+        )
+        self.renderer = RendererFactory.get_renderer(
+            RendererType(RENDERER_MODE), self.window, self.images
+        )
+        self.hud = Hud(self.main_font, self.height, HUD_GLYPH_ATLAS)
 
     def init_sounds(self):
         """
-        Initializes the sounds.
+        Initializes the sounds, played through a SoundManager on reserved channels.
         """
-        self.acceration_sound = SoundFactory.get_sound(SoundEnum.ACCELERATION_SOUND)
-        self.losing_sound = SoundFactory.get_sound(SoundEnum.LOSING_SOUND)
-        self.winning_sound = SoundFactory.get_sound(SoundEnum.WINNING_SOUND)
+        self.sounds = SoundManager(self.assets.get, enabled=not self.headless)
+        self.losing_sound = self.sounds.handle(SoundEnum.LOSING_SOUND)
+        self.winning_sound = self.sounds.handle(SoundEnum.WINNING_SOUND)
 
-    def draw(self):
+    def init_profiler(self):
         """
-        Draws the game elements on the window.
+        Times the phases of the game loop if PROFILER_ENABLED is set, with an
+        overlay toggled by F3, and records nothing otherwise.
         """
-        for img, pos in self.images:
-            self.window.blit(img, pos)
-
-        text_color, text_antialias = (255, 255, 255), 1
-
-        level_text = self.main_font.render(
-            f"Level {self.game_info.level}", text_antialias, text_color
-        )
-        self.window.blit(level_text, (10, self.height - level_text.get_height() - 70))
+        self.profiler = NullProfiler()
+        self.overlay = None
+        if PROFILER_ENABLED:
+            self.profiler = Profiler()
+            font = pygame.font.SysFont("comicsans", 18)
+            self.overlay = ProfilerOverlay(self.profiler, font)
+
+    def init_recorder(self):
+        """
+        Records the player's controls to REPLAY_RECORD_PATH, if it is set, when
+        the game is played on screen.
+        """
+        self.recorder = None
+        if REPLAY_RECORD_PATH and not self.headless:
+            # pylint: disable=consider-using-with
+            self.recorder = ReplayRecorder(
+                self.controller,
+                open(REPLAY_RECORD_PATH, "wb"),
+                pack_header(self.game_info.level, SIMULATION_RATE, COMPUTER_PATH),
+                REPLAY_KEYFRAME_INTERVAL,
+            )
+            self.controller = self.recorder
+
+    def draw(self, alpha=1.0, message=None):
+        """
+        Draws the game elements on the window.
 
-        time_text = self.main_font.render(
-            f"Time: {self.game_info.get_level_time()}s", text_antialias, text_color
-        )
-        self.window.blit(time_text, (10, self.height - time_text.get_height() - 40))
+        Args:
+            alpha (float): How far between the previous and the current simulation
+            state the cars are drawn, from 0 (previous) to 1 (current).
+            message (str): A text drawn centered over the game, if not None.
+        """
+        start = self.profiler.start()
+        poses = self.world.poses()
+        poses = self.previous_poses + (poses - self.previous_poses) * alpha
+        self.renderer.begin_frame()
+        rects = self.draw_hud()
+        for car in (self.player_car, self.computer_car):
+            rects.append(car.draw(self.window, poses[:, car.index]))
+        if self.overlay is not None:
+            rects.extend(self.overlay.draw(self.window))
+        if message is not None:
+            rect = blit_text_center(self.window, self.main_font, message)
+            if rect is not None:
+                rects.append(rect)
+        start = self.profiler.stop(Phase.DRAW, start)
+        self.renderer.end_frame(rects)
+        self.profiler.stop(Phase.FLIP, start)
+
+    def draw_hud(self):
+        """
+        Draws the level, time, velocity and race position texts, and a warning
+        while the player drives the wrong way.
 
-        vel_text = self.main_font.render(
-            f"Vel: {round(self.player_car.vel, 1)}px/s", text_antialias, text_color
+        Returns:
+            list: The areas of the window covered by the texts.
+        """
+        rects = self.hud.draw(
+            self.window,
+            [
+                self.game_info.level,
+                self.game_info.get_level_time(),
+                round(self.player_car.vel, 1),
+                self.race.position(0),
+            ],
         )
-        self.window.blit(vel_text, (10, self.height - vel_text.get_height() - 10))
+        if self.player_car.wrong_way:
+            rects.append(self.hud.draw_message(self.window, "WRONG WAY!"))
+        return rects
 
-        self.player_car.draw(self.window)
-        self.computer_car.draw(self.window)
-
-        pygame.display.update()
-
-    def move_player(self):
+    def move_player(self, controls):
         """
-        Handles player input and moves the player car accordingly.
+        Moves the player car according to the controls.
+
+        Args:
+            controls (Controls): The controls held during this tick.
         """
-        keys = pygame.key.get_pressed()
         moved = False
 
-        if keys[pygame.K_a]:
+        if controls & Controls.LEFT:
             self.player_car.rotate(left=True)
-        if keys[pygame.K_d]:
+        if controls & Controls.RIGHT:
             self.player_car.rotate(right=True)
-        if keys[pygame.K_w]:
+        if controls & Controls.FORWARD:
             moved = True
             self.player_car.move_forward()
-        if keys[pygame.K_s]:
+        if controls & Controls.BACKWARD:
             moved = True
             self.player_car.move_backward()
 
-        if moved:
-            self.acceration_sound.set_volume(0.2)
-            self.acceration_sound.play()
-
         if not moved:
             self.player_car.reduce_speed()
 
+        self.sounds.update_engine(self.player_car.vel, self.player_car.max_vel)
+
+    def get_simulation_time(self):
+        """
+        Returns the time elapsed in the simulation, derived from the ticks run.
+
+        Returns:
+            float: The simulation time in seconds.
+        """
+        return self.ticks / SIMULATION_RATE
+
+    def step(self):
+        """
+        Advances the simulation by one tick.
+        """
+        if self.recorder is not None:
+            self.recorder.keyframe(self.ticks, self.save_state)
+        self.ticks += 1
+        self.previous_poses = self.world.poses()
+        start = self.profiler.start()
+        self.move_player(self.controller.poll())
+        start = self.profiler.stop(Phase.MOVE_PLAYER, start)
+        self.computer_controller.move()
+        start = self.profiler.stop(Phase.COMPUTER_MOVE, start)
+
+        self.handle_collision()
+        self.profiler.stop(Phase.HANDLE_COLLISION, start)
+
+        if self.game_info.game_finished():
+            self.win()
+
     def handle_result(self, sound, animation_type, message):
         """
         Handles the result of the game, playing sounds,
         displaying animations, and showing a message.
 
         Args:
-            sound (pygame.mixer.Sound): The sound to be played.
+            sound (SoundHandle): The sound to be played.
             animation_type (AnimationType): The type of animation to be displayed.
             message (str): The message to be shown.
         """
-        self.acceration_sound.stop()
-        sound.play()
-        AnimationFactory.get_animation(animation_type).draw(self.window, self.clock)
-        blit_text_center(self.window, self.main_font, message)
-        sound.stop()
-        pygame.display.update()
-        pygame.time.wait(5000)
+        self.sounds.stop(SoundCategory.ENGINE)
+        if self.headless:
+            self.run = False
+        else:
+            self.result_screen = ResultScreen(
+                AnimationFactory.get_animation(animation_type), sound, message
+            )
 
         self.game_info.reset()
         self.player_car.reset()
         self.computer_car.reset()
-        self.draw()
+        self.race.reset(self.ticks)
+        self.previous_poses = self.world.poses()
+        self.rewind.clear()
+        self.renderer.invalidate()
 
     def lose(self):
         """
         Handles the player losing the game.
         """
+        self.result = RaceResult.LOST
         self.handle_result(self.losing_sound, AnimationType.LOSE, "YOU LOST!")
 
     def win(self):
         """
         Handles the player winning the game.
         """
+        self.result = RaceResult.WON
         self.handle_result(
             self.winning_sound, AnimationType.WINNING, "YOU WON THE GAME!"
         )
 
     def handle_collision(self):
         """
-        Handles collisions between cars and game elements.
+        Handles collisions between cars and game elements, then the progress of
+        the cars through the checkpoint gates. The motion of the cars during the
+        tick is swept, so that fast cars cannot pass through the border or a
+        gate between two ticks.
         """
-        if (
-            self.player_car.collide(pygame.mask.from_surface(self.images[3][0]))
-            is not None
-        ):
-            self.player_car.bounce()
+        self.car_collider.resolve(self.previous_poses)
+        self.collide_border(self.player_car)
 
-        computer_finish_poi_collide = self.computer_car.collide(
-            pygame.mask.from_surface(self.images[2][0]), *FINISH_POSITION
-        )
-        if computer_finish_poi_collide is not None:
+        self.race.update(self.previous_poses, self.ticks)
+        player_laps, computer_laps = self.race.laps()
+        if computer_laps >= RACE_LAPS:
             self.lose()
+        elif player_laps >= RACE_LAPS:
+            self.sounds.stop(SoundCategory.ENGINE)
+            self.game_info.next_level()
+            self.player_car.reset()
+            self.computer_car.next_level(self.game_info.level)
+            self.race.reset(self.ticks)
+            self.previous_poses = self.world.poses()
+
+    def collide_border(self, car):
+        """
+        Bounces a car off the track border if it hit it during the tick. The car
+        is first moved back to where its motion first touched the border.
 
-        player_finish_poi_collide = self.player_car.collide(
-            pygame.mask.from_surface(self.images[2][0]), *FINISH_POSITION
+        Args:
+            car (PlayerCar): The car.
+        """
+        previous = self.previous_poses[:, car.index]
+        contact = self.border_field.sweep(
+            car.outline(previous), car.outline(), COLLISION_STEP
         )
-        if player_finish_poi_collide is not None:
-            if player_finish_poi_collide[1] == 0:
-                self.player_car.bounce()
-            else:
-                self.acceration_sound.stop()
-                self.game_info.next_level()
-                self.player_car.reset()
-                self.computer_car.next_level(self.game_info.level)
+        if contact is not None:
+            fraction, normal, depth = contact
+            current = np.array((car.x, car.y, car.angle))
+            car.x, car.y, car.angle = previous + (current - previous) * fraction
+            car.bounce(normal, depth)
 
     def run_game(self):
         """
-        Runs the main game loop.
+        Runs the main game loop. The simulation advances in fixed ticks of
+        SIMULATION_RATE per second while frames are drawn at up to RENDER_FPS,
+        interpolating the cars between the last two simulation states.
         """
         while self.run:
-            self.clock.tick(GAME_FPS)
-            self.draw()
-
-            while not self.game_info.started:
-                blit_text_center(
-                    self.window,
-                    self.main_font,
-                    f"Press Any Key To Start Level {self.game_info.level}!",
-                )
-                pygame.display.update()
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        break
-
-                    if event.type == pygame.KEYDOWN:
-                        self.game_info.start_level()
+            self.profiler.frame()
+            dt = self.clock.tick(RENDER_FPS) / 1000
+            if self.result_screen is not None:
+                self.update_result_screen(dt)
+            else:
+                self.draw(self.timestep.alpha())
+                if not self.game_info.started:
+                    self.wait_for_start()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.run = False
                     break
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    if self.overlay is not None:
+                        self.overlay.toggle()
+
+            self.simulate(self.timestep.advance())
 
-            self.move_player()
-            self.computer_car.move()
+        if self.recorder is not None:
+            self.recorder.close()
+        self.profiler.dump(PROFILER_DUMP_PATH)
+        pygame.quit()
 
-            self.handle_collision()
+    def update_result_screen(self, dt):
+        """
+        Advances and draws the result screen, returning to the game once it is over.
 
-            if self.game_info.game_finished():
-                self.win()
+        Args:
+            dt (float): The time elapsed since the previous frame, in seconds.
+        """
+        self.result_screen.update(dt)
+        self.result_screen.draw(self.window, self.main_font)
+        if self.result_screen.finished():
+            self.result_screen = None
+            self.renderer.invalidate()
 
-        pygame.quit()
+    def wait_for_start(self):
+        """
+        Shows the start prompt until a key is pressed. The loop sleeps in
+        pygame.event.wait and only redraws when the window is exposed or, if
+        START_PROMPT_BLINK_MS is set, when the prompt blinks.
+        """
+        visible = True
+        self.draw_start_screen(visible)
+        while self.run and not self.game_info.started:
+            event = pygame.event.wait(START_PROMPT_BLINK_MS)
+            if event.type == pygame.NOEVENT:
+                visible = not visible
+                self.draw_start_screen(visible)
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self.draw_start_screen(visible)
+            elif event.type == pygame.QUIT:
+                self.run = False
+            elif event.type == pygame.KEYDOWN:
+                self.game_info.start_level()
+                self.renderer.invalidate()
+        self.timestep.reset()
+
+    def draw_start_screen(self, prompt_visible):
+        """
+        Draws the game with the start prompt over it, pushed to the display
+        as one frame.
+
+        Args:
+            prompt_visible (bool): Whether the prompt is shown.
+        """
+        self.renderer.invalidate()
+        prompt = f"Press Any Key To Start Level {self.game_info.level}!"
+        self.draw(message=prompt if prompt_visible else None)
+
+    def simulate(self, ticks):
+        """
+        Runs up to the given number of ticks, stopping early when the level ends.
+        While the controller rewinds, each tick steps backwards instead.
+
+        Args:
+            ticks (int): The number of ticks to run.
+        """
+        for _ in range(ticks):
+            if not (self.run and self.game_info.started):
+                break
+            if self.controller.rewinding():
+                self.rewind_step()
+            else:
+                self.rewind.push(
+                    self.ticks, self.game_info.state(), self.world, self.race
+                )
+                self.step()
+
+    def rewind_step(self):
+        """
+        Steps the simulation one tick backwards, restoring the state saved
+        before the last tick. Does nothing once REWIND_SECONDS have been rewound.
+        """
+        previous_poses = self.world.poses()
+        state = self.rewind.pop()
+        if state is not None:
+            self.load_state(state)
+        self.previous_poses = previous_poses
+
+    def run_headless(self, max_ticks=None):
+        """
+        Runs the simulation without drawing, as fast as possible, until the race
+        is won or lost or max_ticks ticks have run. Levels start automatically and
+        their times are measured in simulation time.
+
+        Args:
+            max_ticks (int): The maximum number of ticks to run, unlimited if None.
+
+        Returns:
+            RaceResult: The outcome of the race, or None if it did not finish.
+        """
+        while self.run and (max_ticks is None or self.ticks < max_ticks):
+            if not self.game_info.started:
+                self.game_info.start_level()
+            self.step()
+        return self.result
+
+    def save_state(self):
+        """
+        Returns the state of the simulation: the ticks run, the game info, the
+        state of every car and the sector timing of the race.
+
+        Returns:
+            tuple: The (ticks, game info state, world state, race state) of the
+            simulation.
+        """
+        return (
+            self.ticks,
+            self.game_info.state(),
+            self.world.state(),
+            self.race.state(),
+        )
+
+    def load_state(self, state):
+        """
+        Restores the simulation to a state returned by save_state.
+
+        Args:
+            state (tuple): The (ticks, game info state, world state, race state)
+            to restore.
+        """
+        ticks, game_info_state, world_state, race_state = state
+        self.ticks = ticks
+        self.game_info.restore(game_info_state)
+        self.world.restore(world_state)
+        self.race.restore(race_state)
+        self.previous_poses = self.world.poses()
+        self.result = None
+        self.run = True
+
+    def seek(self, tick):
+        """
+        Jumps a replayed race to the given tick, restoring the last keyframe
+        before it and simulating the remaining ticks headlessly, so that at most
+        one keyframe interval is simulated whatever the tick.
+
+        Args:
+            tick (int): The tick to jump to.
+
+        Returns:
+            RaceResult: The outcome of the race if it ended before the tick.
+        """
+        state = self.controller.replay.keyframe_before(tick)
+        if state is not None and (state[0] > self.ticks or tick < self.ticks):
+            self.load_state(state)
+            self.controller.tick = self.ticks
+        return self.run_headless(max_ticks=tick)
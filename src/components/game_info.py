@@ -2,11 +2,26 @@
 Module: game_info_module
 
 This module defines the GameInfo class, representing information about the game state,
-including the current level, whether the game has started, and timing information.
+including the current level, whether the game has started, and timing information,
+and the RaceResult enumeration.
 
 """
 
 import time
+from enum import Enum
+
+
+class RaceResult(Enum):
+    """
+    Enumeration representing the outcome of a race.
+
+    Values:
+        WON: The player finished every level.
+        LOST: The computer car crossed the finish line first.
+    """
+
+    WON = 1
+    LOST = 2
 
 
 class GameInfo:
@@ -18,8 +33,8 @@ class GameInfo:
         LEVELS: A class variable representing the total number of levels in the game.
 
     Methods:
-        __init__(self, level=1):
-            Initializes a GameInfo object with the specified initial level.
+        __init__(self, level=1, clock=time.time):
+            Initializes a GameInfo object with the specified initial level and clock.
 
         next_level(self) -> None:
             Advances to the next level and resets the 'started' flag.
@@ -37,16 +52,24 @@ class GameInfo:
         get_level_time(self) -> int:
             Calculates and returns the time elapsed since the start of the current level.
 
+        state(self) -> tuple:
+            Returns the level, started flag and level start time.
+
+        restore(self, state: tuple) -> None:
+            Sets the level, started flag and level start time from a saved state.
+
     """
 
     LEVELS = 3
 
-    def __init__(self, level=1):
+    def __init__(self, level=1, clock=time.time):
         """
-        Initializes a GameInfo object with the specified initial level.
+        Initializes a GameInfo object with the specified initial level and clock.
 
         Args:
             level: The initial level of the game.
+            clock: A callable returning the current time in seconds, used to time
+            the levels. Simulations pass their own clock to run faster than real time.
 
         Returns:
             None
@@ -54,6 +77,7 @@ class GameInfo:
         self.level = level
         self.started = False
         self.level_start_time = 0
+        self.clock = clock
 
     def next_level(self) -> None:
         """
@@ -93,7 +117,7 @@ class GameInfo:
             None
         """
         self.started = True
-        self.level_start_time = time.time()
+        self.level_start_time = self.clock()
 
     def get_level_time(self) -> int:
         """
@@ -104,4 +128,25 @@ class GameInfo:
         """
         if not self.started:
             return 0
-        return round(time.time() - self.level_start_time)
+        return round(self.clock() - self.level_start_time)
+
+    def state(self) -> tuple:
+        """
+        Returns the level, started flag and level start time.
+
+        Returns:
+            tuple: The (level, started, level_start_time) of the game.
+        """
+        return self.level, self.started, self.level_start_time
+
+    def restore(self, state: tuple) -> None:
+        """
+        Sets the level, started flag and level start time from a saved state.
+
+        Args:
+            state (tuple): A state returned by state.
+
+        Returns:
+            None
+        """
+        self.level, self.started, self.level_start_time = state
@@ -0,0 +1,183 @@
+"""
+Module: hud_module
+
+This module defines the heads-up display of the RacingGame application: a
+bounded cache of rendered texts, a pre-rendered glyph atlas for numbers and
+the Hud class drawing the level, time and velocity fields.
+
+"""
+
+from collections import OrderedDict
+from typing import List
+
+import pygame
+
+
+# pylint: disable=too-few-public-methods
+class TextCache:
+    """
+    Bounded least-recently-used cache of rendered text surfaces.
+
+    Methods:
+        get(self, text: str) -> pygame.Surface:
+            Returns the rendered surface of the text, rendering it if needed.
+
+    """
+
+    def __init__(self, font, color=(255, 255, 255), antialias=True, max_size=64):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+
+    def get(self, text: str) -> pygame.Surface:
+        """
+        Returns the rendered surface of the text, rendering it if needed.
+
+        Args:
+            text (str): The text to render.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        surface = self._surfaces.get(text)
+        if surface is None:
+            surface = self.font.render(text, self.antialias, self.color)
+            self._surfaces[text] = surface
+            if len(self._surfaces) > self.max_size:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(text)
+        return surface
+
+
+class GlyphAtlas:
+    """
+    A single surface holding pre-rendered glyphs, used to draw numbers without
+    rasterizing any text at runtime.
+
+    Attributes:
+        GLYPHS: A class variable listing the characters rendered into the atlas.
+
+    Methods:
+        draw(self, win: pygame.Surface, text: str, position) -> pygame.Rect:
+            Draws the text glyph by glyph at the given position.
+
+    """
+
+    GLYPHS = "0123456789.-"
+
+    def __init__(self, text_cache: TextCache) -> None:
+        renders = [text_cache.get(glyph) for glyph in self.GLYPHS]
+        self.height = max(render.get_height() for render in renders)
+        width = sum(render.get_width() for render in renders)
+        self.surface = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        self.areas = {}
+        x = 0
+        for glyph, render in zip(self.GLYPHS, renders):
+            self.areas[glyph] = self.surface.blit(render, (x, 0))
+            x += render.get_width()
+
+    def draw(self, win: pygame.Surface, text: str, position) -> pygame.Rect:
+        """
+        Draws the text glyph by glyph at the given position.
+
+        Args:
+            win (pygame.Surface): The surface to draw on.
+            text (str): The text, made only of GLYPHS characters.
+            position: The top-left position of the text.
+
+        Returns:
+            pygame.Rect: The area covered by the text.
+        """
+        x, y = position
+        rect = pygame.Rect(x, y, 0, self.height)
+        for glyph in text:
+            area = self.areas[glyph]
+            rect.union_ip(win.blit(self.surface, (x, y), area))
+            x += area.width
+        return rect
+
+
+class Hud:
+    """
+    Draws the level, time, velocity and race position fields at the bottom left
+    of the window.
+    A field is only re-rendered when its displayed value changes; with the glyph
+    atlas enabled, numbers are drawn from the atlas and labels from the cache.
+
+    Attributes:
+        FIELDS: A class variable holding the (prefix, suffix, bottom margin) of each field.
+
+    Methods:
+        draw(self, win: pygame.Surface, values: list) -> List[pygame.Rect]:
+            Draws every field with its current value.
+
+        draw_message(self, win: pygame.Surface, text: str) -> pygame.Rect:
+            Draws a message centered at the top of the window.
+
+    """
+
+    FIELDS = (
+        ("Level ", "", 70),
+        ("Time: ", "s", 40),
+        ("Vel: ", "px/s", 10),
+        ("Pos: ", "", 100),
+    )
+
+    def __init__(self, font, height: int, use_atlas=False) -> None:
+        self.text_cache = TextCache(font)
+        self.atlas = GlyphAtlas(self.text_cache) if use_atlas else None
+        self.height = height
+        self._rendered = [(None, None)] * len(self.FIELDS)
+
+    def draw(self, win: pygame.Surface, values: list) -> List[pygame.Rect]:
+        """
+        Draws every field with its current value.
+
+        Args:
+            win (pygame.Surface): The surface to draw on.
+            values (list): The level, time, velocity and position values to display.
+
+        Returns:
+            List[pygame.Rect]: The areas covered by the fields.
+        """
+        if self.atlas is not None:
+            return [
+                self._draw_atlas_field(win, field, value)
+                for field, value in zip(self.FIELDS, values)
+            ]
+        return [
+            self._draw_field(win, index, value) for index, value in enumerate(values)
+        ]
+
+    def draw_message(self, win: pygame.Surface, text: str) -> pygame.Rect:
+        """
+        Draws a message centered at the top of the window.
+
+        Args:
+            win (pygame.Surface): The surface to draw on.
+            text (str): The message.
+
+        Returns:
+            pygame.Rect: The area covered by the message.
+        """
+        render = self.text_cache.get(text)
+        return win.blit(render, ((win.get_width() - render.get_width()) // 2, 10))
+
+    def _draw_field(self, win, index, value):
+        prefix, suffix, bottom = self.FIELDS[index]
+        last_value, render = self._rendered[index]
+        if render is None or last_value != value:
+            render = self.text_cache.get(f"{prefix}{value}{suffix}")
+            self._rendered[index] = (value, render)
+        return win.blit(render, (10, self.height - render.get_height() - bottom))
+
+    def _draw_atlas_field(self, win, field, value):
+        prefix, suffix, bottom = field
+        y = self.height - self.atlas.height - bottom
+        rect = win.blit(self.text_cache.get(prefix), (10, y))
+        rect.union_ip(self.atlas.draw(win, str(value), rect.topright))
+        rect.union_ip(win.blit(self.text_cache.get(suffix), rect.topright))
+        return rect
@@ -0,0 +1,80 @@
+"""
+Module: fixed_timestep_module
+
+This module defines the FixedTimestep class, an accumulator that decouples the
+simulation tick rate from the rendering frame rate.
+
+"""
+
+import time
+
+
+class FixedTimestep:
+    """
+    Accumulates elapsed wall-clock time and converts it into a whole number of
+    fixed-length simulation ticks, plus the fraction of a tick left over, used to
+    interpolate between the last two simulation states when rendering.
+
+    Methods:
+        __init__(self, tick_rate, max_ticks_per_frame=8, clock=time.perf_counter):
+            Initializes a FixedTimestep running at tick_rate ticks per second.
+
+        reset(self) -> None:
+            Drops the accumulated time, e.g. after the game was paused.
+
+        advance(self) -> int:
+            Returns the number of ticks to simulate for the time elapsed since the
+            previous call.
+
+        alpha(self) -> float:
+            Returns the fraction of a tick accumulated but not yet simulated.
+
+    """
+
+    def __init__(self, tick_rate, max_ticks_per_frame=8, clock=time.perf_counter):
+        self.tick_rate = tick_rate
+        self.dt = 1 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.clock = clock
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def reset(self) -> None:
+        """
+        Drops the accumulated time, e.g. after the game was paused.
+
+        Returns:
+            None
+        """
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self) -> int:
+        """
+        Returns the number of ticks to simulate for the time elapsed since the
+        previous call. At most max_ticks_per_frame ticks are returned; time beyond
+        that is dropped so that a slow machine slows the game down instead of
+        falling further and further behind.
+
+        Returns:
+            int: The number of ticks to simulate.
+        """
+        now = self.clock()
+        if self.last_time is not None:
+            self.accumulator += now - self.last_time
+        self.last_time = now
+        ticks = int(self.accumulator / self.dt)
+        self.accumulator -= ticks * self.dt
+        if ticks > self.max_ticks_per_frame:
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        return ticks
+
+    def alpha(self) -> float:
+        """
+        Returns the fraction of a tick accumulated but not yet simulated.
+
+        Returns:
+            float: The interpolation factor between the previous and current state.
+        """
+        return min(self.accumulator / self.dt, 1.0)
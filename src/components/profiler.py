@@ -0,0 +1,307 @@
+"""
+Module: profiler_module
+
+This module defines the Profiler class, which times the phases of the game loop
+into fixed-size rolling windows, its no-op counterpart NullProfiler, the
+ProfilerOverlay drawing the timings on screen and the Phase enumeration.
+
+"""
+
+import json
+import os
+import time
+from array import array
+from enum import IntEnum
+from typing import List
+
+import numpy as np
+import pygame
+
+from components.hud import TextCache
+
+
+class Phase(IntEnum):
+    """
+    Enumeration representing the timed phases of the game loop.
+
+    Values:
+        FRAME: A whole iteration of the game loop.
+        DRAW: Drawing a frame, without pushing it to the display.
+        FLIP: Pushing a frame to the display.
+        MOVE_PLAYER: Moving the player car during a tick.
+        COMPUTER_MOVE: Moving the computer cars during a tick.
+        HANDLE_COLLISION: Handling the collisions of a tick.
+    """
+
+    FRAME = 0
+    DRAW = 1
+    FLIP = 2
+    MOVE_PLAYER = 3
+    COMPUTER_MOVE = 4
+    HANDLE_COLLISION = 5
+
+
+class NullProfiler:
+    """
+    A profiler that records nothing, used when profiling is disabled so that
+    the timed code only pays for two empty calls per phase.
+
+    Methods:
+        start(self) -> int:
+            Returns 0.
+
+        stop(self, phase: Phase, start: int) -> int:
+            Returns 0.
+
+        frame(self) -> None:
+            Does nothing.
+
+        dump(self, path: str) -> None:
+            Does nothing.
+
+    """
+
+    def start(self) -> int:
+        """
+        Returns 0.
+
+        Returns:
+            int: 0.
+        """
+        return 0
+
+    def stop(self, phase: Phase, start: int) -> int:  # pylint: disable=unused-argument
+        """
+        Returns 0.
+
+        Args:
+            phase (Phase): The ignored phase.
+            start (int): The ignored start time.
+
+        Returns:
+            int: 0.
+        """
+        return 0
+
+    def frame(self) -> None:
+        """
+        Does nothing.
+
+        Returns:
+            None
+        """
+
+    def dump(self, path: str) -> None:
+        """
+        Does nothing.
+
+        Args:
+            path (str): The ignored path.
+
+        Returns:
+            None
+        """
+
+
+class Profiler(NullProfiler):
+    """
+    Times the phases of the game loop with perf_counter_ns. Each phase keeps its
+    last SAMPLES durations in a preallocated array used as a ring buffer.
+
+    Attributes:
+        SAMPLES: A class variable representing the number of durations kept per phase.
+        samples: An instance variable holding the ring buffer of every phase.
+        counts: An instance variable holding the number of durations recorded
+        per phase.
+
+    Methods:
+        start(self) -> int:
+            Returns the current time in nanoseconds.
+
+        stop(self, phase: Phase, start: int) -> int:
+            Records the duration of a phase started at start and returns the current time.
+
+        frame(self) -> None:
+            Records the duration of the frame that just ended.
+
+        percentiles(self, phase: Phase, *percents) -> List[float]:
+            Returns percentiles of the recent durations of a phase, in milliseconds.
+
+        stats(self) -> dict:
+            Returns the count, mean, p50, p99 and max of every phase, in milliseconds.
+
+        dump(self, path: str) -> None:
+            Writes the stats of every phase to a JSON file.
+
+    """
+
+    SAMPLES = 600
+
+    def __init__(self, samples=SAMPLES) -> None:
+        self.samples = [array("q", bytes(8 * samples)) for _ in Phase]
+        self.counts = [0] * len(Phase)
+        self.last_frame = None
+
+    def start(self) -> int:
+        """
+        Returns the current time in nanoseconds.
+
+        Returns:
+            int: The value of perf_counter_ns.
+        """
+        return time.perf_counter_ns()
+
+    def stop(self, phase: Phase, start: int) -> int:
+        """
+        Records the duration of a phase started at start and returns the current
+        time, so that consecutive phases can be chained.
+
+        Args:
+            phase (Phase): The phase that ended.
+            start (int): The time the phase started, as returned by start.
+
+        Returns:
+            int: The current time in nanoseconds.
+        """
+        now = time.perf_counter_ns()
+        samples = self.samples[phase]
+        samples[self.counts[phase] % len(samples)] = now - start
+        self.counts[phase] += 1
+        return now
+
+    def frame(self) -> None:
+        """
+        Records the duration of the frame that just ended, measured between two
+        consecutive calls.
+
+        Returns:
+            None
+        """
+        if self.last_frame is None:
+            self.last_frame = time.perf_counter_ns()
+        else:
+            self.last_frame = self.stop(Phase.FRAME, self.last_frame)
+
+    def _recorded(self, phase: Phase) -> np.ndarray:
+        return np.frombuffer(self.samples[phase], np.int64)[: self.counts[phase]]
+
+    def percentiles(self, phase: Phase, *percents) -> List[float]:
+        """
+        Returns percentiles of the recent durations of a phase, in milliseconds.
+
+        Args:
+            phase (Phase): The phase.
+            *percents: The percentiles to compute, from 0 to 100.
+
+        Returns:
+            List[float]: The percentiles, 0 if the phase was never recorded.
+        """
+        recorded = self._recorded(phase)
+        if recorded.size == 0:
+            return [0.0] * len(percents)
+        return list(np.percentile(recorded, percents) / 1e6)
+
+    def stats(self) -> dict:
+        """
+        Returns the count, mean, p50, p99 and max of the recent durations of
+        every phase, in milliseconds.
+
+        Returns:
+            dict: The stats of every phase, keyed by phase name.
+        """
+        stats = {}
+        for phase in Phase:
+            p50, p99, maximum = self.percentiles(phase, 50, 99, 100)
+            recorded = self._recorded(phase)
+            mean = recorded.mean() / 1e6 if recorded.size else 0.0
+            stats[phase.name.lower()] = {
+                "count": self.counts[phase],
+                "mean_ms": round(float(mean), 4),
+                "p50_ms": round(float(p50), 4),
+                "p99_ms": round(float(p99), 4),
+                "max_ms": round(float(maximum), 4),
+            }
+        return stats
+
+    def dump(self, path: str) -> None:
+        """
+        Writes the stats of every phase to a JSON file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            None
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as stats_file:
+            json.dump(self.stats(), stats_file, indent=2)
+
+
+class ProfilerOverlay:
+    """
+    Draws the p50 and p99 durations of every phase at the top right of the
+    window. The text is only rendered again every REFRESH_FRAMES frames.
+
+    Attributes:
+        REFRESH_FRAMES: A class variable representing how many frames the same
+        text is shown before the percentiles are computed again.
+        visible: An instance variable representing whether the overlay is shown.
+
+    Methods:
+        toggle(self) -> None:
+            Shows or hides the overlay.
+
+        draw(self, win: pygame.Surface) -> List[pygame.Rect]:
+            Draws the overlay if it is visible.
+
+    """
+
+    REFRESH_FRAMES = 30
+
+    def __init__(self, profiler: Profiler, font: pygame.font.Font) -> None:
+        self.profiler = profiler
+        self.text_cache = TextCache(font, (255, 255, 0), max_size=len(Phase) * 4)
+        self.visible = False
+        self.frames = 0
+        self.lines = []
+
+    def toggle(self) -> None:
+        """
+        Shows or hides the overlay.
+
+        Returns:
+            None
+        """
+        self.visible = not self.visible
+        self.frames = 0
+
+    def draw(self, win: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Draws the overlay if it is visible.
+
+        Args:
+            win (pygame.Surface): The surface to draw on.
+
+        Returns:
+            List[pygame.Rect]: The areas covered by the overlay.
+        """
+        if not self.visible:
+            return []
+        if self.frames % self.REFRESH_FRAMES == 0:
+            self.lines = []
+            for phase in Phase:
+                p50, p99 = self.profiler.percentiles(phase, 50, 99)
+                self.lines.append(f"{phase.name.lower()} {p50:.2f}/{p99:.2f} ms")
+        self.frames += 1
+        rects = []
+        y = 10
+        for line in self.lines:
+            render = self.text_cache.get(line)
+            rects.append(
+                win.blit(render, (win.get_width() - render.get_width() - 10, y))
+            )
+            y += render.get_height()
+        return rects
@@ -0,0 +1,399 @@
+"""
+Module: race_module
+
+This module defines the RaceTracker class, which follows the progress of cars
+through the ordered checkpoint gates of the track with segment crossing tests,
+giving their laps, sector splits, race positions and whether they head the
+wrong way.
+
+"""
+
+from typing import List
+
+import numpy as np
+
+from base.car import AbstractCar
+
+
+def cross(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Returns the z component of the cross product of rows of 2D vectors.
+
+    Args:
+        first (np.ndarray): An (n, 2) array of vectors.
+        second (np.ndarray): An (n, 2) array of vectors.
+
+    Returns:
+        np.ndarray: The n cross products.
+    """
+    return first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0]
+
+
+def crossing(start: np.ndarray, end: np.ndarray, gates: np.ndarray) -> np.ndarray:
+    """
+    Returns how each motion from start to end crosses its gate. A gate is
+    crossed forward when the motion passes from its left to its right, seen
+    from its first end, and backward the other way.
+
+    Args:
+        start (np.ndarray): An (n, 2) array of the points before the motions.
+        end (np.ndarray): An (n, 2) array of the points after the motions.
+        gates (np.ndarray): An (n, 2, 2) array of the ends of the gates.
+
+    Returns:
+        np.ndarray: 1 for a forward crossing, -1 for a backward one, 0 otherwise.
+    """
+    first, second = gates[:, 0], gates[:, 1]
+    before = cross(second - first, start - first) >= 0
+    after = cross(second - first, end - first) >= 0
+    motion = end - start
+    between = (cross(motion, first - start) >= 0) != (
+        cross(motion, second - start) >= 0
+    )
+    return (between & ~before & after).astype(int) - (between & before & ~after)
+
+
+def nearest_segments(points: np.ndarray, path: np.ndarray) -> np.ndarray:
+    """
+    Returns the segment of a closed path nearest to each point.
+
+    Args:
+        points (np.ndarray): An (n, 2) array of points.
+        path (np.ndarray): An (m, 2) array of the points of the path, the last
+        one joined to the first.
+
+    Returns:
+        np.ndarray: The n indices of the segments, segment i going from the
+        point i of the path to the next.
+    """
+    sides = np.roll(path, -1, axis=0) - path
+    offsets = points[:, None] - path
+    along = np.einsum("npk,pk->np", offsets, sides) / np.einsum(
+        "pk,pk->p", sides, sides
+    )
+    gaps = offsets - sides * np.clip(along, 0, 1)[..., None]
+    return np.einsum("npk,npk->np", gaps, gaps).argmin(axis=1)
+
+
+class RaceTracker:
+    """
+    Follows the progress of cars sharing a CarWorld through the checkpoint
+    gates, the finish line being the first gate. Each tick, the center of every
+    car is tested against the segments of the gate ahead of it and of the gate
+    behind it only, which costs a few arithmetic operations per car at any speed.
+
+    The progress of a car is the number of gates crossed forward minus those
+    crossed backward since the start, stored in its CarWorld row together with
+    its wrong way flag, so that both are saved and restored with the world.
+    Sector times are only kept for the race being driven, and are saved and
+    restored separately with state and restore.
+
+    Attributes:
+        gates: An instance variable holding the (gates, 2, 2) ends of the gates.
+        DIRECTION_CELL: A class variable representing the size in pixels of the
+        cells of the direction grid.
+        DIRECTION_MARGIN: A class variable representing how far around the path
+        the direction grid extends, in pixels.
+        directions: An instance variable holding, for every cell of a grid
+        around the path, the angle in degrees of a car heading along the segment
+        of the path nearest to the center of the cell.
+        sector_times: An instance variable holding, for every car, the ticks it
+        took to drive each sector of the race so far, one per unit of progress.
+        sector_start: An instance variable holding, for every car, the tick its
+        current sector started at.
+        order: An instance variable holding the numbers of the cars, the leader
+        first, as of the last ranking.
+        positions: An instance variable holding the race position of every car,
+        as of the last ranking.
+
+    Methods:
+        update(self, previous_poses: np.ndarray, tick: int) -> np.ndarray:
+            Advances the progress of the cars that crossed a gate during the tick.
+
+        init_directions(self, path: np.ndarray) -> None:
+            Precomputes the direction of the track over a grid around the path.
+
+        heading_wrong_way(self, centers: np.ndarray) -> np.ndarray:
+            Returns whether the cars head against the direction of the track.
+
+        laps(self) -> np.ndarray:
+            Returns the number of laps completed by every car.
+
+        wrong_way(self) -> np.ndarray:
+            Returns whether every car drives the wrong way.
+
+        splits(self, car: int) -> List[int]:
+            Returns the sector times of the current lap of a car.
+
+        last_splits(self, car: int) -> List[int]:
+            Returns the sector times of the last complete lap of a car.
+
+        rank(self, centers=None) -> None:
+            Orders the cars by race position.
+
+        standings(self) -> List[int]:
+            Returns the cars ordered by race position, as of the last ranking.
+
+        position(self, car: int) -> int:
+            Returns the race position of a car, from 1, as of the last ranking.
+
+        reset(self, tick: int) -> None:
+            Drops the sector times and starts timing the sectors at tick.
+
+        state(self) -> np.ndarray:
+            Returns the sector timing of every car as one array.
+
+        restore(self, state: np.ndarray) -> None:
+            Sets the sector timing of every car from an array returned by state.
+
+    """
+
+    DIRECTION_CELL = 8
+    DIRECTION_MARGIN = 64
+
+    def __init__(self, cars: List[AbstractCar], gates, path) -> None:
+        self.world = cars[0].world
+        if any(car.world is not self.world for car in cars):
+            raise ValueError("Cars must share a CarWorld")
+        self.index = np.array([car.index for car in cars], dtype=int)
+        self.half_sizes = np.array([car.img.get_size() for car in cars]) / 2
+        self.gates = np.array(gates, dtype=float).reshape((-1, 2, 2))
+        self.init_directions(np.array(path, dtype=float).reshape((-1, 2)))
+        self.sector_times = [[] for _ in cars]
+        self.sector_start = np.zeros(len(cars), dtype=int)
+        self.order, self.positions = [], [0] * len(cars)
+        self.rank()
+
+    def centers(self, poses: np.ndarray) -> np.ndarray:
+        """
+        Returns the centers of the cars at the given poses.
+
+        Args:
+            poses (np.ndarray): The (3, size) poses of the world's cars.
+
+        Returns:
+            np.ndarray: An (n, 2) array of centers, one row per car.
+        """
+        return poses[:2, self.index].T + self.half_sizes
+
+    def update(self, previous_poses: np.ndarray, tick: int) -> np.ndarray:
+        """
+        Advances the progress of the cars that crossed the gate ahead of them
+        during the tick and takes it back for those that crossed the gate behind
+        them, together with the time of the sector they reentered. Then flags the
+        cars heading the wrong way.
+
+        Args:
+            previous_poses (np.ndarray): The (3, size) poses of the world's cars
+            before the tick.
+            tick (int): The current tick, used to time the sectors.
+
+        Returns:
+            np.ndarray: Whether each car completed a lap during the tick.
+        """
+        start = self.centers(previous_poses)
+        end = self.centers(self.world.poses())
+        progress = self.world.progress[self.index]
+        count = len(self.gates)
+        # The gates ahead and behind are tested together, in one pass
+        gates = self.gates[np.concatenate([progress + 1, progress]) % count]
+        crossed = crossing(np.tile(start, (2, 1)), np.tile(end, (2, 1)), gates)
+        ahead, behind = crossed[: len(start)] == 1, crossed[len(start) :] == -1
+
+        # Only sectors started after the start of the race are timed
+        for car in np.flatnonzero(ahead | behind):
+            if ahead[car] and progress[car] >= 0:
+                self.sector_times[car].append(tick - int(self.sector_start[car]))
+                self.sector_start[car] = tick
+            elif behind[car] and progress[car] > 0:
+                self.sector_start[car] -= self.sector_times[car].pop()
+
+        progress = progress + ahead - behind
+        self.world.progress[self.index] = progress
+        self.world.wrong_way[self.index] = self.heading_wrong_way(end)
+        self.rank(end)
+        return ahead & (progress > 0) & (progress % count == 0)
+
+    def init_directions(self, path: np.ndarray) -> None:
+        """
+        Precomputes the direction of the track over a grid of DIRECTION_CELL
+        cells covering the path and DIRECTION_MARGIN pixels around it, so that
+        finding the direction at a car costs a lookup instead of a search of
+        the segments of the path.
+
+        Args:
+            path (np.ndarray): The (m, 2) points of a line along the track in the
+            driving direction, closed into a loop.
+
+        Returns:
+            None
+        """
+        cell = self.DIRECTION_CELL
+        self.grid_origin = path.min(axis=0) - self.DIRECTION_MARGIN
+        size = path.max(axis=0) + self.DIRECTION_MARGIN - self.grid_origin
+        columns, rows = np.ceil(size / cell).astype(int)
+        self.grid_limit = np.array([columns - 1, rows - 1])
+        x, y = np.meshgrid(np.arange(columns), np.arange(rows))
+        cells = np.stack([x.ravel(), y.ravel()], axis=1)
+        centers = self.grid_origin + (cells + 0.5) * cell
+        sides = np.roll(path, -1, axis=0) - path
+        # A car at angle a heads (-sin a, -cos a)
+        angles = np.degrees(np.arctan2(-sides[:, 0], -sides[:, 1]))
+        nearest = nearest_segments(centers, path)
+        self.directions = angles[nearest].reshape(rows, columns)
+
+    def heading_wrong_way(self, centers: np.ndarray) -> np.ndarray:
+        """
+        Returns whether the cars head against the direction of the track, given
+        by the segment of the path nearest to each car, more than 90 degrees
+        off. The gates alone cannot tell it, since the track can turn around
+        between two of them.
+
+        Args:
+            centers (np.ndarray): The current centers of the cars.
+
+        Returns:
+            np.ndarray: The flags, one per car.
+        """
+        cells = ((centers - self.grid_origin) // self.DIRECTION_CELL).astype(int)
+        np.maximum(cells, 0, out=cells)
+        np.minimum(cells, self.grid_limit, out=cells)
+        track = self.directions[cells[:, 1], cells[:, 0]]
+        difference = self.world.angle[self.index] - track
+        return np.abs(difference % 360 - 180) < 90
+
+    def laps(self) -> np.ndarray:
+        """
+        Returns the number of laps completed by every car.
+
+        Returns:
+            np.ndarray: The laps, one per car.
+        """
+        return np.maximum(self.world.progress[self.index], 0) // len(self.gates)
+
+    def wrong_way(self) -> np.ndarray:
+        """
+        Returns whether every car heads the wrong way, as of the last update.
+
+        Returns:
+            np.ndarray: The flags, one per car.
+        """
+        return self.world.wrong_way[self.index] != 0
+
+    def rank(self, centers=None) -> None:
+        """
+        Orders the cars by race position: by progress, then by distance to the
+        middle of the gate ahead of them. Called by update and reset, and after
+        the world was restored from a saved state.
+
+        Args:
+            centers (np.ndarray): The current centers of the cars, if known.
+
+        Returns:
+            None
+        """
+        if centers is None:
+            centers = self.centers(self.world.poses())
+        progress = self.world.progress[self.index]
+        ahead = self.gates[(progress + 1) % len(self.gates)].mean(axis=1)
+        remaining = np.hypot(*(ahead - centers).T)
+        self.order = np.lexsort((remaining, -progress)).tolist()
+        for position, car in enumerate(self.order, 1):
+            self.positions[car] = position
+
+    def standings(self) -> List[int]:
+        """
+        Returns the cars ordered by race position, as of the last ranking.
+
+        Returns:
+            List[int]: The numbers of the cars, the leader first.
+        """
+        return list(self.order)
+
+    def position(self, car: int) -> int:
+        """
+        Returns the race position of a car, from 1, as of the last ranking.
+
+        Args:
+            car (int): The number of the car, in the order given to the tracker.
+
+        Returns:
+            int: The position of the car.
+        """
+        return self.positions[car]
+
+    def splits(self, car: int) -> List[int]:
+        """
+        Returns the sector times of the current lap of a car.
+
+        Args:
+            car (int): The number of the car, in the order given to the tracker.
+
+        Returns:
+            List[int]: The ticks taken to drive each sector of the lap.
+        """
+        times = self.sector_times[car]
+        return times[len(times) - len(times) % len(self.gates) :]
+
+    def last_splits(self, car: int) -> List[int]:
+        """
+        Returns the sector times of the last complete lap of a car.
+
+        Args:
+            car (int): The number of the car, in the order given to the tracker.
+
+        Returns:
+            List[int]: The ticks taken to drive each sector of the lap, empty
+            before the first lap is completed.
+        """
+        times = self.sector_times[car]
+        end = len(times) - len(times) % len(self.gates)
+        return times[max(end - len(self.gates), 0) : end]
+
+    def reset(self, tick: int) -> None:
+        """
+        Drops the sector times and starts timing the sectors at tick.
+
+        Args:
+            tick (int): The tick the race starts at.
+
+        Returns:
+            None
+        """
+        self.sector_times = [[] for _ in self.sector_times]
+        self.sector_start[:] = tick
+        self.rank()
+
+    def state(self) -> np.ndarray:
+        """
+        Returns the sector timing of every car as one array: the ticks their
+        current sectors started at, then for every car the number of its sector
+        times followed by them.
+
+        Returns:
+            np.ndarray: The state, an array of integers.
+        """
+        parts = [self.sector_start]
+        for times in self.sector_times:
+            parts += [[len(times)], times]
+        return np.concatenate(parts).astype(int)
+
+    def restore(self, state: np.ndarray) -> None:
+        """
+        Sets the sector timing of every car from an array returned by state,
+        and ranks the cars.
+
+        Args:
+            state (np.ndarray): The state to restore.
+
+        Returns:
+            None
+        """
+        cars = len(self.sector_times)
+        self.sector_start[:] = state[:cars]
+        start = cars
+        for car in range(cars):
+            count = int(state[start])
+            self.sector_times[car] = state[start + 1 : start + 1 + count].tolist()
+            start += 1 + count
+        self.rank()
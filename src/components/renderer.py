@@ -0,0 +1,173 @@
+"""
+Module: renderer_module
+
+This module defines the renderers used by the RacingGame application to put
+the static track layers and the moving sprites on screen, the RendererType
+enumeration and the RendererFactory class.
+
+"""
+
+from enum import Enum
+from typing import List
+
+import pygame
+
+
+class Renderer:
+    """
+    Renders every static layer and updates the whole display each frame.
+
+    Methods:
+        __init__(self, window: pygame.Surface, layers: list):
+            Initializes a Renderer for the window and its (image, position) layers.
+
+        invalidate(self) -> None:
+            Forces the next frame to redraw and update the whole window.
+
+        begin_frame(self) -> None:
+            Restores the static layers before the sprites are drawn.
+
+        end_frame(self, rects: List[pygame.Rect]) -> None:
+            Pushes the frame to the display.
+
+    """
+
+    def __init__(self, window: pygame.Surface, layers: list) -> None:
+        self.window = window
+        self.layers = layers
+        self.full_redraw = True
+
+    def invalidate(self) -> None:
+        """
+        Forces the next frame to redraw and update the whole window.
+
+        Returns:
+            None
+        """
+        self.full_redraw = True
+
+    def begin_frame(self) -> None:
+        """
+        Restores the static layers before the sprites are drawn.
+
+        Returns:
+            None
+        """
+        for img, pos in self.layers:
+            self.window.blit(img, pos)
+
+    def end_frame(
+        self, rects: List[pygame.Rect]  # pylint: disable=unused-argument
+    ) -> None:
+        """
+        Pushes the frame to the display.
+
+        Args:
+            rects (List[pygame.Rect]): The areas drawn on top of the static layers.
+
+        Returns:
+            None
+        """
+        self.full_redraw = False
+        pygame.display.update()
+
+
+class DirtyRectRenderer(Renderer):
+    """
+    Composites the static layers once into a display-format background and
+    afterwards only restores and updates the areas covered by sprites.
+
+    Methods:
+        begin_frame(self) -> None:
+            Restores the background under the previous frame's sprites.
+
+        end_frame(self, rects: List[pygame.Rect]) -> None:
+            Updates the previous and the current sprite areas on the display.
+
+    """
+
+    def __init__(self, window: pygame.Surface, layers: list) -> None:
+        super().__init__(window, layers)
+        self.background = pygame.Surface(window.get_size()).convert()
+        for img, pos in layers:
+            self.background.blit(img, pos)
+        self.dirty_rects = []
+
+    def begin_frame(self) -> None:
+        """
+        Restores the background under the previous frame's sprites.
+
+        Returns:
+            None
+        """
+        if self.full_redraw:
+            self.window.blit(self.background, (0, 0))
+            return
+        for rect in self.dirty_rects:
+            self.window.blit(self.background, rect, rect)
+
+    def end_frame(self, rects: List[pygame.Rect]) -> None:
+        """
+        Updates the previous and the current sprite areas on the display.
+
+        Args:
+            rects (List[pygame.Rect]): The areas drawn on top of the background.
+
+        Returns:
+            None
+        """
+        if self.full_redraw:
+            pygame.display.update()
+        else:
+            pygame.display.update(self.dirty_rects + rects)
+        self.full_redraw = False
+        self.dirty_rects = rects
+
+
+class RendererType(Enum):
+    """
+    Enumeration representing the available rendering modes.
+
+    Values:
+        FULL: Redraw every layer and the whole display each frame.
+        DIRTY_RECT: Redraw only the areas under moving sprites and the HUD.
+    """
+
+    FULL = "full"
+    DIRTY_RECT = "dirty"
+
+
+# pylint: disable=too-few-public-methods
+class RendererFactory:
+    """
+    Factory class for creating renderers based on the specified RendererType.
+
+    Methods:
+        get_renderer(renderer_type, window, layers) -> Renderer:
+            Returns a renderer of the specified type.
+
+    """
+
+    @staticmethod
+    def get_renderer(
+        renderer_type: RendererType, window: pygame.Surface, layers: list
+    ) -> Renderer:
+        """
+        Returns a renderer of the specified type.
+
+        Args:
+            renderer_type (RendererType): The rendering mode.
+            window (pygame.Surface): The display surface.
+            layers (list): The static (image, position) layers, bottom first.
+
+        Returns:
+            Renderer: The renderer.
+
+        Raises:
+            ValueError: If the specified RendererType is unknown.
+        """
+        if renderer_type == RendererType.FULL:
+            return Renderer(window, layers)
+        if renderer_type == RendererType.DIRTY_RECT:
+            return DirtyRectRenderer(window, layers)
+        raise ValueError("Unknown Renderer Type")
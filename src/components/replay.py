@@ -0,0 +1,443 @@
+"""
+Module: replay_module
+
+This module defines a compact binary replay format recording the controls of
+every simulation tick and periodic keyframes of the game state, the
+ReplayRecorder writing it while the game is played, the Replay reading it back
+and the ReplayController feeding a replay into the simulation in place of the
+keyboard.
+
+"""
+
+import bisect
+import contextlib
+import functools
+import hashlib
+import struct
+
+import numpy as np
+
+from base.world import CarWorld
+from components.controls import Controls
+
+HEADER = struct.Struct("<4sHHH8s")
+RECORD = struct.Struct("<BII")
+STATE = struct.Struct("<IHBdH")
+INDEX_ENTRY = struct.Struct("<IQ")
+TRAILER = struct.Struct("<4sQ")
+MAGIC = b"RCRP"
+INDEX_MAGIC = b"RIDX"
+VERSION = 3
+INPUTS = 1
+KEYFRAME = 2
+INDEX = 3
+
+
+def path_hash(path) -> bytes:
+    """
+    Returns a short hash of a computer path, so that a replay is only played
+    against the path it was recorded with.
+
+    Args:
+        path: The (x, y) points of the path.
+
+    Returns:
+        bytes: The 8-byte hash.
+    """
+    points = [(float(x), float(y)) for x, y in path]
+    return hashlib.sha1(repr(points).encode()).digest()[:8]
+
+
+def pack_header(level: int, tick_rate: int, path) -> bytes:
+    """
+    Returns the header of a replay recorded in the given conditions.
+
+    Args:
+        level (int): The level the recording starts at.
+        tick_rate (int): The simulation rate.
+        path: The computer path.
+
+    Returns:
+        bytes: The packed header.
+    """
+    return HEADER.pack(MAGIC, VERSION, level, tick_rate, path_hash(path))
+
+
+def pack_state(state) -> bytes:
+    """
+    Returns the payload of a keyframe holding a state saved by the game.
+
+    Args:
+        state (tuple): The (ticks, game info state, world state, race state) of
+        the game.
+
+    Returns:
+        bytes: The packed state.
+    """
+    ticks, (level, started, level_start_time), world, race = state
+    header = STATE.pack(ticks, level, started, level_start_time, world.shape[1])
+    return header + world.astype("<f8").tobytes() + race.astype("<i8").tobytes()
+
+
+def unpack_state(payload: bytes):
+    """
+    Returns the state saved by the game from the payload of a keyframe.
+
+    Args:
+        payload (bytes): The payload of the keyframe.
+
+    Returns:
+        tuple: The (ticks, game info state, world state, race state) of the game.
+    """
+    ticks, level, started, level_start_time, cars = STATE.unpack_from(payload)
+    count = len(CarWorld.FIELDS) * cars
+    world = np.frombuffer(payload, "<f8", count, STATE.size)
+    world = world.reshape(len(CarWorld.FIELDS), cars)
+    race = np.frombuffer(payload, "<i8", offset=STATE.size + world.nbytes)
+    return ticks, (level, bool(started), level_start_time), world, race
+
+
+def read_index(stream):
+    """
+    Returns the keyframe index stored at the end of a replay file, which gives
+    the offset of every keyframe without reading the rest of the file.
+
+    Args:
+        stream: The seekable binary stream of the replay.
+
+    Returns:
+        list: The (tick, offset) of every keyframe, or None if the file has no index.
+    """
+    stream.seek(-TRAILER.size, 2)
+    magic, offset = TRAILER.unpack(stream.read(TRAILER.size))
+    if magic != INDEX_MAGIC:
+        return None
+    stream.seek(offset)
+    _, _, length = RECORD.unpack(stream.read(RECORD.size))
+    return list(INDEX_ENTRY.iter_unpack(stream.read(length)))
+
+
+def read_keyframe(stream, offset: int):
+    """
+    Returns the state saved in the keyframe at the given offset of a replay file.
+
+    Args:
+        stream: The seekable binary stream of the replay.
+        offset (int): The offset of the keyframe record, as found in the index.
+
+    Returns:
+        tuple: The (ticks, game info state, world state, race state) of the game.
+    """
+    stream.seek(offset)
+    _, _, length = RECORD.unpack(stream.read(RECORD.size))
+    return unpack_state(stream.read(length))
+
+
+class ReplayRecorder:
+    """
+    Wraps a controller and records the controls it returns into a replay stream.
+
+    File layout: a header (magic, version, level, tick rate, computer path hash),
+    then records of a kind, a first tick and a payload length. Input records
+    hold one byte of Controls flags per tick. Keyframe records hold the state of
+    the game before the inputs of their tick. On close, an index record lists the
+    tick and offset of every keyframe and a trailer gives the offset of the index.
+
+    Attributes:
+        CHUNK_TICKS: A class variable representing how many ticks are buffered
+        before they are written as one record.
+        KEYFRAME_INTERVAL: A class variable representing the default number of
+        ticks between two keyframes.
+
+    Methods:
+        poll(self) -> Controls:
+            Returns the controls of the wrapped controller and records them.
+
+        rewinding(self) -> bool:
+            Returns False, a recorded race cannot be rewound.
+
+        keyframe(self, tick: int, save_state) -> None:
+            Writes a keyframe of the state returned by save_state if one is due.
+
+        flush(self) -> None:
+            Writes the buffered ticks as one input record.
+
+        close(self) -> None:
+            Writes the buffered ticks and the keyframe index and closes the stream.
+
+    """
+
+    CHUNK_TICKS = 4096
+    KEYFRAME_INTERVAL = 600
+
+    def __init__(
+        self, controller, stream, header, keyframe_interval=KEYFRAME_INTERVAL
+    ) -> None:
+        self.controller = controller
+        self.stream = stream
+        self.keyframe_interval = keyframe_interval
+        self.buffer = bytearray(self.CHUNK_TICKS)
+        self.view = memoryview(self.buffer)
+        self.count = 0
+        self.tick = 0
+        self.keyframes = []
+        stream.write(header)
+        self.offset = len(header)
+
+    def poll(self) -> Controls:
+        """
+        Returns the controls of the wrapped controller and records them in the
+        preallocated buffer, writing it out when it is full.
+
+        Returns:
+            Controls: The controls of the tick.
+        """
+        controls = self.controller.poll()
+        self.buffer[self.count] = controls
+        self.count += 1
+        self.tick += 1
+        if self.count == len(self.buffer):
+            self.flush()
+        return controls
+
+    def rewinding(self) -> bool:
+        """
+        Returns False, a recorded race cannot be rewound since its replay would
+        no longer match the recorded inputs.
+
+        Returns:
+            bool: False.
+        """
+        return False
+
+    def flush(self) -> None:
+        """
+        Writes the buffered ticks as one input record.
+
+        Returns:
+            None
+        """
+        if self.count:
+            self._write(INPUTS, self.tick - self.count, self.view[: self.count])
+            self.count = 0
+        self.stream.flush()
+
+    def _write(self, kind: int, tick: int, payload) -> None:
+        self.stream.write(RECORD.pack(kind, tick, len(payload)))
+        self.stream.write(payload)
+        self.offset += RECORD.size + len(payload)
+
+    def keyframe(self, tick: int, save_state) -> None:
+        """
+        Writes a keyframe of the state returned by save_state if tick is a
+        multiple of the keyframe interval. The state is only saved when due.
+
+        Args:
+            tick (int): The number of ticks run, equal to the ticks recorded.
+            save_state: A callable returning the (ticks, game info state, world
+            state, race state) of the game.
+
+        Returns:
+            None
+        """
+        if tick % self.keyframe_interval:
+            return
+        self.flush()
+        self.keyframes.append((tick, self.offset))
+        self._write(KEYFRAME, tick, pack_state(save_state()))
+
+    def close(self) -> None:
+        """
+        Writes the buffered ticks and the keyframe index and closes the stream.
+
+        Returns:
+            None
+        """
+        self.flush()
+        index_offset = self.offset
+        entries = b"".join(INDEX_ENTRY.pack(*entry) for entry in self.keyframes)
+        self._write(INDEX, 0, entries)
+        self.stream.write(TRAILER.pack(INDEX_MAGIC, index_offset))
+        self.stream.close()
+
+
+class Replay:
+    """
+    A recorded race: the conditions it was recorded in and its controls.
+    Keyframes are located when the replay is read but only decoded on seek.
+
+    Attributes:
+        level: An instance variable representing the level the recording started at.
+        tick_rate: An instance variable representing the simulation rate.
+        path_hash: An instance variable representing the hash of the computer path.
+        inputs: An instance variable holding the Controls flags of every tick.
+        keyframes: An instance variable mapping the tick of every keyframe to the
+        offset of its record in the replay file.
+        keyframe_ticks: An instance variable holding the ticks of the keyframes
+        in ascending order.
+        reopen: An instance variable holding a callable returning the replay
+        stream as a context manager, used to decode keyframes.
+
+    Methods:
+        read(stream, reopen=None) -> Replay:
+            Reads a replay from a binary stream.
+
+        load(path: str) -> Replay:
+            Reads a replay from a file.
+
+        check(self, level, tick_rate, path) -> None:
+            Raises a ValueError if the replay cannot reproduce a race in this game.
+
+        keyframe_before(self, tick: int):
+            Returns the state of the last keyframe at or before the given tick.
+
+    """
+
+    def __init__(self, level, tick_rate, recorded_path_hash, inputs) -> None:
+        self.level = level
+        self.tick_rate = tick_rate
+        self.path_hash = recorded_path_hash
+        self.inputs = inputs
+        self.keyframes = {}
+        self.keyframe_ticks = []
+        self.reopen = None
+
+    @classmethod
+    def read(cls, stream, reopen=None):
+        """
+        Reads the inputs of a replay from a binary stream, up to its index if it
+        has one, and locates its keyframes without decoding them. The keyframes
+        come from the index when the file has one, otherwise from the records
+        skipped while reading. Records of unknown kinds are skipped.
+
+        Args:
+            stream: The seekable binary stream, positioned at the header.
+            reopen: A callable returning the stream again as a context manager
+            when a keyframe is decoded, the stream itself if None.
+
+        Returns:
+            Replay: The replay.
+
+        Raises:
+            ValueError: If the stream is not a replay or its records are out of order.
+        """
+        header = stream.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError("Not a replay file")
+        magic, version, level, tick_rate, recorded = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a replay file")
+        replay = cls(level, tick_rate, recorded, bytearray())
+        replay.reopen = reopen or (lambda: contextlib.nullcontext(stream))
+        index = read_index(stream)
+        stream.seek(HEADER.size)
+        record = stream.read(RECORD.size)
+        while len(record) == RECORD.size:
+            kind, first_tick, length = RECORD.unpack(record)
+            if kind == INDEX:
+                break
+            if kind == INPUTS:
+                if first_tick != len(replay.inputs):
+                    raise ValueError("Replay records out of order")
+                replay.inputs += stream.read(length)
+            else:
+                if kind == KEYFRAME and index is None:
+                    replay.keyframes[first_tick] = stream.tell() - RECORD.size
+                stream.seek(length, 1)
+            record = stream.read(RECORD.size)
+        replay.inputs = bytes(replay.inputs)
+        if index is not None:
+            replay.keyframes = dict(index)
+        replay.keyframe_ticks = sorted(replay.keyframes)
+        return replay
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Reads a replay from a file, which is opened again to decode keyframes.
+
+        Args:
+            path (str): The path of the replay file.
+
+        Returns:
+            Replay: The replay.
+        """
+        with open(path, "rb") as stream:
+            return cls.read(stream, functools.partial(open, path, "rb"))
+
+    def check(self, level, tick_rate, path) -> None:
+        """
+        Raises a ValueError if the replay cannot reproduce a race in this game.
+
+        Args:
+            level (int): The level the race starts at.
+            tick_rate (int): The simulation rate.
+            path: The computer path.
+
+        Returns:
+            None
+        """
+        if self.level != level:
+            raise ValueError("Replay was recorded at another level")
+        if self.tick_rate != tick_rate:
+            raise ValueError("Replay was recorded at another tick rate")
+        if self.path_hash != path_hash(path):
+            raise ValueError("Replay was recorded with another computer path")
+
+    def keyframe_before(self, tick: int):
+        """
+        Returns the state of the last keyframe at or before the given tick.
+
+        Args:
+            tick (int): The tick to seek to.
+
+        Returns:
+            tuple: The (ticks, game info state, world state, race state) of the
+            game, or None if no keyframe precedes the tick.
+        """
+        position = bisect.bisect_right(self.keyframe_ticks, tick)
+        if not position:
+            return None
+        offset = self.keyframes[self.keyframe_ticks[position - 1]]
+        with self.reopen() as stream:
+            return read_keyframe(stream, offset)
+
+
+class ReplayController:
+    """
+    Feeds the controls of a replay, one entry per simulation tick.
+
+    Methods:
+        poll(self) -> Controls:
+            Returns the controls of the next tick, or NONE once the replay has ended.
+
+        rewinding(self) -> bool:
+            Returns False, replays are scrubbed with RacingGame.seek instead.
+
+    """
+
+    def __init__(self, replay: Replay) -> None:
+        self.replay = replay
+        self.tick = 0
+
+    def poll(self) -> Controls:
+        """
+        Returns the controls of the next tick, or NONE once the replay has ended.
+
+        Returns:
+            Controls: The controls of the next tick.
+        """
+        if self.tick >= len(self.replay.inputs):
+            return Controls.NONE
+        controls = Controls(self.replay.inputs[self.tick])
+        self.tick += 1
+        return controls
+
+    def rewinding(self) -> bool:
+        """
+        Returns False, replays are scrubbed with RacingGame.seek instead.
+
+        Returns:
+            bool: False.
+        """
+        return False
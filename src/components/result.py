@@ -0,0 +1,91 @@
+"""
+Module: result_screen_module
+
+This module defines the ResultScreen class, which shows the outcome of a race:
+the result animation with its sound, then the result message for a while,
+advancing one frame at a time from the game loop.
+
+"""
+
+import pygame
+
+from components.animations import Animation, AnimationPlayer
+from utils.helper import blit_text_center
+
+
+class ResultScreen:
+    """
+    Shows the result animation with its sound, then the result message.
+
+    Attributes:
+        HOLD_TIME: A class variable representing how long the message is shown,
+        in seconds, once the animation has finished.
+
+    Methods:
+        update(self, dt: float) -> None:
+            Advances the screen by dt seconds.
+
+        finished(self) -> bool:
+            Returns whether the screen is over.
+
+        draw(self, win: pygame.Surface, font: pygame.font.Font) -> None:
+            Draws the screen if it changed since the previous call.
+
+    """
+
+    HOLD_TIME = 5.0
+
+    def __init__(self, animation: Animation, sound, message: str) -> None:
+        self.player = AnimationPlayer(animation)
+        self.sound = sound
+        self.message = message
+        self.hold = self.HOLD_TIME
+        self.drawn = None
+        sound.play()
+
+    def update(self, dt: float) -> None:
+        """
+        Advances the screen by dt seconds. The sound stops when the animation ends.
+
+        Args:
+            dt (float): The time elapsed since the previous update, in seconds.
+
+        Returns:
+            None
+        """
+        if self.player.finished():
+            self.hold -= dt
+            return
+        self.player.update(dt)
+        if self.player.finished():
+            self.sound.stop()
+
+    def finished(self) -> bool:
+        """
+        Returns whether the screen is over.
+
+        Returns:
+            bool: True once the message has been shown for HOLD_TIME.
+        """
+        return self.player.finished() and self.hold <= 0
+
+    def draw(self, win: pygame.Surface, font: pygame.font.Font) -> None:
+        """
+        Draws the screen if it changed since the previous call: the current frame,
+        and the message once the animation has finished.
+
+        Args:
+            win (pygame.Surface): The window surface.
+            font (pygame.font.Font): The font of the message.
+
+        Returns:
+            None
+        """
+        state = (self.player.frame_index, self.player.finished())
+        if state == self.drawn:
+            return
+        self.drawn = state
+        self.player.draw(win)
+        if self.player.finished():
+            blit_text_center(win, font, self.message)
+        pygame.display.update()
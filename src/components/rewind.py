@@ -0,0 +1,98 @@
+"""
+Module: rewind_module
+
+This module defines the RewindBuffer class, a fixed-size ring buffer of recent
+simulation states stored in preallocated NumPy arrays, which lets the player
+step the race backwards.
+
+"""
+
+import numpy as np
+
+
+class RewindBuffer:
+    """
+    Keeps the last capacity states of the simulation in preallocated arrays.
+    Saving a state copies the rows of the CarWorld into the next slot, so its
+    cost per tick is constant and its memory bounded. The slot also keeps the
+    sector timing of the RaceTracker, small and of varying length, as an array.
+
+    Attributes:
+        capacity: An instance variable representing the maximum number of states.
+        worlds: An instance variable holding the car states, one slot per state.
+        infos: An instance variable holding the ticks, level, started flag and
+        level start time of every state.
+        races: An instance variable holding the race state of every state.
+
+    Methods:
+        __len__(self) -> int:
+            Returns the number of states that can be rewound.
+
+        push(self, ticks: int, game_info_state: tuple, world, race) -> None:
+            Saves a state, overwriting the oldest one once the buffer is full.
+
+        pop(self):
+            Removes and returns the most recent state.
+
+        clear(self) -> None:
+            Drops every state.
+
+    """
+
+    def __init__(self, capacity: int, fields: int, cars: int) -> None:
+        self.capacity = capacity
+        self.worlds = np.empty((capacity, fields, cars))
+        self.infos = np.empty((capacity, 4))
+        self.races = [None] * capacity
+        self.head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(self, ticks: int, game_info_state: tuple, world, race) -> None:
+        """
+        Saves a state, overwriting the oldest one once the buffer is full.
+
+        Args:
+            ticks (int): The ticks run.
+            game_info_state (tuple): The (level, started, level_start_time) of the game.
+            world (CarWorld): The world holding the car states.
+            race (RaceTracker): The tracker timing the sectors of the race.
+
+        Returns:
+            None
+        """
+        world.state(out=self.worlds[self.head])
+        level, started, level_start_time = game_info_state
+        self.infos[self.head] = (ticks, level, started, level_start_time)
+        self.races[self.head] = race.state()
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def pop(self):
+        """
+        Removes and returns the most recent state. The world state is a view
+        into the buffer, valid until the next push.
+
+        Returns:
+            tuple: The (ticks, game info state, world state, race state) of the
+            simulation, or None if the buffer is empty.
+        """
+        if not self.count:
+            return None
+        self.head = (self.head - 1) % self.capacity
+        self.count -= 1
+        ticks, level, started, level_start_time = self.infos[self.head]
+        game_info_state = (int(level), bool(started), float(level_start_time))
+        world_state, race_state = self.worlds[self.head], self.races[self.head]
+        return int(ticks), game_info_state, world_state, race_state
+
+    def clear(self) -> None:
+        """
+        Drops every state.
+
+        Returns:
+            None
+        """
+        self.count = 0
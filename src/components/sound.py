@@ -0,0 +1,212 @@
+"""
+Module: sound_manager_module
+
+This module defines the SoundManager class, which caches the game's sounds,
+plays each category of sound on its own reserved mixer channel, loops the engine
+sound at a volume that follows the player's speed and drops repeated triggers.
+
+"""
+
+import time
+from enum import Enum
+
+import pygame
+
+from constants.sounds import SilentSound, SoundEnum, SoundFactory
+
+
+class SoundCategory(Enum):
+    """
+    Enumeration representing the categories of sound, each with its own channel.
+
+    Values:
+        ENGINE: The looping engine sound.
+        RESULT: The sounds played when a race is won or lost.
+    """
+
+    ENGINE = 0
+    RESULT = 1
+
+
+class SoundHandle:
+    """
+    A sound of the SoundManager usable wherever a pygame.mixer.Sound is expected.
+
+    Methods:
+        play(self) -> None:
+            Plays the sound on the channel of its category.
+
+        stop(self) -> None:
+            Stops the channel of its category.
+
+    """
+
+    def __init__(self, manager, sound_type: SoundEnum) -> None:
+        self.manager = manager
+        self.sound_type = sound_type
+
+    def play(self) -> None:
+        """
+        Plays the sound on the channel of its category.
+
+        Returns:
+            None
+        """
+        self.manager.play(self.sound_type)
+
+    def stop(self) -> None:
+        """
+        Stops the channel of its category.
+
+        Returns:
+            None
+        """
+        self.manager.stop(SoundManager.CATEGORIES[self.sound_type])
+
+
+class SoundManager:
+    """
+    Plays the game's sounds on reserved channels.
+
+    Attributes:
+        CATEGORIES: A class variable mapping each SoundEnum to its SoundCategory.
+        COOLDOWN: A class variable representing the minimum time, in seconds,
+        between two triggers of the same sound.
+        ENGINE_VOLUME: A class variable representing the (idle, full speed) volume
+        of the engine loop.
+        channels: An instance variable mapping each SoundCategory to its reserved
+        channel, empty when the sounds are disabled.
+
+    Methods:
+        get(self, sound_type: SoundEnum):
+            Returns the cached sound of the given type.
+
+        handle(self, sound_type: SoundEnum) -> SoundHandle:
+            Returns a handle that plays the sound on the channel of its category.
+
+        play(self, sound_type: SoundEnum, loops=0) -> bool:
+            Plays a sound unless it is already playing or was just triggered.
+
+        stop(self, category: SoundCategory) -> None:
+            Stops the channel of a category.
+
+        update_engine(self, vel: float, max_vel: float) -> None:
+            Loops the engine sound while the car moves, louder as it goes faster.
+
+    """
+
+    CATEGORIES = {
+        SoundEnum.ACCELERATION_SOUND: SoundCategory.ENGINE,
+        SoundEnum.WINNING_SOUND: SoundCategory.RESULT,
+        SoundEnum.LOSING_SOUND: SoundCategory.RESULT,
+    }
+    COOLDOWN = 0.1
+    ENGINE_VOLUME = (0.05, 0.2)
+
+    def __init__(
+        self, load=SoundFactory.get_sound, enabled=True, clock=time.perf_counter
+    ) -> None:
+        self.load = load
+        self.enabled = enabled
+        self.clock = clock
+        self.sounds = {}
+        self.triggered = {}
+        self.engine_volume = None
+        self.channels = {}
+        if enabled:
+            pygame.mixer.set_reserved(len(SoundCategory))
+            for category in SoundCategory:
+                self.channels[category] = pygame.mixer.Channel(category.value)
+
+    def get(self, sound_type: SoundEnum):
+        """
+        Returns the cached sound of the given type, loading it on first use.
+
+        Args:
+            sound_type (SoundEnum): The type of sound.
+
+        Returns:
+            pygame.mixer.Sound: The sound, or a SilentSound when disabled.
+        """
+        if not self.enabled:
+            return SilentSound()
+        if sound_type not in self.sounds:
+            self.sounds[sound_type] = self.load(sound_type)
+        return self.sounds[sound_type]
+
+    def handle(self, sound_type: SoundEnum) -> SoundHandle:
+        """
+        Returns a handle that plays the sound on the channel of its category.
+
+        Args:
+            sound_type (SoundEnum): The type of sound.
+
+        Returns:
+            SoundHandle: The handle of the sound.
+        """
+        return SoundHandle(self, sound_type)
+
+    def play(self, sound_type: SoundEnum, loops=0) -> bool:
+        """
+        Plays a sound on the channel of its category, unless it is already
+        playing there or was triggered less than COOLDOWN seconds ago.
+
+        Args:
+            sound_type (SoundEnum): The type of sound.
+            loops (int): How many times to repeat the sound, -1 to loop forever.
+
+        Returns:
+            bool: Whether the sound was started.
+        """
+        channel = self.channels.get(self.CATEGORIES[sound_type])
+        if channel is None:
+            return False
+        sound = self.get(sound_type)
+        now = self.clock()
+        last = self.triggered.get(sound_type, now - self.COOLDOWN)
+        if channel.get_sound() is sound or now - last < self.COOLDOWN:
+            return False
+        self.triggered[sound_type] = now
+        channel.play(sound, loops)
+        return True
+
+    def stop(self, category: SoundCategory) -> None:
+        """
+        Stops the channel of a category.
+
+        Args:
+            category (SoundCategory): The category to silence.
+
+        Returns:
+            None
+        """
+        channel = self.channels.get(category)
+        if channel is not None:
+            channel.stop()
+        if category == SoundCategory.ENGINE:
+            self.engine_volume = None
+
+    def update_engine(self, vel: float, max_vel: float) -> None:
+        """
+        Loops the engine sound while the car moves, its volume rising with the
+        speed. pygame cannot change the pitch of a playing sound, so only the
+        volume follows the speed. The channel is only touched when the volume
+        changes by a noticeable step.
+
+        Args:
+            vel (float): The velocity of the car.
+            max_vel (float): The maximum velocity of the car.
+
+        Returns:
+            None
+        """
+        if vel == 0:
+            if self.engine_volume is not None:
+                self.stop(SoundCategory.ENGINE)
+            return
+        idle, full = self.ENGINE_VOLUME
+        volume = round(idle + (full - idle) * min(abs(vel) / max_vel, 1), 2)
+        self.play(SoundEnum.ACCELERATION_SOUND, loops=-1)
+        if volume != self.engine_volume and SoundCategory.ENGINE in self.channels:
+            self.channels[SoundCategory.ENGINE].set_volume(volume)
+        self.engine_volume = volume
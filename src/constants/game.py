@@ -2,15 +2,73 @@
 Module: game_constants_module
 
 This module defines constants related to the RacingGame application,
-including the game's frames per second (FPS),
-the path for the computer race car to follow, and the position of the finish line.
+including the game's frames per second (FPS), the simulation, rendering and
+asset loading settings, the path for the computer race car to follow,
+and the position of the finish line.
 
 """
 
-# This is the game fps
+# This is the game fps, the tick rate the car speeds are tuned for
 GAME_FPS = 60
 
-# This is where the computer race car will follow
+# Ticks simulated per second, independently of the frames drawn per second
+SIMULATION_RATE = 60
+
+# Maximum frames drawn per second
+RENDER_FPS = GAME_FPS
+
+# How car rotations are cached: "lru" keeps the most recently used angles,
+# "prebaked" renders all 360 angles at startup
+ROTATION_CACHE_MODE = "lru"
+ROTATION_CACHE_SIZE = 64
+
+# How frames are drawn: "dirty" redraws only the areas under the cars and the HUD,
+# "full" redraws the whole window every frame
+RENDERER_MODE = "dirty"
+
+# Directory of the preprocessed asset cache, None to always decode the sources
+ASSET_CACHE_DIR = ".cache/assets"
+
+# Print how long each asset took to load at startup
+ASSET_TIMING_REPORT = False
+
+# Blink period of the start prompt in milliseconds, 0 shows it steadily
+# and lets the start screen sleep until an event arrives
+START_PROMPT_BLINK_MS = 0
+
+# Draw the numbers of the HUD from a pre-rendered glyph atlas
+HUD_GLYPH_ATLAS = False
+
+# How animation frames are kept in memory: "surfaces" keeps one surface per frame,
+# "atlas" packs the frames, cropped to their visible bounds, into a few sheets,
+# "compressed" keeps the encoded files and decodes frames just ahead of playback
+ANIMATION_STORAGE = "surfaces"
+
+# Bytes of decoded frames an animation may hold in "compressed" storage
+ANIMATION_MEMORY_BUDGET = 8 * 1024 * 1024
+
+# File the player's controls are recorded to, None to not record races
+REPLAY_RECORD_PATH = None
+
+# Ticks between two keyframes of a recorded race, the most a seek re-simulates
+REPLAY_KEYFRAME_INTERVAL = 10 * SIMULATION_RATE
+
+# Time the phases of the game loop, showing them on screen with F3 and writing
+# them to PROFILER_DUMP_PATH on exit
+PROFILER_ENABLED = False
+PROFILER_DUMP_PATH = ".cache/profile.json"
+
+# Seconds of the race kept to rewind while R is held
+REWIND_SECONDS = 5
+
+# Largest distance in pixels a car moves between two collision checks; moves
+# longer than this within a tick are sub-stepped. Keep it below half the
+# thinnest wall of the track border, about 9 pixels, so that a car is always
+# caught on the near side of a wall
+COLLISION_STEP = 4
+
+# This is where the computer race car will follow, which also gives the
+# direction of the track to warn the player driving the wrong way
 COMPUTER_PATH = [
     (649, 166),
     (603, 113),
@@ -35,3 +93,18 @@ COMPUTER_PATH = [
 
 # This is where the finish line in the game will be
 FINISH_POSITION = (600, 380)
+
+# The checkpoint gates of the track in the order they are driven through, the
+# finish line first. Each gate is a segment from one wall to the other, crossed
+# forward when a car passes from its left to its right, seen from its first end
+CHECKPOINT_GATES = [
+    ((700, 390), (600, 390)),
+    ((501, 233), (591, 238)),
+    ((362, 64), (362, 152)),
+    ((219, 208), (133, 184)),
+    ((311, 479), (317, 379)),
+    ((699, 514), (610, 516)),
+]
+
+# Laps a car has to drive to finish a level
+RACE_LAPS = 1
@@ -10,7 +10,11 @@ from enum import Enum
 
 import pygame
 
+from constants.game import ASSET_CACHE_DIR
+from utils.asset_cache import AssetCache
+from utils.distance_field import DistanceField
 from utils.helper import scale_image
+from utils.masks import MASK_REGISTRY
 
 
 class ImageEnum(Enum):
@@ -39,15 +43,37 @@ class ImageFactory:
     Factory class for loading and obtaining scaled image objects based on the specified
     ImageEnum type.
 
+    Loaded images are memoized by type and scale. Once a display exists, each image
+    is converted to the display pixel format: images with per-pixel alpha through
+    convert_alpha, opaque ones through convert. With ASSET_CACHE_DIR set, scaled
+    images and their collision masks are read from the on-disk asset cache, and
+    the masks are registered in the MASK_REGISTRY. Distance fields are memoized the
+    same way and, with ASSET_CACHE_DIR set, stored in the asset cache as well.
+
     Methods:
         get_image_scale(image_type: ImageEnum):
             Returns the scale factor for a specific image type.
 
-        get_image(image_type: ImageEnum):
+        get_image(image_type: ImageEnum, scale: float = None):
             Obtains a scaled image object based on the specified ImageEnum type.
 
+        load_image(image_type: ImageEnum, scale: float):
+            Loads and scales an image, through the on-disk asset cache if enabled.
+
+        convert_image(image: pygame.Surface):
+            Converts an image to the display pixel format if a display exists.
+
+        get_distance_field(image_type: ImageEnum) -> DistanceField:
+            Obtains the signed distance field of the pixels of an image.
+
+        clear():
+            Drops every memoized image and distance field.
+
     """
 
+    _cache = {}
+    _fields = {}
+
     @staticmethod
     def get_image_scale(image_type: ImageEnum):
         """
@@ -70,16 +96,111 @@ class ImageFactory:
 
         return 0.55
 
-    @staticmethod
-    def get_image(image_type: ImageEnum):
+    @classmethod
+    def get_image(cls, image_type: ImageEnum, scale: float = None):
         """
         Obtains a scaled image object based on the specified ImageEnum type.
 
         Args:
             image_type (ImageEnum): The type of image to obtain.
+            scale (float): The scale factor, defaults to get_image_scale(image_type).
 
         Returns:
             pygame.Surface: The obtained scaled image object.
         """
-        scale = ImageFactory.get_image_scale(image_type)
-        return scale_image(pygame.image.load(image_type.value), scale)
+        if scale is None:
+            scale = cls.get_image_scale(image_type)
+        image, converted, mask = cls._cache.get(
+            (image_type, scale), (None, False, None)
+        )
+        if image is None:
+            image, mask = cls.load_image(image_type, scale)
+        if not converted:
+            image = cls.convert_image(image)
+            converted = pygame.display.get_surface() is not None
+            cls._cache[(image_type, scale)] = (image, converted, mask)
+            if mask is not None:
+                MASK_REGISTRY.put(image, mask)
+        return image
+
+    @staticmethod
+    def load_image(image_type: ImageEnum, scale: float):
+        """
+        Loads and scales an image, through the on-disk asset cache if enabled.
+
+        Args:
+            image_type (ImageEnum): The type of image to load.
+            scale (float): The scale factor.
+
+        Returns:
+            tuple: The scaled image and its collision mask, None without the cache.
+        """
+        if ASSET_CACHE_DIR is None:
+            return scale_image(pygame.image.load(image_type.value), scale), None
+        cache = AssetCache(ASSET_CACHE_DIR)
+        cached = cache.load_image(image_type.value, scale)
+        if cached is None:
+            image = scale_image(pygame.image.load(image_type.value), scale)
+            cached = cache.store_image(image_type.value, scale, image)
+        return cached
+
+    @staticmethod
+    def convert_image(image: pygame.Surface):
+        """
+        Converts an image to the display pixel format if a display exists.
+
+        Args:
+            image (pygame.Surface): The image to convert.
+
+        Returns:
+            pygame.Surface: The converted image, or the image itself without a display.
+        """
+        if pygame.display.get_surface() is None:
+            return image
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+
+    @classmethod
+    def get_distance_field(cls, image_type: ImageEnum) -> DistanceField:
+        """
+        Obtains the signed distance field of the pixels of an image at its
+        default scale, computed from its collision mask on first use. The
+        distances are rounded to float16, as stored in the asset cache, whether
+        or not they were read from it, so that the simulation does not depend on
+        the state of the cache.
+
+        Args:
+            image_type (ImageEnum): The type of image, e.g. the track border.
+
+        Returns:
+            DistanceField: The distance field of the image.
+        """
+        field = cls._fields.get(image_type)
+        if field is not None:
+            return field
+        scale = cls.get_image_scale(image_type)
+        cache, distance = None, None
+        if ASSET_CACHE_DIR is not None:
+            cache = AssetCache(ASSET_CACHE_DIR)
+            distance = cache.load_array(image_type.value, scale, "sdf")
+        if distance is None:
+            image = cls.get_image(image_type, scale)
+            mask = MASK_REGISTRY.get(image)
+            distance = DistanceField.from_mask(mask).distance.astype("float16")
+            if cache is not None:
+                cache.store_array(image_type.value, scale, "sdf", distance)
+        field = DistanceField(distance)
+        cls._fields[image_type] = field
+        return field
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every memoized image and distance field.
+
+        Returns:
+            None
+        """
+        cls._cache.clear()
+        cls._fields.clear()
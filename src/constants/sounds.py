@@ -1,8 +1,8 @@
 """
 Module: sound_module
 
-This module defines a SoundEnum enumeration and a SoundFactory class for managing
-and loading sound assets in the RacingGame application.
+This module defines a SoundEnum enumeration, a SilentSound class and a SoundFactory
+class for managing and loading sound assets in the RacingGame application.
 
 """
 
@@ -26,6 +26,51 @@ class SoundEnum(Enum):
     LOSING_SOUND = "src/assets/sounds/losing.mp3"
 
 
+class SilentSound:
+    """
+    A sound that plays nothing, used in place of pygame.mixer.Sound when the game
+    runs without audio.
+
+    Methods:
+        play(*args, **kwargs) -> None:
+            Does nothing.
+
+        stop() -> None:
+            Does nothing.
+
+        set_volume(value: float) -> None:
+            Does nothing.
+
+    """
+
+    def play(self, *args, **kwargs) -> None:
+        """
+        Does nothing.
+
+        Returns:
+            None
+        """
+
+    def stop(self) -> None:
+        """
+        Does nothing.
+
+        Returns:
+            None
+        """
+
+    def set_volume(self, value: float) -> None:
+        """
+        Does nothing.
+
+        Args:
+            value (float): The ignored volume.
+
+        Returns:
+            None
+        """
+
+
 class SoundFactory:
     """
     Factory class for loading and obtaining sound objects based on the specified SoundEnum type.
@@ -0,0 +1,24 @@
+"""
+Module: replay_game_module
+
+This module replays a recorded race without drawing it and prints its outcome,
+so that recordings can be checked against the current simulation.
+
+"""
+
+import sys
+from os import environ
+
+from components.game import RacingGame
+from components.replay import Replay, ReplayController
+from constants.game import COMPUTER_PATH, SIMULATION_RATE
+
+# Hide Pygame support prompt
+environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+if __name__ == "__main__":
+    replay = Replay.load(sys.argv[1])
+    game = RacingGame(headless=True, controller=ReplayController(replay))
+    replay.check(game.game_info.level, SIMULATION_RATE, COMPUTER_PATH)
+    result = game.run_headless()
+    print(f"{result.name if result else 'UNFINISHED'} after {game.ticks} ticks")
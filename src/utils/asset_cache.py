@@ -0,0 +1,245 @@
+"""
+Module: asset_cache_module
+
+This module provides the AssetCache class, an on-disk cache of preprocessed
+images. Each cached image is one file holding its scaled raw pixels and its
+packed collision mask, named after a hash of the source file and the scale, so
+that loading it only maps bytes into a surface instead of decoding and scaling.
+
+"""
+
+import contextlib
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+import pygame
+
+HEADER = struct.Struct("<4sHHII4sI")
+MAGIC = b"RCAC"
+VERSION = 1
+
+
+class AssetCache:
+    """
+    Stores and loads preprocessed images in a cache directory.
+
+    File layout: a header (magic, version, width, height, pixel format, mask
+    offset), the raw pixels in that format, then the mask packed eight pixels
+    per byte, row by row.
+
+    Arrays derived from an image, such as its distance field, are cached next to
+    it as .npy files. Files are written to a unique temporary file first and
+    renamed into place, so that concurrent writers never expose a partial file,
+    and an entry that fails to validate is deleted and treated as a miss.
+
+    Methods:
+        path_for(self, src: str, scale: float, suffix=".bin") -> str:
+            Returns the cache file of the source image at the given scale.
+
+        load_image(self, src: str, scale: float):
+            Returns the cached (surface, mask) of the image, or None on a miss.
+
+        store_image(self, src: str, scale: float, surface: pygame.Surface):
+            Writes the image and its mask to the cache and returns them.
+
+        load_array(self, src: str, scale: float, name: str):
+            Returns a cached array derived from the image, or None on a miss.
+
+        store_array(self, src: str, scale: float, name: str, array: np.ndarray):
+            Writes an array derived from the image to the cache.
+
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def path_for(self, src: str, scale: float, suffix=".bin") -> str:
+        """
+        Returns the cache file of the source image at the given scale. The name
+        changes whenever the content of the source file or the scale changes.
+
+        Args:
+            src (str): The path of the source image.
+            scale (float): The scale factor applied to the image.
+            suffix (str): The end of the file name, after the hash.
+
+        Returns:
+            str: The path of the cache file.
+        """
+        digest = hashlib.sha1(f"{VERSION}:{scale!r}:".encode())
+        with open(src, "rb") as source:
+            digest.update(source.read())
+        stem = os.path.splitext(os.path.basename(src))[0]
+        return os.path.join(self.directory, f"{stem}-{digest.hexdigest()[:16]}{suffix}")
+
+    def load_image(self, src: str, scale: float):
+        """
+        Returns the cached (surface, mask) of the image, or None on a miss. The
+        surface reads its pixels straight from the memory-mapped cache file.
+
+        Args:
+            src (str): The path of the source image.
+            scale (float): The scale factor applied to the image.
+
+        Returns:
+            tuple: The (pygame.Surface, pygame.mask.Mask) pair, or None.
+        """
+        path = self.path_for(src, scale)
+        if not os.path.exists(path):
+            return None
+        if os.path.getsize(path) < HEADER.size:
+            discard(path)
+            return None
+        with open(path, "rb") as cached:
+            data = mmap.mmap(cached.fileno(), 0, access=mmap.ACCESS_READ)
+        layout = validate(data)
+        if layout is None:
+            data.close()
+            discard(path)
+            return None
+        width, height, fmt, mask_offset = layout
+        pixels = memoryview(data)[HEADER.size : mask_offset]
+        surface = pygame.image.frombuffer(pixels, (width, height), fmt)
+        bits = np.frombuffer(data, np.uint8, offset=mask_offset)
+        return surface, unpack_mask(bits, (width, height))
+
+    def store_image(self, src: str, scale: float, surface: pygame.Surface):
+        """
+        Writes the image and its mask to the cache and returns them.
+
+        Args:
+            src (str): The path of the source image.
+            scale (float): The scale factor applied to the image.
+            surface (pygame.Surface): The scaled image.
+
+        Returns:
+            tuple: The (pygame.Surface, pygame.mask.Mask) pair.
+        """
+        fmt = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+        pixels = pygame.image.tobytes(surface, fmt)
+        width, height = surface.get_size()
+        if fmt == "RGBA":
+            alpha = np.frombuffer(pixels, np.uint8).reshape(height, width, 4)[..., 3]
+            bits = alpha > 127
+        else:
+            bits = np.ones((height, width), bool)
+        mask_offset = HEADER.size + len(pixels)
+        header = HEADER.pack(
+            MAGIC, VERSION, 0, width, height, fmt.encode(), mask_offset
+        )
+        with self._replace(self.path_for(src, scale)) as cached:
+            cached.write(header + pixels + np.packbits(bits).tobytes())
+        return surface, unpack_mask(np.packbits(bits), (width, height))
+
+    def load_array(self, src: str, scale: float, name: str):
+        """
+        Returns a cached array derived from the image, or None on a miss.
+
+        Args:
+            src (str): The path of the source image.
+            scale (float): The scale factor applied to the image.
+            name (str): The name of the array, e.g. "sdf".
+
+        Returns:
+            np.ndarray: The array, or None.
+        """
+        path = self.path_for(src, scale, f"-{name}.npy")
+        if not os.path.exists(path):
+            return None
+        try:
+            return np.load(path)
+        except (OSError, ValueError, EOFError):
+            discard(path)
+            return None
+
+    def store_array(self, src: str, scale: float, name: str, array: np.ndarray):
+        """
+        Writes an array derived from the image to the cache.
+
+        Args:
+            src (str): The path of the source image.
+            scale (float): The scale factor applied to the image.
+            name (str): The name of the array, e.g. "sdf".
+            array (np.ndarray): The array.
+
+        Returns:
+            None
+        """
+        with self._replace(self.path_for(src, scale, f"-{name}.npy")) as cached:
+            np.save(cached, array)
+
+    @contextlib.contextmanager
+    def _replace(self, path: str):
+        # Each writer gets its own temporary file, renamed over path once complete
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as temporary:
+            try:
+                yield temporary
+            except BaseException:
+                temporary.close()
+                discard(temporary.name)
+                raise
+        os.replace(temporary.name, path)
+
+
+def validate(data) -> tuple:
+    """
+    Checks the header of a cached image against the size of its file.
+
+    Args:
+        data: The content of the cache file.
+
+    Returns:
+        tuple: The (width, height, pixel format, mask offset) of the image, or
+        None if the file is not a complete image of this version of the cache.
+    """
+    magic, version, _, width, height, fmt, mask_offset = HEADER.unpack_from(data)
+    fmt = fmt.rstrip(b"\0")
+    if magic != MAGIC or version != VERSION or fmt not in (b"RGB", b"RGBA"):
+        return None
+    pixels = width * height
+    if mask_offset != HEADER.size + pixels * len(fmt):
+        return None
+    if len(data) != mask_offset + (pixels + 7) // 8:
+        return None
+    return width, height, fmt.decode(), mask_offset
+
+
+def discard(path: str) -> None:
+    """
+    Deletes a cache file, ignoring a file already deleted by another process.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        None
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def unpack_mask(bits: np.ndarray, size) -> pygame.mask.Mask:
+    """
+    Builds a collision mask from bits packed eight pixels per byte, row by row.
+
+    Args:
+        bits (np.ndarray): The packed bits.
+        size (tuple): The (width, height) of the mask.
+
+    Returns:
+        pygame.mask.Mask: The mask.
+    """
+    width, height = size
+    pixels = np.unpackbits(bits, count=width * height).reshape(height, width)
+    surface = pygame.surfarray.make_surface(pixels.T)
+    surface.set_colorkey(0)
+    return pygame.mask.from_surface(surface)
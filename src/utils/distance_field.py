@@ -0,0 +1,206 @@
+"""
+Module: distance_field_module
+
+This module provides the DistanceField class, a signed distance field of the
+walls of a mask with its gradient, so that the distance to the nearest wall and
+the wall normal at any point are single array lookups. Fields are computed with
+the jump flooding algorithm in NumPy.
+
+"""
+
+import numpy as np
+import pygame
+
+from utils.sweep import sweep_fractions
+
+FAR = 1e6
+
+
+def jump_flood(seeds: np.ndarray) -> np.ndarray:
+    """
+    Returns the distance from every pixel to the nearest seed pixel, computed
+    with the jump flooding algorithm: each pass lets every pixel adopt the
+    nearest seed known by its neighbours at a step that halves each pass.
+
+    Args:
+        seeds (np.ndarray): A (height, width) boolean array of the seed pixels.
+
+    Returns:
+        np.ndarray: The (height, width) distances, FAR if there is no seed.
+    """
+    height, width = seeds.shape
+    rows, cols = np.indices((height, width), np.float32)
+    nearest = np.full((2, height, width), FAR, np.float32)
+    nearest[0][seeds], nearest[1][seeds] = rows[seeds], cols[seeds]
+    best = np.where(seeds, 0, np.inf).astype(np.float32)
+    step = 1 << (max(height, width).bit_length() - 1)
+    while step >= 1:
+        for d_row in (-step, 0, step):
+            for d_col in (-step, 0, step):
+                if (d_row or d_col) and abs(d_row) < height and abs(d_col) < width:
+                    candidate = _shift(nearest, d_row, d_col)
+                    distance = (candidate[0] - rows) ** 2 + (candidate[1] - cols) ** 2
+                    better = distance < best
+                    best[better] = distance[better]
+                    nearest[:, better] = candidate[:, better]
+        step //= 2
+    return np.sqrt(np.minimum(best, FAR))
+
+
+def _shift(nearest: np.ndarray, d_row: int, d_col: int) -> np.ndarray:
+    height, width = nearest.shape[1:]
+    shifted = np.full_like(nearest, FAR)
+    src_rows = slice(max(d_row, 0), height + min(d_row, 0))
+    dst_rows = slice(max(-d_row, 0), height + min(-d_row, 0))
+    src_cols = slice(max(d_col, 0), width + min(d_col, 0))
+    dst_cols = slice(max(-d_col, 0), width + min(-d_col, 0))
+    shifted[:, dst_rows, dst_cols] = nearest[:, src_rows, src_cols]
+    return shifted
+
+
+def signed_distance(walls: np.ndarray) -> np.ndarray:
+    """
+    Returns the signed distance from every pixel to the edge of the walls:
+    positive outside the walls, negative inside, about zero on their edge.
+
+    Args:
+        walls (np.ndarray): A (height, width) boolean array of the wall pixels.
+
+    Returns:
+        np.ndarray: The (height, width) signed distances in pixels.
+    """
+    outside = jump_flood(walls) - 0.5
+    inside = jump_flood(~walls) - 0.5
+    return np.where(walls, -inside, outside).astype(np.float32)
+
+
+class DistanceField:
+    """
+    A signed distance field of walls with its normalized gradient.
+
+    Attributes:
+        distance: An instance variable holding the (height, width) signed
+        distances, positive away from the walls.
+        normals: An instance variable holding the (height, width, 2) unit vectors
+        pointing away from the nearest wall.
+        bounds: An instance variable holding the largest (x, y) pixel of the field.
+
+    Methods:
+        from_mask(mask: pygame.mask.Mask) -> DistanceField:
+            Computes the distance field of the set pixels of a mask.
+
+        sample(self, points: np.ndarray) -> np.ndarray:
+            Returns the signed distance to the walls at each point.
+
+        normal(self, x: float, y: float) -> np.ndarray:
+            Returns the unit vector pointing away from the nearest wall at a point.
+
+        contact(self, points: np.ndarray):
+            Returns the normal and depth of the deepest point inside a wall.
+
+        sweep(self, start: np.ndarray, end: np.ndarray, step: float):
+            Returns the first contact of points moving from start to end.
+
+    """
+
+    def __init__(self, distance: np.ndarray) -> None:
+        self.distance = distance.astype(np.float32)
+        self.bounds = (self.distance.shape[1] - 1, self.distance.shape[0] - 1)
+        d_y, d_x = np.gradient(self.distance)
+        length = np.hypot(d_x, d_y)
+        length[length == 0] = 1
+        self.normals = np.stack([d_x / length, d_y / length], axis=-1)
+
+    @classmethod
+    def from_mask(cls, mask: pygame.mask.Mask):
+        """
+        Computes the distance field of the set pixels of a mask.
+
+        Args:
+            mask (pygame.mask.Mask): The mask of the walls.
+
+        Returns:
+            DistanceField: The distance field.
+        """
+        walls = pygame.surfarray.array_red(mask.to_surface()).T > 0
+        return cls(signed_distance(walls))
+
+    def _index(self, points: np.ndarray):
+        # np.clip is slow on the few points of a car, the ufuncs are not
+        indices = np.asarray(points).astype(np.intp)
+        np.maximum(indices, 0, out=indices)
+        np.minimum(indices, self.bounds, out=indices)
+        return indices[..., 1], indices[..., 0]
+
+    def sample(self, points: np.ndarray) -> np.ndarray:
+        """
+        Returns the signed distance to the walls at each point, taken from the
+        pixel under it. Points off the field use its nearest edge pixel.
+
+        Args:
+            points (np.ndarray): An (n, 2) array of (x, y) points.
+
+        Returns:
+            np.ndarray: The n distances.
+        """
+        return self.distance[self._index(points)]
+
+    def normal(self, x: float, y: float) -> np.ndarray:
+        """
+        Returns the unit vector pointing away from the nearest wall at a point.
+
+        Args:
+            x (float): The x-coordinate of the point.
+            y (float): The y-coordinate of the point.
+
+        Returns:
+            np.ndarray: The (x, y) normal.
+        """
+        return self.normals[self._index((x, y))]
+
+    def contact(self, points: np.ndarray):
+        """
+        Returns the normal and depth of the deepest point inside a wall.
+
+        Args:
+            points (np.ndarray): An (n, 2) array of (x, y) points, e.g. the
+            outline of a car.
+
+        Returns:
+            tuple: The (normal, depth) of the contact, or None if every point is
+            outside the walls.
+        """
+        distances = self.sample(points)
+        deepest = int(distances.argmin())
+        if distances[deepest] >= 0:
+            return None
+        return self.normal(*points[deepest]), float(-distances[deepest])
+
+    def sweep(self, start: np.ndarray, end: np.ndarray, step: float):
+        """
+        Returns the first contact of points moving in straight lines from start
+        to end. The motion is sampled every step pixels, in a single lookup, so
+        that it is caught on the near side of walls thicker than twice step; a
+        slow motion is only sampled at its end.
+
+        Args:
+            start (np.ndarray): An (n, 2) array of the (x, y) points before the motion.
+            end (np.ndarray): An (n, 2) array of the (x, y) points after the motion.
+            step (float): The largest distance between two samples, in pixels.
+
+        Returns:
+            tuple: The (fraction, normal, depth) of the first sample with a point
+            inside the walls, fraction being 1 at end, or None without contact.
+        """
+        motion = end - start
+        distance = float(np.sqrt((motion**2).sum(axis=-1).max()))
+        fractions = sweep_fractions(distance, step)
+        points = start + motion * fractions[:, None, None]
+        distances = self.sample(points)
+        touching = distances.min(axis=1) < 0
+        if not touching.any():
+            return None
+        first = int(touching.argmax())
+        deepest = int(distances[first].argmin())
+        normal = self.normal(*points[first, deepest])
+        return float(fractions[first]), normal, float(-distances[first, deepest])
@@ -9,6 +9,8 @@ and rendering centered text.
 
 import pygame
 
+from utils.rotation import ROTATION_CACHES
+
 pygame.font.init()
 
 
@@ -30,6 +32,7 @@ def scale_image(img: pygame.Surface, factor: float) -> pygame.Surface:
 def blit_rotate_center(win, image, top_left, angle):
     """
     Blits and rotates an image around its center on the specified window.
+    Rotations are taken from the image's rotation cache.
 
     Args:
         win: The Pygame window surface.
@@ -38,11 +41,11 @@ def blit_rotate_center(win, image, top_left, angle):
         angle: The rotation angle.
 
     Returns:
-        None
+        pygame.Rect: The area of the window that was drawn.
     """
-    rotated_image = pygame.transform.rotate(image, angle)
-    new_rect = rotated_image.get_rect(center=image.get_rect(topleft=top_left).center)
-    win.blit(rotated_image, new_rect.topleft)
+    sprite = ROTATION_CACHES.get(image).get(angle)
+    x, y = int(top_left[0]), int(top_left[1])
+    return win.blit(sprite.image, (x + sprite.offset[0], y + sprite.offset[1]))
 
 
 def blit_text_center(win, font, text):
@@ -55,11 +58,11 @@ def blit_text_center(win, font, text):
         text (str): The text to be rendered.
 
     Returns:
-        None
+        pygame.Rect: The area covered by the text, or None if it was not rendered.
     """
     try:
         render = font.render(text, 1, (200, 200, 200))
-        win.blit(
+        return win.blit(
             render,
             (
                 win.get_width() / 2 - render.get_width() / 2,
@@ -68,3 +71,4 @@ def blit_text_center(win, font, text):
         )
     except pygame.error as e:
         print(e)
+        return None
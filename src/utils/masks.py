@@ -0,0 +1,75 @@
+"""
+Module: mask_registry_module
+
+This module provides the MaskRegistry class, a cache of Pygame collision masks
+keyed by the surface they were extracted from, so that masks are built once
+instead of on every collision check.
+
+"""
+
+import pygame
+
+
+class MaskRegistry:
+    """
+    Caches collision masks for surfaces.
+
+    Masks are keyed by the identity of the surface they were built from. The
+    surface itself is kept alongside the mask so that its id cannot be reused
+    by another surface while the entry is alive.
+
+    Methods:
+        get(surface: pygame.Surface) -> pygame.mask.Mask:
+            Returns the cached mask for the surface, building it if needed.
+
+        put(surface: pygame.Surface, mask: pygame.mask.Mask) -> None:
+            Registers a mask built elsewhere, e.g. loaded from the asset cache.
+
+        clear() -> None:
+            Drops every cached mask.
+
+    """
+
+    def __init__(self) -> None:
+        self._masks = {}
+
+    def get(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """
+        Returns the cached mask for the surface, building it if needed.
+
+        Args:
+            surface (pygame.Surface): The surface to extract the mask from.
+
+        Returns:
+            pygame.mask.Mask: The collision mask of the surface.
+        """
+        entry = self._masks.get(id(surface))
+        if entry is None or entry[0] is not surface:
+            entry = (surface, pygame.mask.from_surface(surface))
+            self._masks[id(surface)] = entry
+        return entry[1]
+
+    def put(self, surface: pygame.Surface, mask: pygame.mask.Mask) -> None:
+        """
+        Registers a mask built elsewhere, e.g. loaded from the asset cache.
+
+        Args:
+            surface (pygame.Surface): The surface the mask belongs to.
+            mask (pygame.mask.Mask): The collision mask of the surface.
+
+        Returns:
+            None
+        """
+        self._masks[id(surface)] = (surface, mask)
+
+    def clear(self) -> None:
+        """
+        Drops every cached mask.
+
+        Returns:
+            None
+        """
+        self._masks.clear()
+
+
+MASK_REGISTRY = MaskRegistry()
@@ -0,0 +1,142 @@
+"""
+Module: rotation_cache_module
+
+This module provides caches of pre-rotated sprites. Angles are quantized to
+whole degrees and every rotated surface is stored together with the offset
+that keeps it centred on the original image and its collision mask.
+
+"""
+
+from collections import OrderedDict, namedtuple
+
+import pygame
+
+RotatedSprite = namedtuple("RotatedSprite", ["image", "offset", "mask"])
+
+
+class RotationCache:
+    """
+    Caches the rotations of a single image.
+
+    Attributes:
+        LRU: Mode keeping at most max_size rotations, evicting the least recently used.
+        PREBAKED: Mode rendering all STEPS rotations up front.
+        STEPS: The number of quantized angles in a full turn.
+
+    Methods:
+        quantize(angle: float) -> int:
+            Maps an angle in degrees to its quantized step.
+
+        get(angle: float) -> RotatedSprite:
+            Returns the rotated sprite for the given angle.
+
+    """
+
+    LRU = "lru"
+    PREBAKED = "prebaked"
+    STEPS = 360
+
+    def __init__(self, image: pygame.Surface, mode=LRU, max_size=64) -> None:
+        if mode not in (self.LRU, self.PREBAKED):
+            raise ValueError("Unknown rotation cache mode")
+        self.image = image
+        self.mode = mode
+        self.max_size = max_size
+        self._sprites = OrderedDict()
+        if mode == self.PREBAKED:
+            for step in range(self.STEPS):
+                self._sprites[step] = self._render(step)
+
+    @classmethod
+    def quantize(cls, angle: float) -> int:
+        """
+        Maps an angle in degrees to its quantized step.
+
+        Args:
+            angle (float): The angle in degrees.
+
+        Returns:
+            int: The step in the range [0, STEPS).
+        """
+        return round(angle * cls.STEPS / 360) % cls.STEPS
+
+    def get(self, angle: float) -> RotatedSprite:
+        """
+        Returns the rotated sprite for the given angle.
+
+        Args:
+            angle (float): The angle in degrees.
+
+        Returns:
+            RotatedSprite: The rotated image, its top-left offset and its mask.
+        """
+        step = self.quantize(angle)
+        sprite = self._sprites.get(step)
+        if sprite is None:
+            sprite = self._sprites[step] = self._render(step)
+            if len(self._sprites) > self.max_size:
+                self._sprites.popitem(last=False)
+        elif self.mode == self.LRU:
+            self._sprites.move_to_end(step)
+        return sprite
+
+    def _render(self, step: int) -> RotatedSprite:
+        rotated = pygame.transform.rotate(self.image, step * 360 / self.STEPS)
+        offset = (
+            self.image.get_width() // 2 - rotated.get_width() // 2,
+            self.image.get_height() // 2 - rotated.get_height() // 2,
+        )
+        return RotatedSprite(rotated, offset, pygame.mask.from_surface(rotated))
+
+
+class RotationCacheRegistry:
+    """
+    Hands out one RotationCache per image, all sharing the configured mode.
+
+    Methods:
+        configure(mode: str, max_size: int) -> None:
+            Selects the cache mode and size and drops existing caches.
+
+        get(image: pygame.Surface) -> RotationCache:
+            Returns the rotation cache of the image, creating it if needed.
+
+    """
+
+    def __init__(self, mode=RotationCache.LRU, max_size=64) -> None:
+        self.mode = mode
+        self.max_size = max_size
+        self._caches = {}
+
+    def configure(self, mode: str, max_size: int) -> None:
+        """
+        Selects the cache mode and size and drops existing caches.
+
+        Args:
+            mode (str): Either RotationCache.LRU or RotationCache.PREBAKED.
+            max_size (int): The number of rotations kept per image in LRU mode.
+
+        Returns:
+            None
+        """
+        self.mode = mode
+        self.max_size = max_size
+        self._caches.clear()
+
+    def get(self, image: pygame.Surface) -> RotationCache:
+        """
+        Returns the rotation cache of the image, creating it if needed.
+
+        Args:
+            image (pygame.Surface): The unrotated image.
+
+        Returns:
+            RotationCache: The cache holding the rotations of the image.
+        """
+        cache = self._caches.get(id(image))
+        if cache is None or cache.image is not image:
+            cache = RotationCache(image, self.mode, self.max_size)
+            self._caches[id(image)] = cache
+        return cache
+
+
+ROTATION_CACHES = RotationCacheRegistry()
@@ -0,0 +1,80 @@
+"""
+Module: spatial_grid_module
+
+This module provides the SpatialGrid class, a uniform grid used as the broad
+phase of collision checks: boxes are bucketed by the cells they cover, so only
+boxes sharing a cell are compared instead of every pair.
+
+"""
+
+from collections import defaultdict
+from itertools import combinations
+from typing import List, Sequence, Tuple
+
+Box = Tuple[int, int, int, int]
+
+
+class SpatialGrid:  # pylint: disable=too-few-public-methods
+    """
+    A uniform grid of square cells. With cells at least as large as the boxes,
+    each box covers at most four cells and the cost of finding the overlapping
+    pairs grows with the number of boxes and of actual neighbours, not with the
+    number of pairs.
+
+    Attributes:
+        cell_size: An instance variable representing the side of a cell in pixels.
+
+    Methods:
+        pairs(self, boxes: Sequence[Box]) -> List[Tuple[int, int]]:
+            Returns the pairs of overlapping boxes.
+
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+
+    def pairs(self, boxes: Sequence[Box]) -> List[Tuple[int, int]]:
+        """
+        Returns the pairs of overlapping boxes, each pair once and in order.
+
+        Args:
+            boxes (Sequence[Box]): The (left, top, right, bottom) of every box,
+            right and bottom excluded.
+
+        Returns:
+            List[Tuple[int, int]]: The (i, j) indices of the overlapping boxes, i < j.
+        """
+        cells = defaultdict(list)
+        size = self.cell_size
+        for index, (left, top, right, bottom) in enumerate(boxes):
+            for column in range(left // size, (right - 1) // size + 1):
+                for row in range(top // size, (bottom - 1) // size + 1):
+                    cells[column, row].append(index)
+
+        pairs = set()
+        for members in cells.values():
+            for first, second in combinations(members, 2):
+                if overlap(boxes[first], boxes[second]):
+                    pairs.add((first, second))
+        return sorted(pairs)
+
+
+def overlap(first: Box, second: Box) -> bool:
+    """
+    Returns whether two boxes overlap.
+
+    Args:
+        first (Box): The (left, top, right, bottom) of the first box.
+        second (Box): The (left, top, right, bottom) of the second box.
+
+    Returns:
+        bool: True if the boxes share at least one pixel.
+    """
+    return (
+        first[0] < second[2]
+        and second[0] < first[2]
+        and first[1] < second[3]
+        and second[1] < first[3]
+    )
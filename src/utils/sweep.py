@@ -0,0 +1,28 @@
+"""
+Module: sweep_module
+
+This module provides helpers for swept collision checks, which sample the motion
+of a car during a tick at evenly spaced points, more of them the faster it goes,
+so that it cannot pass through anything thicker than the sampling step.
+
+"""
+
+import math
+
+import numpy as np
+
+
+def sweep_fractions(distance: float, step: float) -> np.ndarray:
+    """
+    Returns the fractions of a motion at which it is sampled: as many as needed
+    for consecutive samples to be at most step apart, ending with 1.
+
+    Args:
+        distance (float): The length of the motion, in pixels.
+        step (float): The largest distance between two samples, in pixels.
+
+    Returns:
+        np.ndarray: The increasing fractions, from above 0 to 1.
+    """
+    count = max(1, math.ceil(distance / step))
+    return np.arange(1, count + 1) / count
@@ -1,5 +1,6 @@
 import math
 
+import pygame
 import pytest
 
 from src.base.car import AbstractCar
@@ -32,3 +33,10 @@ class TestAbstractCar:
         assert abstract_car.y == AbstractCar.START_POS[1]
         assert abstract_car.angle == 0
         assert abstract_car.vel == 0
+
+    def test_outline(self, abstract_car):
+        abstract_car.img = pygame.Surface((10, 20))
+        assert abstract_car.outline()[0] == pytest.approx((100, 100))
+        assert abstract_car.outline()[4] == pytest.approx((110, 120))
+        abstract_car.angle = 90
+        assert abstract_car.outline()[1] == pytest.approx((95, 110))
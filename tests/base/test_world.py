@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.base.world import CarWorld
+from src.components.car import PlayerCar
+
+
+@pytest.fixture
+def world():
+    return CarWorld(capacity=2)
+
+
+def test_add_grows_capacity(world):
+    cars = [PlayerCar(4, 4, world) for _ in range(5)]
+    assert world.size == 5
+    assert [car.index for car in cars] == [0, 1, 2, 3, 4]
+    assert world.x[:5].tolist() == [PlayerCar.START_POS[0]] * 5
+
+
+def test_car_is_a_view_of_its_row(world):
+    car = PlayerCar(4, 4, world)
+    car.angle = 30
+    assert world.angle[car.index] == 30
+    world.vel[car.index] = 2
+    assert car.vel == 2
+
+
+def test_car_follows_its_row_when_the_world_grows(world):
+    car = PlayerCar(4, 4, world)
+    car.vel = 3
+    others = [PlayerCar(4, 4, world) for _ in range(4)]
+    assert car.vel == 3
+    car.angle = 45
+    assert world.angle[car.index] == 45
+    assert others[-1].columns["x"] is world.x
+
+
+def test_apply_controls_matches_scalar_cars():
+    rng = np.random.default_rng(0)
+    world = CarWorld()
+    batched = [PlayerCar(4 + i, 3, world) for i in range(6)]
+    scalar = [PlayerCar(4 + i, 3) for i in range(6)]
+    for _ in range(200):
+        forward, backward, left, right = rng.random((4, 6)) < 0.5
+        world.apply_controls(forward, backward, left, right)
+        for i, car in enumerate(scalar):
+            if left[i]:
+                car.rotate(left=True)
+            if right[i]:
+                car.rotate(right=True)
+            if forward[i]:
+                car.move_forward()
+            if backward[i]:
+                car.move_backward()
+            if not (forward[i] or backward[i]):
+                car.reduce_speed()
+    for batched_car, scalar_car in zip(batched, scalar):
+        assert batched_car.x == pytest.approx(scalar_car.x)
+        assert batched_car.y == pytest.approx(scalar_car.y)
+        assert batched_car.angle == scalar_car.angle
+        assert batched_car.vel == pytest.approx(scalar_car.vel)
+
+
+def test_time_scale_keeps_distance_per_second():
+    slow, fast = CarWorld(), CarWorld(time_scale=0.5)
+    slow.add((0, 0), 4, 4)
+    fast.add((0, 0), 4, 4)
+    slow.vel[0] = fast.vel[0] = 3
+    slow.move()
+    fast.move()
+    fast.move()
+    assert fast.poses() == pytest.approx(slow.poses())
@@ -0,0 +1,54 @@
+import pytest
+
+from src.base.world import CarWorld
+from src.components.car import CarCollider, ComputerCar, PlayerCar
+
+
+@pytest.fixture
+def world():
+    return CarWorld()
+
+
+def test_separate_cars_do_not_touch(world):
+    cars = [ComputerCar(2, 4, [(0, 0)], world) for _ in range(24)]
+    for number, car in enumerate(cars):
+        car.x, car.y = (number % 6) * 60, (number // 6) * 60
+    assert CarCollider(cars).contacts() == []
+
+
+def test_overlapping_cars_touch(world):
+    player = PlayerCar(4, 4, world)
+    computer = ComputerCar(2, 4, [(0, 0)], world)
+    computer.x, computer.y = player.x + 10, player.y
+    assert CarCollider([player, computer]).contacts() == [(player, computer)]
+
+
+def test_resolve_pushes_cars_apart(world):
+    player = PlayerCar(4, 4, world)
+    computer = ComputerCar(2, 4, [(0, 0)], world)
+    computer.x, computer.y = player.x + 30, player.y
+    previous = world.poses()
+    computer.x -= 20
+    computer.angle = 30
+    player.vel = 2
+
+    collider = CarCollider([player, computer])
+    assert collider.resolve(previous) == 1
+    assert collider.contacts() == []
+    # The computer car is pushed off by the distance it would have driven
+    pushed = previous[0, computer.index] + CarCollider.PUSH + 2
+    assert computer.x == pytest.approx(pushed)
+    assert computer.angle == 0
+    assert computer.vel == 1
+    # The player hit the other car side on and keeps half its speed
+    assert player.vel == pytest.approx(1)
+
+
+def test_blocked_computer_car_gives_up_its_path_point(world):
+    player = PlayerCar(4, 4, world)
+    computer = ComputerCar(2, 4, [player.center(), (0, 0)], world)
+    computer.x, computer.y = player.x, player.y + 40
+    computer.hit((0, 1))
+    assert computer.current_point == 1
+    computer.hit((0, 1))
+    assert computer.current_point == 1
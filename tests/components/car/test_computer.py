@@ -20,3 +20,14 @@ class TestComputerCar:
         computer_car.img = pygame.Surface((50, 50))  # Example surface size
         computer_car.update_path_point()
         assert computer_car.current_point == 1
+
+    def test_move_speeds_back_up(self, computer_car):
+        computer_car.vel = 1
+        computer_car.move()
+        assert computer_car.vel == pytest.approx(1 + computer_car.acceleration)
+
+    def test_next_level_raises_max_vel(self, computer_car):
+        computer_car.next_level(3)
+        assert computer_car.vel == computer_car.max_vel == pytest.approx(10.4)
+        computer_car.reset()
+        assert computer_car.max_vel == 10
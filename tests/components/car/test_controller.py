@@ -0,0 +1,29 @@
+import pytest
+
+from src.base.world import CarWorld
+from src.components.car import ComputerCar, WaypointController
+from src.constants.game import COMPUTER_PATH
+
+
+def test_cars_must_share_world():
+    with pytest.raises(ValueError):
+        WaypointController(
+            [ComputerCar(2, 4, COMPUTER_PATH), ComputerCar(2, 4, COMPUTER_PATH)]
+        )
+
+
+def test_matches_scalar_computer_cars():
+    world = CarWorld()
+    batched = [ComputerCar(1 + i * 0.5, 4, COMPUTER_PATH, world) for i in range(4)]
+    scalar = [ComputerCar(1 + i * 0.5, 4, COMPUTER_PATH) for i in range(4)]
+    controller = WaypointController(batched)
+    for _ in range(1500):
+        controller.move()
+        for car in scalar:
+            car.move()
+    for batched_car, scalar_car in zip(batched, scalar):
+        assert batched_car.current_point == scalar_car.current_point
+        assert batched_car.x == scalar_car.x
+        assert batched_car.y == scalar_car.y
+        assert batched_car.angle == scalar_car.angle
+    assert batched[-1].current_point == len(COMPUTER_PATH)
@@ -0,0 +1,29 @@
+import pytest
+
+from src.components.car import PlayerCar
+
+
+class TestPlayerCar:
+    @pytest.fixture
+    def player_car(self):
+        car = PlayerCar(4, 4)
+        car.vel = 4
+        return car
+
+    def test_bounce_reverses_without_normal(self, player_car):
+        player_car.bounce()
+        assert player_car.vel == -2
+        assert player_car.y == pytest.approx(PlayerCar.START_POS[1] + 2)
+
+    def test_bounce_head_on(self, player_car):
+        # Driving up into a wall above the car
+        player_car.bounce((0, 1), 3)
+        assert player_car.vel == pytest.approx(-2)
+        assert player_car.y == pytest.approx(PlayerCar.START_POS[1] + 5)
+
+    def test_bounce_glancing(self, player_car):
+        # Driving up along a wall on the left of the car
+        player_car.bounce((1, 0), 1)
+        assert player_car.vel == pytest.approx(2)
+        assert player_car.x == pytest.approx(PlayerCar.START_POS[0] + 1)
+        assert player_car.y == pytest.approx(PlayerCar.START_POS[1] - 2)
@@ -0,0 +1,55 @@
+import pygame
+import pytest
+
+from src.components.animations import (
+    Animation,
+    AnimationFactory,
+    AnimationPlayer,
+)
+from src.components.result import ResultScreen
+from src.constants.sounds import SilentSound
+
+
+class FakeAnimation:
+    def __init__(self, count=3, delay=0.04):
+        self.frames = [pygame.Surface((4, 4)) for _ in range(count)]
+        self.delays = [delay] * count
+
+    def frame_count(self):
+        return len(self.frames)
+
+    def blit_frame(self, win, index, position):
+        return win.blit(self.frames[index], position)
+
+
+def test_load_delays_from_filenames():
+    animation = Animation.__new__(Animation)
+    delays = animation.load_delays("src/assets/images/losing-frames")
+    assert len(delays) == 91
+    assert set(delays) == {0.04}
+
+
+def test_player_follows_frame_delays():
+    player = AnimationPlayer(FakeAnimation(count=3, delay=0.04))
+    player.update(0.03)
+    assert player.frame_index == 0
+    player.update(0.06)
+    assert player.frame_index == 2
+    assert not player.finished()
+    player.update(0.05)
+    assert player.finished()
+    assert player.draw(pygame.Surface((100, 300))).size == (4, 4)
+
+
+def test_result_screen_holds_message_after_animation():
+    screen = ResultScreen(FakeAnimation(count=2), SilentSound(), "YOU WON!")
+    screen.update(0.1)
+    assert screen.player.finished()
+    assert not screen.finished()
+    screen.update(ResultScreen.HOLD_TIME)
+    assert screen.finished()
+
+
+def test_factory_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        AnimationFactory.get_animation("bogus")
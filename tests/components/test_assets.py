@@ -0,0 +1,38 @@
+import threading
+
+import pytest
+
+from src.components.assets import AssetManager
+
+
+@pytest.fixture
+def manager():
+    return AssetManager(max_workers=2)
+
+
+def test_required_assets_gate_ready(manager):
+    release = threading.Event()
+    manager.submit(release.wait, 5, key="slow", required=True)
+    manager.submit(lambda: "fast", key="fast", required=True)
+    manager.submit(release.wait, 5, key="optional")
+    manager.get("fast")
+    assert not manager.ready()
+    assert manager.progress() == 0.5
+    release.set()
+    assert manager.get("slow") is True
+    assert manager.ready()
+    assert manager.progress() == 1.0
+
+
+def test_timings_and_report(manager):
+    manager.submit(str.upper, "grass", required=True)
+    assert manager.get("grass") == "GRASS"
+    assert set(manager.timings) == {"grass"}
+    assert manager.report().startswith("grass: ")
+
+
+def test_ready_raises_load_errors(manager):
+    manager.submit(open, "missing-asset.png", required=True)
+    with pytest.raises(FileNotFoundError):
+        while not manager.ready():
+            pass
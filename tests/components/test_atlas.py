@@ -0,0 +1,41 @@
+import pygame
+import pytest
+
+from src.components.animations.atlas import FrameAtlas
+
+
+def make_frame(size, visible):
+    frame = pygame.Surface(size, pygame.SRCALPHA)
+    frame.fill((255, 0, 0, 255), visible)
+    return frame
+
+
+def test_atlas_blits_frames_like_the_originals():
+    frames = [
+        make_frame((40, 30), pygame.Rect(5, 6, 10, 8)),
+        make_frame((40, 30), pygame.Rect(0, 0, 40, 30)),
+        make_frame((40, 30), pygame.Rect(20, 10, 3, 4)),
+    ]
+    atlas = FrameAtlas(frames, sheet_size=64)
+    for index, frame in enumerate(frames):
+        expected = pygame.Surface((60, 50), pygame.SRCALPHA)
+        expected.blit(frame, (7, 9))
+        actual = pygame.Surface((60, 50), pygame.SRCALPHA)
+        rect = atlas.blit(actual, index, (7, 9))
+        assert rect == frame.get_bounding_rect().move(7, 9)
+        assert pygame.image.tobytes(actual, "RGBA") == pygame.image.tobytes(
+            expected, "RGBA"
+        )
+
+
+def test_atlas_packs_frames_into_few_trimmed_sheets():
+    frames = [make_frame((40, 40), pygame.Rect(0, 0, 30, 30)) for _ in range(5)]
+    atlas = FrameAtlas(frames, sheet_size=64)
+    assert len(atlas.sheets) == 2
+    assert atlas.sheets[0].get_size() == (60, 60)
+    assert atlas.sheets[1].get_size() == (30, 30)
+
+
+def test_atlas_rejects_frames_larger_than_a_sheet():
+    with pytest.raises(ValueError):
+        FrameAtlas([make_frame((80, 10), pygame.Rect(0, 0, 80, 10))], sheet_size=64)
@@ -0,0 +1,8 @@
+from src.components.controls import Controls, ScriptedController
+
+
+def test_scripted_controller():
+    controller = ScriptedController([Controls.FORWARD | Controls.LEFT, 8])
+    assert controller.poll() == Controls.FORWARD | Controls.LEFT
+    assert controller.poll() == Controls.RIGHT
+    assert controller.poll() == Controls.NONE
@@ -0,0 +1,66 @@
+import pygame
+import pytest
+
+from src.components.controls import Controls, ScriptedController
+from src.components.game import RaceResult, RacingGame
+
+
+@pytest.fixture
+def game():
+    return RacingGame(headless=True, controller=ScriptedController([]))
+
+
+def test_idle_player_loses(game):
+    assert game.run_headless(max_ticks=5000) is RaceResult.LOST
+    assert not game.run
+    assert game.ticks < 5000
+
+
+def test_reset_cars_are_not_interpolated_from_the_finish(game):
+    game.run_headless(max_ticks=5000)
+    assert (game.previous_poses == game.world.poses()).all()
+
+
+def test_max_ticks(game):
+    assert game.run_headless(max_ticks=10) is None
+    assert game.ticks == 10
+    assert game.game_info.get_level_time() == 0
+
+
+def test_scripted_controls_move_player(game):
+    game.controller = ScriptedController([Controls.FORWARD] * 30)
+    game.run_headless(max_ticks=30)
+    assert game.player_car.y < game.player_car.START_POS[1]
+    assert game.player_car.vel > 0
+
+
+def test_fast_player_does_not_pass_through_border(game):
+    # The border runs across the track about 220 pixels above the start
+    game.controller = ScriptedController([Controls.FORWARD] * 40)
+    game.player_car.max_vel = game.player_car.acceleration = 30
+    game.run_headless(max_ticks=40)
+    assert game.player_car.y > 80
+
+
+def test_wait_for_start_starts_on_key(game):
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w))
+    game.wait_for_start()
+    assert game.game_info.started
+    assert game.run
+
+
+def test_wait_for_start_quits(game):
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    game.wait_for_start()
+    assert not game.game_info.started
+    assert not game.run
+
+
+def test_start_screen_is_one_display_update(game, monkeypatch):
+    updates = []
+    monkeypatch.setattr(pygame.display, "update", lambda *args: updates.append(args))
+    game.draw_start_screen(True)
+    game.draw_start_screen(False)
+    assert len(updates) == 2
@@ -0,0 +1,66 @@
+import pygame
+import pytest
+
+from src.components.hud import GlyphAtlas, Hud, TextCache
+
+
+class CountingFont:
+    def __init__(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 20)
+        self.renders = []
+
+    def render(self, text, antialias, color):
+        self.renders.append(text)
+        return self.font.render(text, antialias, color)
+
+
+@pytest.fixture
+def font():
+    return CountingFont()
+
+
+def test_text_cache_renders_once(font):
+    cache = TextCache(font)
+    assert cache.get("Level 1") is cache.get("Level 1")
+    assert font.renders == ["Level 1"]
+
+
+def test_text_cache_is_bounded(font):
+    cache = TextCache(font, max_size=2)
+    first = cache.get("a")
+    cache.get("b")
+    cache.get("c")
+    assert cache.get("a") is not first
+
+
+def test_hud_renders_only_changed_values(font):
+    hud = Hud(font, 200)
+    window = pygame.Surface((200, 200))
+    hud.draw(window, [1, 0, 0.0])
+    hud.draw(window, [1, 0, 0.1])
+    assert font.renders == ["Level 1", "Time: 0s", "Vel: 0.0px/s", "Vel: 0.1px/s"]
+
+
+def test_glyph_atlas_draws_numbers(font):
+    atlas = GlyphAtlas(TextCache(font))
+    window = pygame.Surface((200, 200))
+    font.renders.clear()
+    rect = atlas.draw(window, "-1.5", (10, 10))
+    assert font.renders == []
+    assert rect.topleft == (10, 10)
+    assert rect.width == sum(atlas.areas[glyph].width for glyph in "-1.5")
+
+
+def test_hud_with_atlas(font):
+    hud = Hud(font, 200, use_atlas=True)
+    rects = hud.draw(pygame.Surface((200, 200)), [2, 13, 3.2])
+    assert len(rects) == 3
+    assert all(rect.left == 10 for rect in rects)
+
+
+def test_hud_draws_message_centered(font):
+    hud = Hud(font, 200)
+    rect = hud.draw_message(pygame.Surface((200, 200)), "WRONG WAY!")
+    assert rect.centerx in (99, 100)
+    assert rect.top == 10
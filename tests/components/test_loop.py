@@ -0,0 +1,42 @@
+import pytest
+
+from src.components.loop import FixedTimestep
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_advance_counts_whole_ticks(clock):
+    timestep = FixedTimestep(100, clock=clock)
+    assert timestep.advance() == 0
+    clock.now = 0.035
+    assert timestep.advance() == 3
+    assert timestep.alpha() == pytest.approx(0.5)
+    clock.now = 0.04
+    assert timestep.advance() == 1
+
+
+def test_advance_drops_time_beyond_max_ticks(clock):
+    timestep = FixedTimestep(100, max_ticks_per_frame=4, clock=clock)
+    timestep.advance()
+    clock.now = 1.0
+    assert timestep.advance() == 4
+    assert timestep.alpha() == 0
+
+
+def test_reset(clock):
+    timestep = FixedTimestep(100, clock=clock)
+    timestep.advance()
+    clock.now = 5.0
+    timestep.reset()
+    assert timestep.advance() == 0
@@ -0,0 +1,50 @@
+import json
+
+import pygame
+
+from src.components.controls import Controls, ScriptedController
+from src.components.game import NullProfiler, RacingGame
+from src.components.profiler import Phase, Profiler, ProfilerOverlay
+
+
+def test_profiler_keeps_a_rolling_window():
+    profiler = Profiler(samples=4)
+    for duration in (1, 2, 3, 4, 100, 200):
+        profiler.stop(Phase.DRAW, profiler.start() - duration * 1_000_000)
+    assert profiler.counts[Phase.DRAW] == 6
+    p0, p100 = profiler.percentiles(Phase.DRAW, 0, 100)
+    assert 3 <= p0 < 3.5
+    assert 200 <= p100 < 200.5
+    assert profiler.percentiles(Phase.FLIP, 50) == [0.0]
+
+
+def test_profiler_dumps_stats(tmp_path):
+    profiler = Profiler()
+    profiler.frame()
+    profiler.frame()
+    path = tmp_path / "stats" / "profile.json"
+    profiler.dump(str(path))
+    stats = json.loads(path.read_text())
+    assert stats["frame"]["count"] == 1
+    assert set(stats) == {phase.name.lower() for phase in Phase}
+
+
+def test_game_records_tick_phases():
+    game = RacingGame(headless=True, controller=ScriptedController([]))
+    assert isinstance(game.profiler, NullProfiler)
+    game.profiler = Profiler()
+    game.controller = ScriptedController([Controls.FORWARD] * 20)
+    game.run_headless(max_ticks=20)
+    game.draw()
+    for phase in (Phase.MOVE_PLAYER, Phase.COMPUTER_MOVE, Phase.HANDLE_COLLISION):
+        assert game.profiler.counts[phase] == 20
+    assert game.profiler.counts[Phase.DRAW] == game.profiler.counts[Phase.FLIP] == 1
+
+
+def test_overlay_draws_only_when_visible():
+    pygame.font.init()
+    overlay = ProfilerOverlay(Profiler(), pygame.font.Font(None, 18))
+    win = pygame.Surface((400, 300))
+    assert overlay.draw(win) == []
+    overlay.toggle()
+    assert len(overlay.draw(win)) == len(Phase)
@@ -0,0 +1,126 @@
+import numpy as np
+import pygame
+import pytest
+
+from src.base.world import CarWorld
+from src.components.car import ComputerCar
+from src.components.race import RaceTracker, crossing
+
+# Three horizontal gates crossed forward when driving up: the finish at y=100,
+# then y=50 and y=0. The cars are 10x10 and start just past the finish. The
+# track goes up at x=50 and comes back down at x=250.
+GATES = [((100, 100), (0, 100)), ((100, 50), (0, 50)), ((100, 0), (0, 0))]
+PATH = [(50, 150), (50, -50), (250, -50), (250, 150)]
+
+
+@pytest.fixture
+def cars():
+    world = CarWorld()
+    cars = [ComputerCar(2, 4, [(0, 0)], world) for _ in range(2)]
+    for car in cars:
+        car.img = pygame.Surface((10, 10))
+        car.x, car.y = 45, 85
+    return cars
+
+
+@pytest.fixture
+def tracker(cars):
+    return RaceTracker(cars, GATES, PATH)
+
+
+def drive(tracker, car, y, tick=0):
+    previous = tracker.world.poses()
+    car.y = y
+    return tracker.update(previous, tick)
+
+
+def test_crossing():
+    gates = np.array([GATES[0]] * 3, dtype=float)
+    start = np.array([(50, 110), (50, 90), (150, 110)], dtype=float)
+    end = np.array([(50, 90), (50, 110), (150, 90)], dtype=float)
+    assert crossing(start, end, gates).tolist() == [1, -1, 0]
+
+
+def test_lap(tracker, cars):
+    assert not drive(tracker, cars[0], 35, tick=10).any()
+    assert cars[0].progress == 1
+    drive(tracker, cars[0], -15, tick=25)
+    # Around the track and back in front of the finish
+    cars[0].y = 105
+    assert drive(tracker, cars[0], 85, tick=45).tolist() == [True, False]
+    assert tracker.laps().tolist() == [1, 0]
+    assert tracker.last_splits(0) == [10, 15, 20]
+    assert tracker.splits(0) == []
+    assert all(type(split) is int for split in tracker.last_splits(0))
+
+
+def test_reversing_over_a_gate_takes_its_split_back(tracker, cars):
+    drive(tracker, cars[0], 35, tick=10)
+    drive(tracker, cars[0], 60, tick=14)
+    assert tracker.splits(0) == []
+    drive(tracker, cars[0], 35, tick=21)
+    drive(tracker, cars[0], -15, tick=30)
+    assert tracker.splits(0) == [21, 9]
+
+
+def test_splits_survive_a_reverse_over_the_finish(tracker, cars):
+    drive(tracker, cars[0], 35, tick=10)
+    drive(tracker, cars[0], -15, tick=25)
+    cars[0].y = 105
+    drive(tracker, cars[0], 85, tick=45)
+    drive(tracker, cars[0], 105, tick=50)
+    assert tracker.laps().tolist() == [0, 0]
+    assert tracker.splits(0) == [10, 15]
+    drive(tracker, cars[0], 85, tick=52)
+    assert tracker.last_splits(0) == [10, 15, 27]
+
+
+def test_state_round_trips(tracker, cars):
+    drive(tracker, cars[0], 35, tick=10)
+    state = tracker.state()
+    drive(tracker, cars[0], -15, tick=25)
+    tracker.restore(state)
+    assert tracker.splits(0) == [10]
+    assert tracker.sector_start.tolist() == [10, 0]
+
+
+def test_wrong_way(tracker, cars):
+    drive(tracker, cars[0], 35)
+    cars[0].angle = 180
+    drive(tracker, cars[0], 60)
+    assert cars[0].progress == 0
+    assert tracker.wrong_way().tolist() == [True, False]
+    # Turning around clears the warning before the gate is crossed again
+    cars[0].angle = 0
+    drive(tracker, cars[0], 55)
+    assert tracker.wrong_way().tolist() == [False, False]
+
+
+def test_wrong_way_follows_the_path(tracker, cars):
+    cars[1].x, cars[1].angle = 245, 180
+    drive(tracker, cars[0], 80)
+    assert tracker.wrong_way().tolist() == [False, False]
+    cars[1].angle = 0
+    drive(tracker, cars[0], 75)
+    assert tracker.wrong_way().tolist() == [False, True]
+
+
+def test_reversing_over_the_finish_is_not_a_lap(tracker, cars):
+    drive(tracker, cars[0], 105)
+    assert cars[0].progress == -1
+    assert not drive(tracker, cars[0], 85).any()
+    assert tracker.laps().tolist() == [0, 0]
+
+
+def test_standings(tracker, cars):
+    drive(tracker, cars[1], 35)
+    assert tracker.standings() == [1, 0]
+    drive(tracker, cars[0], 30)
+    assert tracker.standings() == [0, 1]
+    assert tracker.position(1) == 2
+
+
+def test_cars_must_share_a_world(cars):
+    other = ComputerCar(2, 4, [(0, 0)])
+    with pytest.raises(ValueError):
+        RaceTracker([cars[0], other], GATES, PATH)
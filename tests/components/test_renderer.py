@@ -0,0 +1,50 @@
+import os
+
+import pygame
+import pytest
+
+from src.components.renderer import (
+    DirtyRectRenderer,
+    Renderer,
+    RendererFactory,
+    RendererType,
+)
+
+
+@pytest.fixture
+def window():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    return pygame.display.set_mode((40, 30))
+
+
+@pytest.fixture
+def layers():
+    grass = pygame.Surface((40, 30))
+    grass.fill((0, 255, 0))
+    return [(grass, (0, 0))]
+
+
+def test_factory(window, layers):
+    full = RendererFactory.get_renderer(RendererType.FULL, window, layers)
+    assert isinstance(full, Renderer)
+    assert not isinstance(full, DirtyRectRenderer)
+    assert isinstance(
+        RendererFactory.get_renderer(RendererType.DIRTY_RECT, window, layers),
+        DirtyRectRenderer,
+    )
+    with pytest.raises(ValueError):
+        RendererFactory.get_renderer("bogus", window, layers)
+
+
+def test_dirty_rect_restores_background(window, layers):
+    renderer = DirtyRectRenderer(window, layers)
+    renderer.begin_frame()
+    rect = window.fill((255, 0, 0), pygame.Rect(5, 5, 4, 4))
+    renderer.end_frame([rect])
+    assert not renderer.full_redraw
+
+    renderer.begin_frame()
+    assert window.get_at((6, 6)) == pygame.Color(0, 255, 0)
+    renderer.end_frame([])
+    assert renderer.dirty_rects == []
@@ -0,0 +1,134 @@
+import io
+
+import pytest
+
+from src.components.controls import Controls, ScriptedController
+from src.components.game import RaceResult, RacingGame
+from src.components.replay import (
+    Replay,
+    ReplayController,
+    ReplayRecorder,
+    pack_header,
+    read_index,
+    read_keyframe,
+)
+from src.constants.game import COMPUTER_PATH, SIMULATION_RATE
+
+SCRIPT = (
+    [Controls.FORWARD] * 40
+    + [Controls.FORWARD | Controls.LEFT] * 25
+    + [Controls.BACKWARD | Controls.RIGHT] * 10
+)
+
+
+def record(script):
+    stream = io.BytesIO()
+    recorder = ReplayRecorder(
+        ScriptedController(script),
+        stream,
+        pack_header(1, SIMULATION_RATE, COMPUTER_PATH),
+    )
+    for _ in script:
+        recorder.poll()
+    recorder.flush()
+    return stream.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(ReplayRecorder, "CHUNK_TICKS", 16)
+
+
+@pytest.fixture
+def recorded_race(tmp_path):
+    path = str(tmp_path / "race.rpl")
+    game = RacingGame(headless=True, controller=ScriptedController(SCRIPT * 3))
+    game.recorder = game.controller = ReplayRecorder(
+        game.controller,
+        open(path, "wb"),
+        pack_header(1, SIMULATION_RATE, COMPUTER_PATH),
+        keyframe_interval=20,
+    )
+    game.run_headless(max_ticks=len(SCRIPT) * 3)
+    game.recorder.close()
+    return path
+
+
+def test_replay_round_trips_controls():
+    replay = Replay.read(io.BytesIO(record(SCRIPT)))
+    assert [Controls(value) for value in replay.inputs] == SCRIPT
+    replay.check(1, SIMULATION_RATE, COMPUTER_PATH)
+    controller = ReplayController(replay)
+    assert [controller.poll() for _ in SCRIPT] == SCRIPT
+    assert controller.poll() == Controls.NONE
+
+
+def test_replay_reproduces_the_race():
+    recorded = RacingGame(headless=True, controller=ScriptedController(SCRIPT))
+    recorded.run_headless(max_ticks=len(SCRIPT))
+    replay = Replay.read(io.BytesIO(record(SCRIPT)))
+    replayed = RacingGame(headless=True, controller=ReplayController(replay))
+    replayed.run_headless(max_ticks=len(SCRIPT))
+    assert (replayed.world.poses() == recorded.world.poses()).all()
+
+
+def test_replayed_idle_race_is_lost():
+    replay = Replay.read(io.BytesIO(record([Controls.NONE] * 10)))
+    game = RacingGame(headless=True, controller=ReplayController(replay))
+    assert game.run_headless(max_ticks=5000) is RaceResult.LOST
+
+
+def test_replay_rejects_other_conditions():
+    replay = Replay.read(io.BytesIO(record(SCRIPT)))
+    with pytest.raises(ValueError):
+        replay.check(1, SIMULATION_RATE, COMPUTER_PATH[1:])
+    with pytest.raises(ValueError):
+        replay.check(2, SIMULATION_RATE, COMPUTER_PATH)
+    with pytest.raises(ValueError):
+        Replay.read(io.BytesIO(b"not a replay"))
+
+
+def simulated_to(tick):
+    game = RacingGame(headless=True, controller=ScriptedController(SCRIPT * 3))
+    game.run_headless(max_ticks=tick)
+    return game
+
+
+def test_keyframes_are_indexed(recorded_race):
+    with open(recorded_race, "rb") as stream:
+        index = read_index(stream)
+        assert [tick for tick, _ in index] == list(range(0, len(SCRIPT) * 3, 20))
+        state = read_keyframe(stream, index[3][1])
+    ticks, game_info_state, world_state, race_state = state
+    assert ticks == 60
+    assert game_info_state == (1, True, 0.0)
+    assert world_state.shape == (10, 2)
+    assert race_state[:2].tolist() == [0, 0]
+    replay = Replay.load(recorded_race)
+    assert replay.keyframes == dict(index)
+    assert replay.keyframe_before(75)[0] == 60
+    assert replay.keyframe_before(-1) is None
+
+
+def test_keyframes_are_found_without_an_index(recorded_race):
+    with open(recorded_race, "rb") as stream:
+        index = read_index(stream)
+        stream.seek(0)
+        unindexed = io.BytesIO(stream.read(index[-1][1]))
+    replay = Replay.read(unindexed)
+    assert replay.keyframes == dict(index[:-1])
+    state = replay.keyframe_before(75)
+    assert state[0] == 60
+    assert (state[2] == Replay.load(recorded_race).keyframe_before(75)[2]).all()
+
+
+def test_seek_matches_a_full_simulation(recorded_race):
+    game = RacingGame(
+        headless=True, controller=ReplayController(Replay.load(recorded_race))
+    )
+    for tick in (170, 45, 45, 210, 150):
+        game.seek(tick)
+        assert game.ticks == tick
+        expected = simulated_to(tick)
+        assert (game.world.poses() == expected.world.poses()).all()
+        assert (game.race.state() == expected.race.state()).all()
@@ -0,0 +1,79 @@
+import numpy as np
+
+from src.base.world import CarWorld
+from src.components.controls import Controls, ScriptedController
+from src.components.game import RacingGame
+from src.components.rewind import RewindBuffer
+
+
+class RewindingController(ScriptedController):
+    def __init__(self, inputs, rewinds):
+        super().__init__(inputs)
+        self.rewinds = iter(rewinds)
+
+    def rewinding(self):
+        return next(self.rewinds, False)
+
+
+class CountingRace:
+    def __init__(self):
+        self.tick = 0
+
+    def state(self):
+        return np.array([self.tick])
+
+
+def test_buffer_keeps_the_last_states():
+    world = CarWorld()
+    world.add((0, 0), 4, 4)
+    rewind = RewindBuffer(4, len(CarWorld.FIELDS), world.size)
+    race = CountingRace()
+    for tick in range(6):
+        world.x[0] = race.tick = tick
+        rewind.push(tick, (1, True, 0.0), world, race)
+    assert len(rewind) == 4
+    states = [rewind.pop() for _ in range(4)]
+    assert [state[0] for state in states] == [5, 4, 3, 2]
+    assert [state[2][0, 0] for state in states] == [5, 4, 3, 2]
+    assert [state[3].tolist() for state in states] == [[5], [4], [3], [2]]
+    assert states[0][1] == (1, True, 0.0)
+    assert rewind.pop() is None
+
+
+def test_holding_rewind_steps_the_race_backwards():
+    script = [Controls.FORWARD | Controls.LEFT] * 100
+    game = RacingGame(headless=True, controller=ScriptedController(script))
+    game.game_info.start_level()
+    game.simulate(70)
+    expected = game.save_state()
+
+    game = RacingGame(
+        headless=True,
+        controller=RewindingController(script, [False] * 100 + [True] * 30),
+    )
+    game.game_info.start_level()
+    game.simulate(130)
+    ticks, game_info_state, world_state, _ = game.save_state()
+    assert ticks == expected[0] == 70
+    assert game_info_state == expected[1]
+    assert np.array_equal(world_state, expected[2])
+
+
+def test_rewinding_over_a_gate_takes_its_split_back():
+    script = [Controls.NONE] * 200
+    game = RacingGame(headless=True, controller=ScriptedController(script))
+    game.game_info.start_level()
+    game.simulate(170)
+    expected = game.race.state()
+
+    game = RacingGame(
+        headless=True,
+        controller=RewindingController(script, [False] * 200 + [True] * 30),
+    )
+    game.game_info.start_level()
+    game.simulate(200)
+    assert game.race.splits(1)
+    game.simulate(30)
+    assert game.ticks == 170
+    assert (game.race.state() == expected).all()
+    assert game.race.splits(1) == []
@@ -0,0 +1,54 @@
+import os
+
+import pygame
+import pytest
+
+from src.components.sound import SoundCategory, SoundEnum, SoundManager
+
+
+@pytest.fixture
+def manager():
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.init()
+    now = [0.0]
+    sounds = SoundManager(
+        lambda sound_type: pygame.mixer.Sound(buffer=bytes(44100)),
+        clock=lambda: now[0],
+    )
+    sounds.now = now
+    yield sounds
+    pygame.mixer.stop()
+
+
+def test_sounds_are_cached(manager):
+    sound = manager.get(SoundEnum.WINNING_SOUND)
+    assert manager.get(SoundEnum.WINNING_SOUND) is sound
+
+
+def test_repeated_triggers_are_coalesced(manager):
+    assert manager.play(SoundEnum.WINNING_SOUND)
+    assert not manager.play(SoundEnum.WINNING_SOUND)
+    manager.stop(SoundCategory.RESULT)
+    assert not manager.play(SoundEnum.WINNING_SOUND)
+    manager.now[0] += SoundManager.COOLDOWN
+    assert manager.play(SoundEnum.WINNING_SOUND)
+
+
+def test_engine_loops_on_its_channel_with_volume_from_speed(manager):
+    channel = manager.channels[SoundCategory.ENGINE]
+    engine = manager.get(SoundEnum.ACCELERATION_SOUND)
+    manager.update_engine(1, 4)
+    assert channel.get_sound() is engine
+    quiet = channel.get_volume()
+    manager.update_engine(4, 4)
+    assert channel.get_sound() is engine
+    assert channel.get_volume() > quiet
+    manager.update_engine(0, 4)
+    assert channel.get_sound() is None
+
+
+def test_disabled_manager_plays_nothing():
+    sounds = SoundManager(enabled=False)
+    assert not sounds.play(SoundEnum.LOSING_SOUND)
+    sounds.update_engine(2, 4)
+    sounds.handle(SoundEnum.LOSING_SOUND).play()
@@ -0,0 +1,34 @@
+import pygame
+
+from src.components.animations.stream import CompressedFrames
+
+
+def frame_paths(tmp_path, count=6):
+    paths = []
+    for index in range(count):
+        frame = pygame.Surface((8, 4))
+        frame.fill((index * 40, 0, 0))
+        path = str(tmp_path / f"frame_{index:02}.png")
+        pygame.image.save(frame, path)
+        paths.append(path)
+    return paths
+
+
+def test_frames_decode_to_the_original_pixels(tmp_path):
+    frames = CompressedFrames(frame_paths(tmp_path), memory_budget=1024)
+    win = pygame.Surface((8, 4))
+    for index in range(len(frames)):
+        assert frames.blit(win, index, (0, 0)).size == (8, 4)
+        assert win.get_at((0, 0))[:3] == (index * 40, 0, 0)
+
+
+def test_memory_budget_limits_the_decoded_window(tmp_path):
+    frames = CompressedFrames(frame_paths(tmp_path), memory_budget=8 * 4 * 4 * 3)
+    assert frames.window == 3
+    win = pygame.Surface((8, 4))
+    frames.blit(win, 0, (0, 0))
+    frames._pending.result()
+    assert frames.decoded_count() == 3
+    frames.blit(win, 4, (0, 0))
+    frames._pending.result()
+    assert frames.decoded_count() == 2
@@ -0,0 +1,43 @@
+import os
+
+import pygame
+import pytest
+
+from src.constants.images import ImageEnum, ImageFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    ImageFactory.clear()
+    yield
+    ImageFactory.clear()
+
+
+def test_get_image_is_memoized():
+    image = ImageFactory.get_image(ImageEnum.FINISH_IMAGE)
+    assert ImageFactory.get_image(ImageEnum.FINISH_IMAGE) is image
+    assert ImageFactory.get_image(ImageEnum.FINISH_IMAGE, 0.5) is not image
+
+
+def test_get_image_converts_once_display_exists():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    window = pygame.display.set_mode((40, 30))
+    grass = ImageFactory.get_image(ImageEnum.GRASS_IMAGE, 0.1)
+    car = ImageFactory.get_image(ImageEnum.RED_CAR_IMAGE)
+    assert grass.get_bitsize() == window.get_bitsize()
+    assert not grass.get_flags() & pygame.SRCALPHA
+    assert car.get_flags() & pygame.SRCALPHA
+    assert ImageFactory.get_image(ImageEnum.RED_CAR_IMAGE) is car
+
+
+def test_distance_field_does_not_depend_on_cache(monkeypatch, tmp_path):
+    fields = []
+    for cache_dir in (None, str(tmp_path), str(tmp_path)):
+        monkeypatch.setattr("src.constants.images.ASSET_CACHE_DIR", cache_dir)
+        ImageFactory.clear()
+        fields.append(ImageFactory.get_distance_field(ImageEnum.FINISH_IMAGE))
+    assert os.listdir(tmp_path)
+    for field in fields[1:]:
+        assert (field.distance == fields[0].distance).all()
+        assert (field.normals == fields[0].normals).all()
@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+import pygame
+import pytest
+
+from src.utils.asset_cache import AssetCache
+
+
+@pytest.fixture
+def source(tmp_path):
+    surface = pygame.Surface((6, 4), pygame.SRCALPHA)
+    surface.fill((10, 20, 30, 255), pygame.Rect(0, 0, 3, 4))
+    path = str(tmp_path / "car.png")
+    pygame.image.save(surface, path)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AssetCache(str(tmp_path / "cache"))
+
+
+def test_miss_then_hit(cache, source):
+    assert cache.load_image(source, 1) is None
+    surface = pygame.image.load(source)
+    cache.store_image(source, 1, surface)
+    image, mask = cache.load_image(source, 1)
+    assert image.get_size() == (6, 4)
+    assert image.get_at((1, 1)) == pygame.Color(10, 20, 30, 255)
+    assert mask.count() == 12
+    assert mask.get_at((0, 0)) and not mask.get_at((5, 0))
+
+
+def test_key_depends_on_scale_and_content(cache, source):
+    path = cache.path_for(source, 1)
+    assert cache.path_for(source, 0.5) != path
+    pygame.image.save(pygame.Surface((2, 2)), source)
+    assert cache.path_for(source, 1) != path
+
+
+def test_array_miss_then_hit(cache, source):
+    assert cache.load_array(source, 1, "sdf") is None
+    cache.store_array(source, 1, "sdf", np.arange(6, dtype=np.float16))
+    assert cache.load_array(source, 1, "sdf").tolist() == list(range(6))
+    assert cache.load_array(source, 0.5, "sdf") is None
+
+
+def test_store_leaves_no_temporary_files(cache, source):
+    cache.store_image(source, 1, pygame.image.load(source))
+    cache.store_array(source, 1, "sdf", np.zeros(3))
+    assert not [name for name in os.listdir(cache.directory) if name.endswith(".tmp")]
+
+
+@pytest.mark.parametrize("size", [0, 10, 40])
+def test_truncated_image_is_a_miss(cache, source, size):
+    cache.store_image(source, 1, pygame.image.load(source))
+    path = cache.path_for(source, 1)
+    with open(path, "r+b") as cached:
+        cached.truncate(size)
+    assert cache.load_image(source, 1) is None
+    assert not os.path.exists(path)
+
+
+def test_corrupt_array_is_a_miss(cache, source):
+    cache.store_array(source, 1, "sdf", np.zeros(3))
+    path = cache.path_for(source, 1, "-sdf.npy")
+    with open(path, "wb") as cached:
+        cached.write(b"not an array")
+    assert cache.load_array(source, 1, "sdf") is None
+    assert not os.path.exists(path)
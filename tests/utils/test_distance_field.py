@@ -0,0 +1,56 @@
+import numpy as np
+import pygame
+import pytest
+
+from src.utils.distance_field import DistanceField, jump_flood
+
+
+@pytest.fixture
+def field():
+    # A wall filling the columns 10 to 19 of a 30x20 mask
+    mask = pygame.mask.Mask((30, 20))
+    mask.draw(pygame.mask.Mask((10, 20), fill=True), (10, 0))
+    return DistanceField.from_mask(mask)
+
+
+def test_jump_flood_matches_brute_force():
+    rng = np.random.default_rng(0)
+    seeds = rng.random((23, 37)) < 0.02
+    rows, cols = np.nonzero(seeds)
+    grid_rows, grid_cols = np.indices(seeds.shape)
+    brute = np.sqrt(
+        (grid_rows[..., None] - rows) ** 2 + (grid_cols[..., None] - cols) ** 2
+    ).min(axis=-1)
+    assert np.allclose(jump_flood(seeds), brute, atol=1e-4)
+
+
+def test_sign(field):
+    distances = field.sample(np.array([(2, 5), (12, 5), (25, 5)]))
+    assert distances[0] == pytest.approx(7.5)
+    assert distances[1] < 0
+    assert distances[2] == pytest.approx(5.5)
+
+
+def test_normal_points_away_from_wall(field):
+    assert field.normal(5, 10) == pytest.approx((-1, 0))
+    assert field.normal(25, 10) == pytest.approx((1, 0))
+
+
+def test_contact(field):
+    assert field.contact(np.array([(2.0, 5.0), (25.0, 5.0)])) is None
+    normal, depth = field.contact(np.array([(2.0, 5.0), (10.0, 5.0)]))
+    assert normal == pytest.approx((-1, 0))
+    assert depth == pytest.approx(0.5)
+
+
+def test_sweep_catches_fast_motion(field):
+    start, end = np.array([(2.0, 5.0)]), np.array([(28.0, 5.0)])
+    assert field.contact(end) is None
+    fraction, normal, depth = field.sweep(start, end, 4)
+    assert 8 / 26 < fraction < 14 / 26
+    assert normal == pytest.approx((-1, 0))
+    assert depth > 0
+
+
+def test_sweep_without_contact(field):
+    assert field.sweep(np.array([(2.0, 5.0)]), np.array([(8.0, 5.0)]), 4) is None
@@ -0,0 +1,28 @@
+import pygame
+import pytest
+
+from src.utils.masks import MaskRegistry
+
+
+@pytest.fixture
+def registry():
+    return MaskRegistry()
+
+
+def test_get_reuses_mask(registry):
+    surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+    assert registry.get(surface) is registry.get(surface)
+
+
+def test_get_separates_surfaces(registry):
+    first = pygame.Surface((10, 10), pygame.SRCALPHA)
+    second = pygame.Surface((20, 20), pygame.SRCALPHA)
+    assert registry.get(first) is not registry.get(second)
+    assert registry.get(second).get_size() == (20, 20)
+
+
+def test_clear(registry):
+    surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+    mask = registry.get(surface)
+    registry.clear()
+    assert registry.get(surface) is not mask
@@ -0,0 +1,42 @@
+import pygame
+import pytest
+
+from src.utils.rotation import RotationCache
+
+
+@pytest.fixture
+def image():
+    surface = pygame.Surface((20, 40), pygame.SRCALPHA)
+    surface.fill((255, 0, 0, 255))
+    return surface
+
+
+def test_quantize():
+    assert RotationCache.quantize(0.4) == 0
+    assert RotationCache.quantize(359.6) == 0
+    assert RotationCache.quantize(-90) == 270
+
+
+def test_get_matches_transform(image):
+    sprite = RotationCache(image).get(90)
+    assert sprite.image.get_size() == (40, 20)
+    assert sprite.offset == (-10, 10)
+    assert sprite.mask.count() == 40 * 20
+
+
+def test_lru_evicts_oldest(image):
+    cache = RotationCache(image, RotationCache.LRU, max_size=2)
+    first = cache.get(0)
+    cache.get(10)
+    cache.get(20)
+    assert cache.get(0) is not first
+
+
+def test_prebaked_renders_all_angles(image):
+    cache = RotationCache(image, RotationCache.PREBAKED)
+    assert cache.get(45) is cache.get(405)
+
+
+def test_unknown_mode(image):
+    with pytest.raises(ValueError):
+        RotationCache(image, "bogus")
@@ -0,0 +1,35 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from src.utils.spatial_grid import SpatialGrid, overlap
+
+
+def test_pairs_match_all_pairs():
+    rng = random.Random(0)
+    boxes = []
+    for _ in range(60):
+        left, top = rng.randrange(300), rng.randrange(300)
+        boxes.append(
+            (left, top, left + rng.randrange(1, 40), top + rng.randrange(1, 40))
+        )
+    expected = [
+        (first, second)
+        for first, second in combinations(range(len(boxes)), 2)
+        if overlap(boxes[first], boxes[second])
+    ]
+    assert SpatialGrid(40).pairs(boxes) == expected
+
+
+def test_touching_edges_do_not_overlap():
+    assert SpatialGrid(10).pairs([(0, 0, 10, 10), (10, 0, 20, 10)]) == []
+
+
+def test_negative_coordinates():
+    assert SpatialGrid(10).pairs([(-15, -15, -5, -5), (-8, -8, 2, 2)]) == [(0, 1)]
+
+
+def test_cell_size_must_be_positive():
+    with pytest.raises(ValueError):
+        SpatialGrid(0)
@@ -0,0 +1,12 @@
+import pytest
+
+from src.utils.sweep import sweep_fractions
+
+
+def test_slow_motion_is_sampled_at_its_end():
+    assert sweep_fractions(3, 4).tolist() == [1]
+    assert sweep_fractions(0, 4).tolist() == [1]
+
+
+def test_fast_motion_is_sub_stepped():
+    assert sweep_fractions(10, 4).tolist() == pytest.approx([1 / 3, 2 / 3, 1])